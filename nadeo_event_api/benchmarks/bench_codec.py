@@ -0,0 +1,113 @@
+"""
+Compares the installed JSON codecs on the payloads the package handles most:
+the create payload of a 64 player, multi-round event and a 1000 entry leaderboard.
+
+Usage (from nadeo_event_api/): python benchmarks/bench_codec.py [--number N]
+"""
+import argparse
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.append(str(os.path.join(Path(__file__).resolve().parent.parent, "src")))
+
+from nadeo_event_api.api.codec import available_codecs, get_codec
+from nadeo_event_api.api.structure.enums import ScriptType
+from nadeo_event_api.api.structure.event import Event
+from nadeo_event_api.api.structure.maps import Map
+from nadeo_event_api.api.structure.round.match import Match
+from nadeo_event_api.api.structure.round.match_spot import (
+    MatchParticipantMatchSpot,
+    SeedMatchSpot,
+)
+from nadeo_event_api.api.structure.round.round import Round, RoundConfig
+from nadeo_event_api.objects.inbound.leaderboard import Leaderboard
+
+
+def event_payload(players: int = 64, match_size: int = 4) -> dict:
+    """
+    Create payload of a knockout where each match sends its top half to the next round.
+    """
+    start = datetime(2024, 1, 1, 20)
+    rounds = []
+    matches = [
+        Match(
+            spots=[
+                SeedMatchSpot(seed + 1)
+                for seed in range(i, players, players // match_size)
+            ]
+        )
+        for i in range(players // match_size)
+    ]
+    while True:
+        rounds.append(
+            Round(
+                name=f"round_{len(rounds) + 1}",
+                start_date=start + timedelta(minutes=30 * len(rounds)),
+                end_date=start + timedelta(minutes=30 * len(rounds) + 25),
+                matches=matches,
+                config=RoundConfig(
+                    map_pool=[Map(f"map_uid_{i}") for i in range(5)],
+                    script=ScriptType.CUP,
+                    max_players=match_size,
+                ),
+            )
+        )
+        if len(matches) == 1:
+            break
+        advancing = [
+            MatchParticipantMatchSpot(len(rounds) - 1, match, rank)
+            for match in range(len(matches))
+            for rank in range(1, match_size // 2 + 1)
+        ]
+        matches = [
+            Match(spots=advancing[i : i + match_size])
+            for i in range(0, len(advancing), match_size)
+        ]
+    return Event(name="bench", club_id=1, rounds=rounds)._as_jsonable_dict()
+
+
+def leaderboard_body(entries: int = 1000) -> bytes:
+    return get_codec("json").dumps(
+        [
+            {
+                "participant": f"00000000-0000-0000-0000-{i:012d}",
+                "rank": i + 1,
+                "score": 10 * (entries - i),
+                "zone": "World",
+            }
+            for i in range(entries)
+        ]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    event = event_payload()
+    leaderboard = leaderboard_body()
+    print(
+        f"event payload: {len(get_codec('json').dumps(event))} bytes, "
+        f"leaderboard body: {len(leaderboard)} bytes, {args.number} iterations"
+    )
+
+    for name in available_codecs():
+        codec = get_codec(name)
+        encode = timeit.timeit(lambda: codec.dumps(event), number=args.number)
+        decode = timeit.timeit(lambda: codec.loads(leaderboard), number=args.number)
+        model = timeit.timeit(
+            lambda: Leaderboard.from_list(codec.loads(leaderboard)), number=args.number
+        )
+        print(
+            f"{name:>8}: encode event {encode / args.number * 1e6:8.1f} us, "
+            f"decode leaderboard {decode / args.number * 1e6:8.1f} us, "
+            f"decode + build Leaderboard {model / args.number * 1e6:8.1f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
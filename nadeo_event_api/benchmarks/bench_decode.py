@@ -0,0 +1,90 @@
+"""
+Times decoding the inbound models the package reads most: a round, a match and the
+results of a 1000 player match.
+
+Usage (from nadeo_event_api/): python benchmarks/bench_decode.py [--number N]
+"""
+import argparse
+import os
+from pathlib import Path
+import sys
+import timeit
+
+sys.path.append(str(os.path.join(Path(__file__).resolve().parent.parent, "src")))
+
+from nadeo_event_api.objects.inbound.match import Match
+from nadeo_event_api.objects.inbound.match_results import MatchResults
+from nadeo_event_api.objects.inbound.round import Round
+
+ROUND = {
+    "id": 53031,
+    "position": 0,
+    "name": "Better Match",
+    "startDate": 1725506356,
+    "endDate": 1725509956,
+    "lockDate": None,
+    "status": "HAS_MATCHES",
+    "isLocked": False,
+    "autoNeedsMatches": True,
+    "matchScoreDirection": "DESC",
+    "leaderboardComputeType": "BRACKET",
+    "teamLeaderboardComputeType": "TEAM_SCORE",
+    "deletedOn": None,
+    "nbMatches": 1,
+    "qualifierChallengeId": None,
+    "trainingChallengeId": None,
+}
+
+MATCH = {
+    "id": 97677,
+    "name": "BetterMMTest - Better Match - 1",
+    "clubMatchLiveId": "LID-MTCH-bs5s12wftrrdqjp",
+    "position": 0,
+    "isCompleted": False,
+    "tags": [],
+    "deletedOn": None,
+}
+
+
+def match_results(players: int = 1000) -> dict:
+    return {
+        "matchLiveId": "LID-MTCH-bs5s12wftrrdqjp",
+        "roundPosition": 0,
+        "results": [
+            {
+                "participant": f"account_{i}",
+                "rank": i + 1,
+                "score": players - i,
+                "zone": "World",
+                "team": None,
+            }
+            for i in range(players)
+        ],
+        "scoreUnit": "point",
+        "teams": [],
+    }
+
+
+def best(function, number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=20)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    results = match_results()
+    print(
+        f"MatchResults.from_dict (1000 rows): {best(lambda: MatchResults.from_dict(results), args.number) * 1e3:6.2f} ms"
+    )
+    print(
+        f"Match.from_dict:                    {best(lambda: Match.from_dict(MATCH), args.number * 100) * 1e6:6.2f} us"
+    )
+    print(
+        f"Round.from_dict:                    {best(lambda: Round.from_dict(ROUND), args.number * 100) * 1e6:6.2f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compares serializing an event for the first time, which builds every dict as before
+memoization, with serializing it again unchanged, which should reuse them, and after
+changing a single spot.
+
+Usage (from nadeo_event_api/): python benchmarks/bench_memoized.py [--number N]
+"""
+import argparse
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import sys
+import time
+
+sys.path.append(str(os.path.join(Path(__file__).resolve().parent.parent, "src")))
+
+from nadeo_event_api.api.structure.enums import ScriptType
+from nadeo_event_api.api.structure.event import Event
+from nadeo_event_api.api.structure.maps import Map
+from nadeo_event_api.api.structure.round.match import Match
+from nadeo_event_api.api.structure.round.match_spot import SeedMatchSpot
+from nadeo_event_api.api.structure.round.round import Round, RoundConfig
+
+
+def make_event(rounds: int = 8, matches: int = 60, spots: int = 64) -> Event:
+    start = datetime(2024, 1, 1, 20)
+    return Event(
+        name="bench",
+        club_id=1,
+        rounds=[
+            Round(
+                name=f"round_{r}",
+                start_date=start + timedelta(hours=r),
+                end_date=start + timedelta(hours=r, minutes=50),
+                matches=[
+                    Match(spots=[SeedMatchSpot(seed + 1) for seed in range(spots)])
+                    for _ in range(matches)
+                ],
+                config=RoundConfig(
+                    map_pool=[Map(f"map_uid_{i}") for i in range(5)],
+                    script=ScriptType.CUP,
+                    max_players=spots,
+                ),
+            )
+            for r in range(rounds)
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10)
+    args = parser.parse_args()
+
+    events = [make_event() for _ in range(args.number)]
+    start = time.perf_counter()
+    for event in events:
+        event._as_jsonable_dict()
+    cold = (time.perf_counter() - start) / args.number
+
+    event = events[0]
+    start = time.perf_counter()
+    for _ in range(args.number):
+        event._as_jsonable_dict()
+    warm = (time.perf_counter() - start) / args.number
+
+    spot = event._rounds[0]._matches[0]._spots[0]
+    start = time.perf_counter()
+    for i in range(args.number):
+        spot._seed = i + 1
+        event._as_jsonable_dict()
+    one_change = (time.perf_counter() - start) / args.number
+
+    print("8 rounds x 60 matches x 64 spots")
+    print(f"  first serialization (no cache): {cold * 1e3:8.2f} ms")
+    print(f"  unchanged:                      {warm * 1e3:8.2f} ms")
+    print(f"  one spot changed:               {one_change * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
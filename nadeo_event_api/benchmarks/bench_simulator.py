@@ -0,0 +1,55 @@
+"""
+Measures the throughput of the bracket simulator on generated brackets: a 64 player
+knockout of 4 player matches and a 256 player double elimination.
+
+Usage (from nadeo_event_api/): python benchmarks/bench_simulator.py [--simulations N]
+"""
+import argparse
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import sys
+import time
+
+sys.path.append(str(os.path.join(Path(__file__).resolve().parent.parent, "src")))
+
+from nadeo_event_api.api.structure.enums import ScriptType
+from nadeo_event_api.api.structure.maps import Map
+from nadeo_event_api.api.structure.round.generators import (
+    double_elimination,
+    rounds_from_matches,
+    single_elimination,
+)
+from nadeo_event_api.api.structure.round.round import RoundConfig
+from nadeo_event_api.api.structure.round import simulator
+from nadeo_event_api.api.structure.round.simulator import BracketSimulator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--simulations", type=int, default=5000)
+    args = parser.parse_args()
+
+    config = RoundConfig(
+        map_pool=[Map("map_uid")], script=ScriptType.CUP, max_players=4
+    )
+    brackets = {
+        "64 players, 4 per match": single_elimination(64, match_size=4),
+        "256 players, double elimination": double_elimination(256),
+    }
+    print(
+        f"NumPy: {'yes' if simulator.np is not None else 'no'}, {args.simulations} simulations"
+    )
+    for name, matches in brackets.items():
+        rounds = rounds_from_matches(
+            matches, datetime(2024, 1, 1), timedelta(hours=1), config
+        )
+        bracket = BracketSimulator(rounds)
+        start = time.perf_counter()
+        bracket.run(args.simulations, seed=1)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>32}: {args.simulations / elapsed:10.0f} simulations/s")
+
+
+if __name__ == "__main__":
+    main()
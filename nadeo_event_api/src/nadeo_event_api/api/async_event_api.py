@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, TypeVar
+
+from ..objects.inbound.event_players import Participant, Team
+from ..objects.inbound.match import Match
+from ..objects.inbound.match_info import MatchInfo
+from ..objects.inbound.match_results import MatchResults
+from ..objects.inbound.round import Round
+from . import event_api
+from .structure.event import Event
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 16
+""" Default number of requests an AsyncEventApi keeps in flight at once. """
+
+
+class AsyncEventApi:
+    """
+    Asyncio counterpart of event_api. Every call is dispatched to a dedicated worker pool
+    that sends requests through the shared NadeoHttpClient, and a semaphore bounds how many
+    requests are in flight at once. This lets callers fan out e.g. per-match results fetches
+    with asyncio.gather instead of walking rounds -> matches -> results serially.
+
+    NOTE: The pooled HTTP client should keep at least max_concurrency connections per host
+    (see NadeoHttpClient.configure(pool_maxsize=...)), otherwise extra connections are
+    opened and discarded.
+
+    Usage:
+        async with AsyncEventApi(max_concurrency=16) as api:
+            matches = await api.get_matches_for_round(round_id, 100, 0)
+            results = await api.get_results_for_matches([m.id for m in matches], 100, 0)
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="nadeo-async"
+        )
+
+    async def __aenter__(self) -> AsyncEventApi:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shuts down the worker pool. Pending calls are allowed to finish.
+        """
+        self._executor.shutdown(wait=False)
+
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    async def post_event(self, event: Event) -> int | None:
+        """
+        Posts an event and returns the ID.
+        """
+        return await self._call(event_api.post_event, event)
+
+    async def get_rounds_for_event(self, event_id: int) -> List[Round]:
+        """
+        Gets the rounds for an given event by ID.
+        """
+        return await self._call(event_api.get_rounds_for_event, event_id)
+
+    async def get_matches_for_round(
+        self, round_id: int, length: int, offset: int
+    ) -> List[Match]:
+        """
+        Gets the matches for a given round by ID.
+        """
+        return await self._call(
+            event_api.get_matches_for_round, round_id, length, offset
+        )
+
+    async def get_match_results(
+        self, match_id: int, length: int, offset: int
+    ) -> MatchResults:
+        """
+        Gets the match results for a given match by ID.
+        """
+        return await self._call(event_api.get_match_results, match_id, length, offset)
+
+    async def get_match_info(self, match_live_id: str) -> MatchInfo:
+        """
+        Gets the match info for a given match by LiveID.
+        """
+        return await self._call(event_api.get_match_info, match_live_id)
+
+    async def get_event_participants(
+        self, event_id: int, length: int, offset: int
+    ) -> List[Participant]:
+        """
+        Gets the individual participants of an event.
+        """
+        return await self._call(
+            event_api.get_event_participants, event_id, length, offset
+        )
+
+    async def get_event_teams(self, event_id: int) -> List[Team]:
+        """
+        Gets the teams of an event.
+        """
+        return await self._call(event_api.get_event_teams, event_id)
+
+    async def get_results_for_matches(
+        self, match_ids: Iterable[int], length: int, offset: int
+    ) -> List[MatchResults]:
+        """
+        Concurrently gets the results of several matches, bounded by max_concurrency.
+
+        :returns: The results in the same order as match_ids.
+        """
+        return list(
+            await asyncio.gather(
+                *[
+                    self.get_match_results(match_id, length, offset)
+                    for match_id in match_ids
+                ]
+            )
+        )
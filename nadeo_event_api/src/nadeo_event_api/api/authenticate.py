@@ -1,22 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+from dataclasses import dataclass
+import json
 import os
-import requests
-from ..environment import UBI_AUTH
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from ..environment import NADEO_TOKEN_CACHE, UBI_AUTH
 from .enums import NadeoService
+from .http_client import NadeoHttpClient
+
+from ..constants import (
+    NADEO_AUTH_URL,
+    NADEO_REFRESH_URL,
+    TOKEN_REFRESH_MARGIN_SECONDS,
+    UBI_SESSION_URL,
+)
+
+if TYPE_CHECKING:
+    from .token_store import TokenStore
+
+
+def _jwt_expiry(token: str) -> Optional[float]:
+    """
+    Reads the `exp` claim (epoch seconds) of a JWT without verifying it.
+
+    :param token: The JWT.
+    :returns: The expiry, or None if the token isn't a JWT with an `exp` claim.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return float(exp) if exp is not None else None
+
+
+@dataclass
+class NadeoToken:
+    access_token: str
+    refresh_token: Optional[str] = None
+    expires_at: Optional[float] = None
+    """ Epoch seconds at which the access token expires, None if unknown. """
 
-from ..constants import NADEO_AUTH_URL, UBI_SESSION_URL
+    @classmethod
+    def from_access_token(cls, access_token: str) -> NadeoToken:
+        return cls(access_token, None, _jwt_expiry(access_token))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> NadeoToken:
+        access_token = data["accessToken"]
+        return cls(access_token, data.get("refreshToken"), _jwt_expiry(access_token))
+
+    def expires_within(self, seconds: float) -> bool:
+        """
+        Whether the access token expires within the given number of seconds.
+        Tokens with an unknown expiry never expire.
+        """
+        return self.expires_at is not None and self.expires_at - time.time() <= seconds
 
 
 class UbiTokenManager:
     _instance = None
-    _nadeo_live_token = None
-    _nadeo_club_token = None
+    _instance_lock = threading.Lock()
+    _tokens: Dict[NadeoService, NadeoToken] = {}
+    _locks: Dict[NadeoService, threading.Lock] = {
+        service: threading.Lock() for service in NadeoService
+    }
+    _token_store: Optional[TokenStore] = None
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(UbiTokenManager, cls).__new__(cls)
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(UbiTokenManager, cls).__new__(cls)
+                    token_cache = os.getenv(NADEO_TOKEN_CACHE)
+                    if token_cache:
+                        from .token_store import FileTokenStore
+
+                        instance._token_store = FileTokenStore(token_cache)
+                    cls._instance = instance
         return cls._instance
 
-    def authenticate(self, service: NadeoService, authorization: str = None) -> str: # type: ignore
+    @property
+    def token_store(self) -> Optional[TokenStore]:
+        """
+        Where tokens are persisted across processes, None to keep them in memory only.
+        Defaults to a FileTokenStore at $NADEO_TOKEN_CACHE if that variable is set.
+        """
+        return self._token_store
+
+    @token_store.setter
+    def token_store(self, value: Optional[TokenStore]):
+        self._token_store = value
+
+    def _store_token(self, service: NadeoService, token: NadeoToken) -> None:
+        self._tokens[service] = token
+        if self._token_store is not None:
+            self._token_store.save(service, token)
+
+    def authenticate(self, service: NadeoService, authorization: str = None) -> str:  # type: ignore
         """
         Authenticates with the provided Nadeo service given authorization
         and returns an access token.
@@ -24,6 +111,7 @@ class UbiTokenManager:
         :param service: Audience (e.g. "NadeoClubServices", "NadeoLiveServices")
         :param authorization: Override authorization (Basic <user:pass> base 64) if not defined in environment.
         :return: Access token
+        :raises NadeoApiError: If logging in failed.
         """
         auth = os.getenv(UBI_AUTH) if not authorization else authorization
         headers = {
@@ -32,7 +120,7 @@ class UbiTokenManager:
             "Authorization": auth,
             "User-Agent": "https://github.com/Nixotica/NadeoEventAPIWrapper",
         }
-        result = requests.post(UBI_SESSION_URL, headers=headers).json()
+        result = NadeoHttpClient().post_json(UBI_SESSION_URL, headers=headers)
 
         ticket = result["ticket"]
         headers = {
@@ -40,31 +128,103 @@ class UbiTokenManager:
             "Authorization": f"ubi_v1 t={ticket}",
         }
         body = {"audience": service.value}
-        auth = requests.post(NADEO_AUTH_URL, headers=headers, json=body).json()[
-            "accessToken"
-        ]
-        if service == NadeoService.LIVE:
-            self._nadeo_live_token = auth
-        elif service == NadeoService.CLUB:
-            self._nadeo_club_token = auth
-        return auth
+        token = NadeoToken.from_dict(
+            NadeoHttpClient().post_json(NADEO_AUTH_URL, headers=headers, json=body)
+        )
+        self._store_token(service, token)
+        return token.access_token
+
+    def refresh(self, service: NadeoService) -> Optional[str]:
+        """
+        Exchanges the stored refresh token of a service for a new access token.
+
+        :param service: Audience to refresh the token of.
+        :returns: The new access token, or None if there is no refresh token or refreshing failed.
+        """
+        token = self._tokens.get(service)
+        if token is None or token.refresh_token is None:
+            return None
+        response = NadeoHttpClient().post(
+            NADEO_REFRESH_URL,
+            headers={"Authorization": "nadeo_v1 t=" + token.refresh_token},
+        )
+        if response.status_code != 200:
+            return None
+        try:
+            refreshed = NadeoToken.from_dict(response.json())
+        except (ValueError, KeyError):
+            return None
+        self._store_token(service, refreshed)
+        return refreshed.access_token
+
+    def get_token(self, service: NadeoService) -> str:
+        """
+        Returns a valid access token for the service. Tokens about to expire are refreshed
+        proactively, falling back to a full login if refreshing fails. Concurrent callers
+        wait on a single refresh/login instead of each issuing their own. If a token store
+        is set, a token persisted by another process is used before refreshing.
+
+        :param service: Audience to get the token of.
+        :returns: Access token
+        """
+        token = self._tokens.get(service)
+        if token is not None and not token.expires_within(TOKEN_REFRESH_MARGIN_SECONDS):
+            return token.access_token
+
+        with self._locks[service]:
+            # Another caller may have refreshed the token while we waited for the lock.
+            token = self._tokens.get(service)
+            if token is not None and not token.expires_within(
+                TOKEN_REFRESH_MARGIN_SECONDS
+            ):
+                return token.access_token
+            if self._token_store is not None:
+                stored = self._token_store.load(service)
+                if stored is not None:
+                    self._tokens[service] = stored
+                    if not stored.expires_within(TOKEN_REFRESH_MARGIN_SECONDS):
+                        return stored.access_token
+            access_token = self.refresh(service)
+            if access_token is None:
+                access_token = self.authenticate(service)
+            return access_token
+
+    async def get_token_async(self, service: NadeoService) -> str:
+        """
+        Async variant of get_token. A valid cached token is returned immediately, otherwise
+        the refresh/login runs in a worker thread so the event loop isn't blocked. Tasks and
+        threads share the same per-audience lock, so N concurrent first callers still produce
+        a single login.
+
+        :param service: Audience to get the token of.
+        :returns: Access token
+        """
+        token = self._tokens.get(service)
+        if token is not None and not token.expires_within(TOKEN_REFRESH_MARGIN_SECONDS):
+            return token.access_token
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.get_token, service
+        )
+
+    def _set_token(self, service: NadeoService, value: Optional[str]) -> None:
+        with self._locks[service]:
+            if value is None:
+                self._tokens.pop(service, None)
+            else:
+                self._tokens[service] = NadeoToken.from_access_token(value)
 
     @property
     def nadeo_live_token(self) -> str:
-        if self._nadeo_live_token is None:
-            self._nadeo_live_token = self.authenticate(NadeoService.LIVE)
-        return self._nadeo_live_token
+        return self.get_token(NadeoService.LIVE)
 
     @property
     def nadeo_club_token(self) -> str:
-        if self._nadeo_club_token is None:
-            self._nadeo_club_token = self.authenticate(NadeoService.CLUB)
-        return self._nadeo_club_token
+        return self.get_token(NadeoService.CLUB)
 
     @nadeo_live_token.setter
     def nadeo_live_token(self, value):
-        self._nadeo_live_token = value
+        self._set_token(NadeoService.LIVE, value)
 
     @nadeo_club_token.setter
     def nadeo_club_token(self, value):
-        self._nadeo_club_token = value
+        self._set_token(NadeoService.CLUB, value)
@@ -1,9 +1,13 @@
 from __future__ import annotations
+import os
+from typing import List, Optional
 from ..authenticate import UbiTokenManager
-import requests
+from ..http_client import NadeoApiError, NadeoHttpClient
 from ...constants import CLUB_CAMPAIGN_URL_FMT
+from ...environment import NADEO_CAMPAIGN_CATALOG
 
 from ..structure.maps import PlaylistMap
+from .campaign_catalog import CampaignCatalog
 
 
 class Campaign:
@@ -11,21 +15,60 @@ class Campaign:
         self,
         club_id: int,
         campaign_id: int,
+        catalog: Optional[CampaignCatalog] = None,
     ):
+        """
+        A club campaign. Its playlist is only loaded on first access, from the catalog if
+        it's there, otherwise from the Live API (and then added to the catalog).
+
+        :param club_id: The ID of the club owning the campaign.
+        :param campaign_id: The ID of the campaign.
+        :param catalog: Catalog of known playlists. Defaults to the one at $NADEO_CAMPAIGN_CATALOG if that variable is set.
+        """
         self._club_id = club_id
         self._campaign_id = campaign_id
-        self._playlist = None
+        if catalog is None and os.getenv(NADEO_CAMPAIGN_CATALOG):
+            catalog = CampaignCatalog(os.getenv(NADEO_CAMPAIGN_CATALOG))  # type: ignore
+        self._catalog = catalog
+        self._loaded_playlist: Optional[List[PlaylistMap]] = None
+        self._playlist_error: Optional[NadeoApiError] = None
+
+    @property
+    def playlist(self) -> List[PlaylistMap]:
+        """
+        The maps of the campaign.
+
+        :raises NadeoApiError: If the campaign couldn't be fetched. The failure is kept, so
+            later accesses raise it again without sending another request.
+        """
+        if self._loaded_playlist is None:
+            if self._playlist_error is not None:
+                raise self._playlist_error
+            try:
+                self._loaded_playlist = self._load_playlist()
+            except NadeoApiError as e:
+                self._playlist_error = e
+                raise
+        return self._loaded_playlist
+
+    @property
+    def _playlist(self) -> List[PlaylistMap]:
+        return self.playlist
+
+    def _load_playlist(self) -> List[PlaylistMap]:
+        if self._catalog is not None:
+            playlist = self._catalog.get(self._club_id, self._campaign_id)
+            if playlist is not None:
+                return playlist
 
         token = UbiTokenManager().nadeo_live_token
-        response = requests.get(
-            url=CLUB_CAMPAIGN_URL_FMT.format(club_id, campaign_id),
+        response = NadeoHttpClient().get_json(
+            url=CLUB_CAMPAIGN_URL_FMT.format(self._club_id, self._campaign_id),
             headers={"Authorization": "nadeo_v1 t=" + token},
-        ).json()
-        if isinstance(response, list):
-            print("Failed to get campaign: ", response)
-            return
+        )
         campaign_info = response["campaign"]
 
-        self._playlist = PlaylistMap._list_from_campaign_response(
-            campaign_info["playlist"]
-        )
+        playlist = PlaylistMap._list_from_campaign_response(campaign_info["playlist"])
+        if self._catalog is not None:
+            self._catalog.put(self._club_id, self._campaign_id, playlist)
+        return playlist
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from ..structure.maps import PlaylistMap
+
+
+class CampaignCatalog:
+    def __init__(self, path: str):
+        """
+        Persistent catalog of club campaign playlists, (club_id, campaign_id) -> maps,
+        stored as JSON so repeated runs don't download the same playlist again. Writes
+        re-read the file under an advisory lock on a sidecar ".lock" file (POSIX only) and
+        replace it atomically, so concurrent processes don't drop each other's entries.
+
+        :param path: The path of the catalog file. It's created on the first write.
+        """
+        self._path = path
+        self._lock_path = path + ".lock"
+        self._lock = threading.Lock()
+        self._playlists: Dict[str, List[dict]] = self._read()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self._lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, List[dict]]:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _key(club_id: int, campaign_id: int) -> str:
+        return f"{club_id}:{campaign_id}"
+
+    def get(self, club_id: int, campaign_id: int) -> Optional[List[PlaylistMap]]:
+        """
+        Returns the playlist of a campaign, None if it isn't in the catalog.
+        """
+        with self._lock:
+            playlist = self._playlists.get(self._key(club_id, campaign_id))
+        if playlist is None:
+            return None
+        return PlaylistMap._list_from_campaign_response(playlist)
+
+    def put(self, club_id: int, campaign_id: int, playlist: List[PlaylistMap]) -> None:
+        """
+        Adds (or replaces) the playlist of a campaign and writes the catalog to disk,
+        keeping the entries other processes wrote since this catalog was loaded.
+        """
+        entry = [
+            {"mapUid": playlist_map._uuid, "position": playlist_map._position}
+            for playlist_map in playlist
+        ]
+        with self._lock, self._locked():
+            playlists = self._read()
+            playlists[self._key(club_id, campaign_id)] = entry
+            directory = os.path.dirname(os.path.abspath(self._path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(playlists, f)
+                os.replace(tmp_path, self._path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._playlists = playlists
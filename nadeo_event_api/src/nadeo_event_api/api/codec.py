@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import functools
+import json
+import os
+from typing import Any, Callable, List, Optional, Union
+
+from ..environment import NADEO_JSON_CODEC
+
+PREFERRED_CODECS = ("orjson", "msgspec", "json")
+""" Codec names, fastest first. The first one installed is used by default. """
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    name: str
+    dumps: Callable[[Any], bytes]
+    """ Encodes a JSON-able object to UTF-8 bytes. """
+    loads: Callable[[Union[bytes, str]], Any]
+    """ Decodes a JSON document, given as bytes or str. """
+
+
+def _json_codec() -> JsonCodec:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    return JsonCodec(
+        name="json",
+        dumps=lambda obj: encoder.encode(obj).encode("utf-8"),
+        loads=json.loads,
+    )
+
+
+def _orjson_codec() -> Optional[JsonCodec]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return JsonCodec(name="orjson", dumps=orjson.dumps, loads=orjson.loads)
+
+
+def _msgspec_codec() -> Optional[JsonCodec]:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        # Raise ValueError like the other codecs.
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return JsonCodec(name="msgspec", dumps=encoder.encode, loads=loads)
+
+
+_FACTORIES = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _json_codec,
+}
+
+
+def available_codecs() -> List[str]:
+    """
+    Returns the names of the installed codecs, fastest first.
+    """
+    return [name for name in PREFERRED_CODECS if _load(name) is not None]
+
+
+@functools.lru_cache(maxsize=None)
+def _load(name: str) -> Optional[JsonCodec]:
+    return _FACTORIES[name]()
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """
+    Returns a JSON codec.
+
+    :param name: One of PREFERRED_CODECS. Defaults to $NADEO_JSON_CODEC if set, otherwise the fastest installed codec.
+    :raises ValueError: If the codec is unknown or its package isn't installed.
+    """
+    name = name or os.getenv(NADEO_JSON_CODEC)
+    if not name:
+        return next(
+            codec for codec in map(_load, PREFERRED_CODECS) if codec is not None
+        )
+    if name not in _FACTORIES:
+        raise ValueError(
+            f"Unknown JSON codec {name}, expected one of {PREFERRED_CODECS}."
+        )
+    codec = _load(name)
+    if codec is None:
+        raise ValueError(f"JSON codec {name} is not installed.")
+    return codec
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import requests
+
+
+@dataclass
+class _Validators:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: bytes
+    decode: Callable[[Any], Any]
+    model: Any
+
+
+def body_digest(content: bytes) -> bytes:
+    """
+    Returns a short digest of a response body, used to detect unchanged payloads.
+    """
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+class ConditionalStore:
+    def __init__(self, max_entries: int = 1024):
+        """
+        Remembers, per URL, the validators (ETag/Last-Modified) and body digest of the last
+        response along with the model decoded from it. Polling an unchanged resource then
+        costs a 304 (or a hash of the body when the server sends no validators) instead of
+        decoding the JSON and building the models again.
+
+        NOTE: The same model instance is returned while the resource is unchanged, so
+        callers must not mutate it.
+
+        :param max_entries: Maximum number of URLs remembered, least recently used are dropped first.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _Validators] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def request_headers(self, url: str, decode: Callable[[Any], Any]) -> Dict[str, str]:
+        """
+        Returns the conditional headers to send with a GET to url, whose model is built by decode.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        headers = {}
+        if entry is not None and entry.decode == decode:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def decode(
+        self,
+        url: str,
+        response: requests.Response,
+        decode: Callable[[Any], Any],
+        loads: Callable[[bytes], Any] = json.loads,
+    ) -> Any:
+        """
+        Returns the model of a successful (or 304) response to a GET of url, reusing the
+        previous model when the resource hasn't changed.
+
+        :param url: The URL that was requested.
+        :param response: The response, either 2xx or 304.
+        :param decode: Builds the model from the decoded JSON body.
+        :param loads: Decodes the JSON body.
+        :raises LookupError: If the response is a 304 but the previous model isn't stored
+            anymore (e.g. evicted or cleared since the request was sent).
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+        if entry is not None and entry.decode == decode:
+            if response.status_code == 304:
+                return entry.model
+            digest = body_digest(response.content)
+            if digest == entry.digest:
+                return entry.model
+        elif response.status_code == 304:
+            raise LookupError(
+                f"No stored response for {url} to reuse on 304 Not Modified"
+            )
+        else:
+            digest = body_digest(response.content)
+
+        model = decode(loads(response.content))
+        with self._lock:
+            self._entries[url] = _Validators(
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                digest=digest,
+                decode=decode,
+                model=model,
+            )
+            self._entries.move_to_end(url)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return model
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -22,9 +22,7 @@ GET_ROUNDS_FOR_EVENT_URL_FMT = (
 )
 
 # https://webservices.openplanet.dev/meet/competitions/participants
-GET_EVENT_PARTICIPANTS_URL_FMT = (
-    "https://meet.trackmania.nadeo.club/api/competitions/{0}/participants?length={1}&offset={2}"
-)
+GET_EVENT_PARTICIPANTS_URL_FMT = "https://meet.trackmania.nadeo.club/api/competitions/{0}/participants?length={1}&offset={2}"
 
 # https://webservices.openplanet.dev/meet/competitions/teams
 GET_EVENT_TEAMS_URL_FMT = (
@@ -37,4 +35,4 @@ PASTES_IO_LOGIN_URL = "http://pastesio.com/api/login"
 PASTES_IO_CREATE_URL = "http://pastesio.com/api/paste/create"
 
 PASTEFY_SKIFF_CREATE_URL = "https://pastes.skiff.dev/api/v2/paste"
-PASTEFY_SKIFF_RAW_URL_FMT = "https://pastes.skiff.dev/{0}/raw"
\ No newline at end of file
+PASTEFY_SKIFF_RAW_URL_FMT = "https://pastes.skiff.dev/{0}/raw"
@@ -1,12 +1,13 @@
-from typing import List
-import requests
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from ..objects.inbound.event_players import Participant, Team
+from ..objects.inbound.leaderboard import Leaderboard, LeaderboardEntry
 from ..objects.inbound.match_info import MatchInfo
 
 from ..objects.inbound.round import Round
 from ..objects.inbound.match import Match
-from ..objects.inbound.match_results import MatchResults
+from ..objects.inbound.match_results import MatchResults, RankedParticipant
+from ..objects.inbound.results_table import ResultsTable
 
 from .endpoints import (
     CREATE_COMP_URL,
@@ -16,9 +17,11 @@ from .endpoints import (
     GET_ROUNDS_FOR_EVENT_URL_FMT,
     GET_MATCH_INFO_URL_FMT,
     GET_EVENT_PARTICIPANTS_URL_FMT,
-    GET_EVENT_TEAMS_URL_FMT
+    GET_EVENT_TEAMS_URL_FMT,
 )
 from .authenticate import UbiTokenManager
+from .http_client import NadeoApiError, NadeoHttpClient
+from .pagination import DEFAULT_PAGE_SIZE, paginate
 from .structure.event import Event
 
 
@@ -29,17 +32,33 @@ def post_event(event: Event) -> int | None:
     if not event.valid():
         print("Event is not valid, and therefore will not post.")
         return None
+    try:
+        return _post_validated_event(event)
+    except NadeoApiError as e:
+        print("Failed to post event: ", e)
+        return None
+
+
+def _post_validated_event(event: Event) -> int:
+    """
+    Posts an event which was already validated and returns its ID.
+
+    :raises NadeoApiError: With the server's error if the event was rejected.
+    """
     token = UbiTokenManager().nadeo_club_token
-    response = requests.post(
+    client = NadeoHttpClient()
+    response = client.post(
         url=CREATE_COMP_URL,
         headers={"Authorization": "nadeo_v1 t=" + token},
         json=event._as_jsonable_dict(),
-    ).json()
-    if "exception" in response:
-        print("Failed to post event: ", response)
-        return
-    event._registered_id = response["competition"]["id"]
-    event._live_id = response["competition"]["liveId"]
+    )
+    if not response.ok:
+        raise NadeoApiError(response)
+    body = client.decode_json(response)
+    if "exception" in body:
+        raise NadeoApiError(response)
+    event._registered_id = body["competition"]["id"]
+    event._live_id = body["competition"]["liveId"]
     return event._registered_id
 
 
@@ -48,36 +67,69 @@ def get_rounds_for_event(event_id: int) -> List[Round]:
     Gets the rounds for an given event by ID.
     """
     token = UbiTokenManager().nadeo_club_token
-    response = requests.get(
+    response = NadeoHttpClient().get_json(
         url=GET_ROUNDS_FOR_EVENT_URL_FMT.format(event_id),
         headers={"Authorization": "nadeo_v1 t=" + token},
-    ).json()
-    # TODO exception handling
+    )
     return [Round.from_dict(round_info) for round_info in response]
 
 
+def _decode_matches(response: dict) -> List[Match]:
+    return [Match.from_dict(match_info) for match_info in response["matches"]]
+
+
 def get_matches_for_round(round_id: int, length: int, offset: int) -> List[Match]:
     """
-    Gets the matches for a given round by ID.
+    Gets the matches for a given round by ID. Unchanged pages aren't decoded again.
     """
     token = UbiTokenManager().nadeo_club_token
-    response = requests.get(
+    matches = NadeoHttpClient().get_decoded(
         url=GET_MATCHES_FOR_ROUND_URL_FMT.format(round_id, length, offset),
+        decode=_decode_matches,
         headers={"Authorization": "nadeo_v1 t=" + token},
-    ).json()
-    return [Match.from_dict(match_info) for match_info in response["matches"]]
+    )
+    return list(matches)
 
 
 def get_match_results(match_id: int, length: int, offset: int) -> MatchResults:
     """
     Gets the match results for a given match by ID.
     """
+    return MatchResults.from_dict(_get_match_results_response(match_id, length, offset))
+
+
+def _get_match_results_response(
+    match_id: int, length: int, offset: int
+) -> Dict[str, Any]:
     token = UbiTokenManager().nadeo_club_token
-    response = requests.get(
+    return NadeoHttpClient().get_json(
         url=GET_MATCH_RESULTS_URL_FMT.format(match_id, length, offset),
         headers={"Authorization": "nadeo_v1 t=" + token},
-    ).json()
-    return MatchResults.from_dict(response)
+    )
+
+
+def get_results_table(
+    match_ids: Iterable[int],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    table: Optional[ResultsTable] = None,
+) -> ResultsTable:
+    """
+    Fetches every page of results of the given matches into a columnar table, straight
+    from the JSON pages without building a RankedParticipant per row.
+
+    :param match_ids: IDs of the matches.
+    :param page_size: Number of results requested per page.
+    :param table: Table to append the rows to. Defaults to a new one.
+    """
+    table = table if table is not None else ResultsTable()
+    for match_id in match_ids:
+        offset = 0
+        while True:
+            page = _get_match_results_response(match_id, page_size, offset)
+            if table.extend_from_response(match_id, page) < page_size:
+                break
+            offset += page_size
+    return table
 
 
 def get_match_info(match_live_id: str) -> MatchInfo:
@@ -85,46 +137,111 @@ def get_match_info(match_live_id: str) -> MatchInfo:
     Gets the match info for a given match by LiveID.
     """
     token = UbiTokenManager().nadeo_club_token
-    response = requests.get(
+    response = NadeoHttpClient().get_json(
         url=GET_MATCH_INFO_URL_FMT.format(match_live_id),
         headers={"Authorization": "nadeo_v1 t=" + token},
-    ).json()
+    )
     return MatchInfo.from_dict(response)
 
 
-def get_event_leaderboard(event_id: int, length: int, offset: int) -> str:
+def get_event_leaderboard(event_id: int, length: int, offset: int) -> Leaderboard:
     """
-    Gets the leaderboard for a given event by ID.
+    Gets the leaderboard for a given event by ID. Unchanged pages aren't decoded again,
+    so the returned leaderboard may be shared and must not be mutated.
     """
     token = UbiTokenManager().nadeo_club_token
-    response = requests.get(
+    return NadeoHttpClient().get_decoded(
         url=GET_EVENT_LEADERBOARD_URL_FMT.format(event_id, length, offset),
+        decode=Leaderboard.from_list,
         headers={"Authorization": "nadeo_v1 t=" + token},
     )
-    # TODO - return as object
-    return response.content.decode("utf-8")
 
 
-def get_event_participants(event_id: int, length: int, offset: int) -> List[Participant]:
+def get_full_event_leaderboard(
+    event_id: int, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False
+) -> Leaderboard:
+    """
+    Gets every entry of the leaderboard for a given event by ID, indexed for lookups by
+    participant and rank.
+    """
+    return Leaderboard(list(iter_event_leaderboard(event_id, page_size, prefetch)))
+
+
+def get_event_participants(
+    event_id: int, length: int, offset: int
+) -> List[Participant]:
     """
     Gets the individual participants of an event.
     """
     token = UbiTokenManager().nadeo_club_token
-    response = requests.get(
+    response = NadeoHttpClient().get_json(
         url=GET_EVENT_PARTICIPANTS_URL_FMT.format(event_id, length, offset),
         headers={"Authorization": "nadeo_v1 t=" + token},
-    ).json()
+    )
 
     return [Participant.from_dict(p) for p in response]
 
+
 def get_event_teams(event_id: int) -> List[Team]:
     """
     Gets the teams of an event.
     """
     token = UbiTokenManager().nadeo_club_token
-    response = requests.get(
+    response = NadeoHttpClient().get_json(
         url=GET_EVENT_TEAMS_URL_FMT.format(event_id),
         headers={"Authorization": "nadeo_v1 t=" + token},
-    ).json()
+    )
+
+    return [Team.from_dict(t) for t in response]
+
+
+def iter_event_participants(
+    event_id: int, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False
+) -> Iterator[Participant]:
+    """
+    Lazily iterates over every participant of an event, fetching one page at a time.
+    """
+    return paginate(
+        lambda length, offset: get_event_participants(event_id, length, offset),
+        page_size=page_size,
+        prefetch=prefetch,
+    )
+
+
+def iter_event_leaderboard(
+    event_id: int, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False
+) -> Iterator[LeaderboardEntry]:
+    """
+    Lazily iterates over every entry of an event's leaderboard, fetching one page at a time.
+    """
+    return paginate(
+        lambda length, offset: get_event_leaderboard(event_id, length, offset).entries,
+        page_size=page_size,
+        prefetch=prefetch,
+    )
+
+
+def iter_matches_for_round(
+    round_id: int, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False
+) -> Iterator[Match]:
+    """
+    Lazily iterates over every match of a round, fetching one page at a time.
+    """
+    return paginate(
+        lambda length, offset: get_matches_for_round(round_id, length, offset),
+        page_size=page_size,
+        prefetch=prefetch,
+    )
+
 
-    return [Team.from_dict(t) for t in response]
\ No newline at end of file
+def iter_match_results(
+    match_id: int, page_size: int = DEFAULT_PAGE_SIZE, prefetch: bool = False
+) -> Iterator[RankedParticipant]:
+    """
+    Lazily iterates over every participant result of a match, fetching one page at a time.
+    """
+    return paginate(
+        lambda length, offset: get_match_results(match_id, length, offset).results,
+        page_size=page_size,
+        prefetch=prefetch,
+    )
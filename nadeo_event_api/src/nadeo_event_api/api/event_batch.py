@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from . import event_api
+from .structure.event import Event
+from .structure.registration import RegistrationReport
+
+
+@dataclass
+class ScheduledEvent:
+    event: Event
+    logo_url: Optional[str] = None
+    """ Logo added once the event is posted. """
+    participants: List[Tuple[str, int]] = field(default_factory=list)
+    """ The (account ID, seed) of each player added once the event is posted. """
+    teams: List[Tuple[str, List[str], int]] = field(default_factory=list)
+    """ The (name, member account IDs, seed) of each team added once the event is posted. """
+
+
+@dataclass
+class ManifestEntry:
+    name: str
+    registered_id: Optional[int] = None
+    live_id: Optional[str] = None
+    error: Optional[str] = None
+    """ Why the event wasn't posted, or the error raised while adding its logo, participants or teams. """
+    logo_url: Optional[str] = None
+    """ The address of the logo stored by Nadeo services, if one was added. """
+    participants: Optional[RegistrationReport[Tuple[str, int]]] = None
+    teams: Optional[RegistrationReport[Tuple[str, List[str], int]]] = None
+
+    @property
+    def posted(self) -> bool:
+        return self.registered_id is not None
+
+    def as_jsonable_dict(self) -> dict:
+        entry: Dict[str, Any] = {}
+        entry["name"] = self.name
+        entry["registeredId"] = self.registered_id
+        entry["liveId"] = self.live_id
+        entry["error"] = self.error
+        entry["logoUrl"] = self.logo_url
+        for key, report in (
+            ("failedParticipants", self.participants),
+            ("failedTeams", self.teams),
+        ):
+            entry[key] = (
+                [
+                    {"item": result.item, "error": result.error}
+                    for result in report.failed
+                ]
+                if report is not None
+                else []
+            )
+        return entry
+
+
+@dataclass
+class EventManifest:
+    entries: List[ManifestEntry] = field(default_factory=list)
+
+    @property
+    def posted(self) -> List[ManifestEntry]:
+        return [entry for entry in self.entries if entry.posted]
+
+    @property
+    def failed(self) -> List[ManifestEntry]:
+        return [entry for entry in self.entries if not entry.posted]
+
+    @property
+    def all_posted(self) -> bool:
+        return all(entry.posted for entry in self.entries)
+
+    def as_jsonable_dict(self) -> List[dict]:
+        return [entry.as_jsonable_dict() for entry in self.entries]
+
+
+def _attach(
+    scheduled: ScheduledEvent, entry: ManifestEntry, registration_workers: int
+) -> None:
+    event = scheduled.event
+    if scheduled.logo_url is not None:
+        # add_logo only prints its errors, a logo which wasn't stored is how they show.
+        event.add_logo(scheduled.logo_url)
+        entry.logo_url = event._registered_logo_url
+        if entry.logo_url is None:
+            entry.error = f"Failed to add logo from {scheduled.logo_url}."
+    if scheduled.participants:
+        entry.participants = event.add_participants(
+            scheduled.participants, max_workers=registration_workers
+        )
+    if scheduled.teams:
+        entry.teams = event.add_teams(scheduled.teams, max_workers=registration_workers)
+
+
+def post_events(
+    events: Sequence[Union[Event, ScheduledEvent]],
+    max_workers: int = 8,
+    registration_workers: int = 4,
+    post: Callable[[Event], Optional[int]] = event_api._post_validated_event,
+) -> EventManifest:
+    """
+    Posts many events at once, e.g. a season of daily events. Every event is validated
+    first, one after the other so their messages are printed in order, and nothing is
+    posted unless all of them are valid. Events are then posted concurrently, each followed
+    by its logo, participants and teams as soon as it's created.
+
+    Usage:
+        manifest = post_events([ScheduledEvent(event, logo_url=logo) for event in season])
+        for entry in manifest.failed:
+            print(entry.name, entry.error)
+
+    :param events: The events to post, with what to add to each once posted.
+    :param max_workers: Maximum number of events posted at once.
+    :param registration_workers: Maximum number of registrations in flight at once per event.
+    :param post: Posts a validated event and returns its ID. If it fails, it raises with the
+        server's error (e.g. NadeoApiError), which becomes the entry's error, or returns None.
+    :returns: A manifest with one entry per event, in the same order as events.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    scheduled = [
+        e if isinstance(e, ScheduledEvent) else ScheduledEvent(e) for e in events
+    ]
+    entries = [ManifestEntry(name=s.event._name) for s in scheduled]
+    if not scheduled:
+        return EventManifest()
+
+    def post_one(item: Tuple[ScheduledEvent, ManifestEntry]) -> None:
+        scheduled_event, entry = item
+        event = scheduled_event.event
+        try:
+            if post(event) is None:
+                entry.error = "Failed to post event."
+                return
+            entry.registered_id = event._registered_id
+            entry.live_id = event._live_id
+            _attach(scheduled_event, entry, registration_workers)
+        except Exception as e:
+            entry.error = str(e)
+
+    # Validation is CPU bound and prints its errors, threads would only interleave them.
+    valid = [s.event.valid() for s in scheduled]
+    if not all(valid):
+        for entry, is_valid in zip(entries, valid):
+            entry.error = (
+                "Event is not valid."
+                if not is_valid
+                else "Not posted, another event is not valid."
+            )
+        return EventManifest(entries)
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(scheduled)), thread_name_prefix="nadeo-batch"
+    ) as executor:
+        list(executor.map(post_one, zip(scheduled, entries)))
+    return EventManifest(entries)
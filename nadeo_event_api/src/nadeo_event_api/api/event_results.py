@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+from ..objects.inbound.match import Match
+from ..objects.inbound.match_results import MatchResults
+from ..objects.inbound.results_table import PlayerStanding, ResultsTable
+from ..objects.inbound.round import Round
+from . import event_api
+from .event_watcher import COMPLETED_STATUS
+from .pagination import DEFAULT_PAGE_SIZE, paginate
+
+
+@dataclass(slots=True, frozen=True)
+class PlayerMatchResult:
+    round_position: int
+    round_id: int
+    match_id: int
+    match_position: int
+    rank: Optional[int]
+    score: Optional[int]
+    team: Optional[str]
+
+
+class EventResults:
+    def __init__(
+        self,
+        event_id: int,
+        max_workers: int = 8,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        points_for_rank: Sequence[int] = (),
+        get_rounds: Callable[[int], List[Round]] = event_api.get_rounds_for_event,
+        get_matches: Callable[
+            [int, int, int], List[Match]
+        ] = event_api.get_matches_for_round,
+        get_results: Callable[
+            [int, int, int], MatchResults
+        ] = event_api.get_match_results,
+    ):
+        """
+        Gathers every result of an event: the matches of all rounds, then every page of
+        results of all matches, fetched concurrently. Results of completed matches (and the
+        match lists of completed rounds) are kept, so refreshing a running event only
+        fetches what can still change.
+
+        Usage:
+            results = EventResults(event_id, points_for_rank=[10, 6, 4, 3]).refresh()
+            results.standings()
+            results.history(account_id)
+
+        :param event_id: The ID of the event.
+        :param max_workers: Maximum number of requests in flight at once.
+        :param page_size: Number of matches/results requested per page.
+        :param points_for_rank: Points given for each match rank, starting at rank 1. Ranks past its end give 0 points.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._event_id = event_id
+        self._max_workers = max_workers
+        self._page_size = page_size
+        self._points_for_rank = points_for_rank
+
+        self._get_rounds = get_rounds
+        self._get_matches = get_matches
+        self._get_results = get_results
+
+        self.rounds: List[Round] = []
+        """ Rounds of the event, by position. """
+        self.matches: Dict[int, List[Match]] = {}
+        """ Round ID -> matches of the round, by position. """
+        self.results: Dict[int, MatchResults] = {}
+        """ Match ID -> results of the match, each participant once. """
+        self.table = ResultsTable()
+        """ One row per (match, participant), with round positions. """
+        self._histories: Dict[str, List[PlayerMatchResult]] = {}
+        self._completed_rounds: set = set()
+        self._completed_matches: set = set()
+
+    def _fetch_matches(self, round: Round) -> List[Match]:
+        matches = list(
+            paginate(
+                lambda length, offset: self._get_matches(round.id, length, offset),
+                page_size=self._page_size,
+            )
+        )
+        return sorted(matches, key=lambda match: match.position)
+
+    def _fetch_results(self, match: Match) -> MatchResults:
+        pages = []
+        offset = 0
+        while True:
+            page = self._get_results(match.id, self._page_size, offset)
+            pages.append(page)
+            if len(page.results) < self._page_size:
+                break
+            offset += self._page_size
+
+        # Ranks can move between pages while a match is played, keep each participant once.
+        seen = set()
+        results = []
+        for page in pages:
+            for result in page.results:
+                if result.participant not in seen:
+                    seen.add(result.participant)
+                    results.append(result)
+        first = pages[0]
+        return MatchResults(
+            first.match_live_id, first.round_position, results, first.teams
+        )
+
+    def refresh(self) -> EventResults:
+        """
+        Fetches the rounds, matches and results which may have changed since the last
+        refresh and recomputes the table, standings and histories.
+
+        :returns: self, for chaining.
+        """
+        self.rounds = sorted(self._get_rounds(self._event_id), key=lambda r: r.position)
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="nadeo-results"
+        ) as executor:
+            open_rounds = [r for r in self.rounds if r.id not in self._completed_rounds]
+            for round, matches in zip(
+                open_rounds, executor.map(self._fetch_matches, open_rounds)
+            ):
+                self.matches[round.id] = matches
+                if round.status == COMPLETED_STATUS and all(
+                    m.is_completed for m in matches
+                ):
+                    self._completed_rounds.add(round.id)
+
+            open_matches = [
+                match
+                for round in self.rounds
+                for match in self.matches.get(round.id, [])
+                if match.id not in self._completed_matches
+            ]
+            for match, results in zip(
+                open_matches, executor.map(self._fetch_results, open_matches)
+            ):
+                self.results[match.id] = results
+                if match.is_completed:
+                    self._completed_matches.add(match.id)
+
+        self._rebuild()
+        return self
+
+    def _rebuild(self) -> None:
+        table = ResultsTable()
+        histories: Dict[str, List[PlayerMatchResult]] = {}
+        for round in self.rounds:
+            for match in self.matches.get(round.id, []):
+                results = self.results.get(match.id)
+                if results is None:
+                    continue
+                for result in results.results:
+                    table.append(
+                        match.id,
+                        round.position,
+                        result.participant,
+                        result.rank,
+                        result.score,
+                    )
+                    histories.setdefault(result.participant, []).append(
+                        PlayerMatchResult(
+                            round_position=round.position,
+                            round_id=round.id,
+                            match_id=match.id,
+                            match_position=match.position,
+                            rank=result.rank,
+                            score=result.score,
+                            team=result.team,
+                        )
+                    )
+        self.table = table
+        self._histories = histories
+
+    @property
+    def participants(self) -> List[str]:
+        """
+        Every participant with at least one result, in order of first appearance.
+        """
+        return list(self._histories)
+
+    def standings(self) -> List[PlayerStanding]:
+        """
+        Returns the standings over every match of the event.
+        """
+        return self.table.standings(self._points_for_rank)
+
+    def round_standings(self, round_position: int) -> List[PlayerStanding]:
+        """
+        Returns the standings over the matches of one round.
+
+        :param round_position: Position of the round in the event, starting at 0.
+        """
+        return self.table.select_rounds([round_position]).standings(
+            self._points_for_rank
+        )
+
+    def history(self, participant_id: str) -> List[PlayerMatchResult]:
+        """
+        Returns every match result of a participant, by round then match position.
+
+        :param participant_id: The player's tm account ID.
+        """
+        return list(self._histories.get(participant_id, ()))
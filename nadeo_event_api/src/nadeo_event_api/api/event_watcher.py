@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from ..objects.inbound.match import Match
+from ..objects.inbound.match_info import MatchInfo
+from ..objects.inbound.match_results import MatchResults
+from ..objects.inbound.round import Round
+from . import event_api
+from .pagination import DEFAULT_PAGE_SIZE
+
+COMPLETED_STATUS = "COMPLETED"
+""" Status of a Round or MatchInfo which is over. """
+
+PENDING_MATCH_STATUSES = frozenset({None, "", "PENDING"})
+""" MatchInfo statuses of a match which hasn't started yet. """
+
+
+class WatchEventType(Enum):
+    """
+    The kind of change an EventWatcher observed.
+    """
+
+    ROUND_STATUS_CHANGED = "round_status_changed"
+    MATCH_ADDED = "match_added"
+    MATCH_STARTED = "match_started"
+    RESULTS_CHANGED = "results_changed"
+    MATCH_COMPLETED = "match_completed"
+    ROUND_COMPLETED = "round_completed"
+
+
+@dataclass
+class WatchEvent:
+    type: WatchEventType
+    round: Round
+    match: Optional[Match] = None
+    match_info: Optional[MatchInfo] = None
+    results: Optional[MatchResults] = None
+
+
+class EventWatcher:
+    def __init__(
+        self,
+        event_id: int,
+        live_interval: float = 10,
+        idle_interval: float = 60,
+        max_interval: float = 600,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        get_rounds: Callable[[int], List[Round]] = event_api.get_rounds_for_event,
+        get_matches: Callable[
+            [int, int, int], List[Match]
+        ] = event_api.get_matches_for_round,
+        get_results: Callable[
+            [int, int, int], MatchResults
+        ] = event_api.get_match_results,
+        get_info: Callable[[str], MatchInfo] = event_api.get_match_info,
+    ):
+        """
+        Keeps a local model of a running event and polls only what can still change:
+        completed rounds and completed matches are never fetched again. Every poll
+        returns the changes observed since the previous one.
+
+        :param event_id: The ID of the event to watch.
+        :param live_interval: Seconds between polls while a match is being played.
+        :param idle_interval: Seconds between polls while a round is open but no match is being played.
+        :param max_interval: Maximum seconds between polls while waiting for the next round.
+        :param page_size: Number of matches/results requested per page.
+        """
+        self._event_id = event_id
+        self._live_interval = live_interval
+        self._idle_interval = idle_interval
+        self._max_interval = max_interval
+        self._page_size = page_size
+
+        self._get_rounds = get_rounds
+        self._get_matches = get_matches
+        self._get_results = get_results
+        self._get_info = get_info
+
+        self.rounds: Dict[int, Round] = {}
+        """ Round ID -> latest round. """
+        self.matches: Dict[int, Dict[int, Match]] = {}
+        """ Round ID -> match ID -> latest match. """
+        self.match_infos: Dict[int, MatchInfo] = {}
+        """ Match ID -> latest match info. """
+        self.results: Dict[int, MatchResults] = {}
+        """ Match ID -> latest results. """
+        self._completed_rounds: set = set()
+        self._live = False
+        """ Whether the last poll saw a match being played. """
+
+    @property
+    def finished(self) -> bool:
+        """
+        Whether every round of the event has completed.
+        """
+        return bool(self.rounds) and len(self._completed_rounds) == len(self.rounds)
+
+    def _round_completed(self, round: Round) -> bool:
+        if round.status == COMPLETED_STATUS:
+            return True
+        matches = self.matches.get(round.id)
+        return (
+            bool(matches)
+            and len(matches) >= (round.num_matches or 0)
+            and all(match.is_completed for match in matches.values())
+        )
+
+    def _poll_match(
+        self, round: Round, previous: Optional[Match], match: Match
+    ) -> List[WatchEvent]:
+        events = []
+        if previous is None:
+            events.append(WatchEvent(WatchEventType.MATCH_ADDED, round, match))
+
+        info = self._get_info(match.club_match_live_id)
+        previous_info = self.match_infos.get(match.id)
+        self.match_infos[match.id] = info
+        previous_status = previous_info.status if previous_info else None
+        if (
+            previous_status in PENDING_MATCH_STATUSES
+            and info.status not in PENDING_MATCH_STATUSES
+        ):
+            events.append(WatchEvent(WatchEventType.MATCH_STARTED, round, match, info))
+        if (
+            not match.is_completed
+            and info.status not in PENDING_MATCH_STATUSES
+            and info.status != COMPLETED_STATUS
+        ):
+            self._live = True
+
+        results = self._get_results(match.id, self._page_size, 0)
+        previous_results = self.results.get(match.id)
+        self.results[match.id] = results
+        if previous_results is None or previous_results.results != results.results:
+            events.append(
+                WatchEvent(WatchEventType.RESULTS_CHANGED, round, match, info, results)
+            )
+
+        if match.is_completed:
+            events.append(
+                WatchEvent(WatchEventType.MATCH_COMPLETED, round, match, info, results)
+            )
+        return events
+
+    def poll(self) -> List[WatchEvent]:
+        """
+        Polls the event once, skipping completed rounds and matches, and updates the local model.
+
+        :returns: The changes observed since the previous poll.
+        """
+        events = []
+        now = time.time()
+        self._live = False
+        for round in self._get_rounds(self._event_id):
+            previous_round = self.rounds.get(round.id)
+            self.rounds[round.id] = round
+            if previous_round is not None and previous_round.status != round.status:
+                events.append(WatchEvent(WatchEventType.ROUND_STATUS_CHANGED, round))
+
+            if round.id in self._completed_rounds:
+                continue
+            if round.start_date is not None and round.start_date > now:
+                continue
+
+            known_matches = self.matches.setdefault(round.id, {})
+            offset = 0
+            while True:
+                page = self._get_matches(round.id, self._page_size, offset)
+                for match in page:
+                    previous = known_matches.get(match.id)
+                    if previous is not None and previous.is_completed:
+                        continue
+                    known_matches[match.id] = match
+                    events.extend(self._poll_match(round, previous, match))
+                if len(page) < self._page_size:
+                    break
+                offset += self._page_size
+
+            if self._round_completed(round):
+                self._completed_rounds.add(round.id)
+                events.append(WatchEvent(WatchEventType.ROUND_COMPLETED, round))
+        return events
+
+    def next_interval(self) -> float:
+        """
+        Returns how long to wait before the next poll: short while matches are played,
+        longer while a round is open, and up to max_interval while waiting for a round.
+        """
+        if self._live:
+            return self._live_interval
+
+        now = time.time()
+        upcoming = []
+        for round in self.rounds.values():
+            if round.id in self._completed_rounds:
+                continue
+            if round.start_date is None or round.start_date <= now:
+                return self._idle_interval
+            upcoming.append(round.start_date - now)
+        if not upcoming:
+            return self._max_interval
+        return max(self._live_interval, min(self._max_interval, min(upcoming)))
+
+    def run(
+        self,
+        on_event: Callable[[WatchEvent], None],
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """
+        Polls the event until every round has completed (or stop is set), calling on_event
+        for every observed change.
+
+        :param on_event: Called with each change, in the order observed.
+        :param stop: Set it from another thread to stop watching.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            for event in self.poll():
+                on_event(event)
+            if self.finished:
+                return
+            stop.wait(self.next_interval())
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .codec import JsonCodec, get_codec
+from .conditional import ConditionalStore
+from .response_cache import ResponseCache
+from .retry import IDEMPOTENT_METHODS, RetryPolicy, TokenBucket
+
+DEFAULT_POOL_CONNECTIONS = 4
+""" Number of per-host connection pools kept by the adapter. """
+
+DEFAULT_POOL_MAXSIZE = 16
+""" Maximum number of keep-alive connections kept per host. """
+
+DEFAULT_TIMEOUT = (5.0, 30.0)
+""" Default (connect, read) timeout in seconds applied to every request. """
+
+Timeout = Union[float, Tuple[float, float], None]
+
+T = TypeVar("T")
+
+
+class NadeoApiError(RuntimeError):
+    def __init__(self, response: requests.Response):
+        super().__init__(
+            f"{response.request.method} {response.url} failed: {response.status_code} {response.text}"
+        )
+        self.response = response
+        self.status_code = response.status_code
+
+
+class NadeoHttpClient:
+    """
+    Shared HTTP client used for every call to the Nadeo services. It owns a single
+    requests.Session so connections to meet.trackmania.nadeo.club (and the other
+    Nadeo hosts) are kept alive and reused instead of re-handshaking for each call.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super(NadeoHttpClient, cls).__new__(cls)
+                    instance._session = None
+                    instance.configure()
+                    cls._instance = instance
+        return cls._instance
+
+    def configure(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        adapter: Optional[HTTPAdapter] = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        cache: Optional[ResponseCache] = None,
+        conditional_store: Optional[ConditionalStore] = None,
+        codec: Optional[JsonCodec] = None,
+    ) -> None:
+        """
+        (Re)configures the shared session. Existing pooled connections are closed.
+
+        :param pool_connections: Number of per-host connection pools to cache.
+        :param pool_maxsize: Maximum number of connections to keep alive per host. Should be at least the number of threads issuing requests concurrently.
+        :param timeout: Default timeout for requests, either a float or a (connect, read) tuple.
+        :param adapter: Override the HTTP adapter mounted for http:// and https://.
+        :param retry_policy: How failed requests are retried. Use retry.NO_RETRY to disable retries.
+        :param rate_limits: Host (e.g. "meet.trackmania.nadeo.club") -> (requests per second, burst) token bucket limits. Hosts not listed are not limited.
+        :param cache: Cache of GET responses, None to disable caching.
+        :param conditional_store: Validators and models used by get_decoded. Defaults to a new ConditionalStore().
+        :param codec: Encodes json= request bodies and decodes response bodies. Defaults to codec.get_codec().
+        """
+        if self._session is not None:
+            self._session.close()
+
+        if adapter is None:
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+            )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        self._session = session
+        self._timeout = timeout
+        self._retry_policy = retry_policy
+        self._rate_limiters = {
+            host: TokenBucket(rate, burst)
+            for host, (rate, burst) in (rate_limits or {}).items()
+        }
+        self._cache = cache
+        self._conditional_store = (
+            conditional_store if conditional_store is not None else ConditionalStore()
+        )
+        self._codec = codec if codec is not None else get_codec()
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        return self._cache
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+
+    @property
+    def codec(self) -> JsonCodec:
+        return self._codec
+
+    def request(
+        self, method: str, url: str, retry: Optional[bool] = None, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Sends a request through the pooled session, applying the default timeout
+        unless one is given. Requests are held back by the host's rate limit, and
+        connection errors and retryable statuses (429, 5xx) are retried with backoff,
+        honoring Retry-After. A 429 pauses every request to that host. GETs are served
+        from the response cache when one is configured. A json= body is encoded with
+        the client's codec.
+
+        :param method: HTTP method (e.g. "GET", "POST")
+        :param url: The URL to request.
+        :param retry: Whether the request may be retried. Defaults to True for idempotent methods (GET) only, so POSTs must opt in.
+        :returns: The last response received.
+        """
+        if kwargs.get("json") is not None:
+            kwargs["data"] = self._codec.dumps(kwargs.pop("json"))
+            headers = dict(kwargs.pop("headers", None) or {})
+            if not any(name.lower() == "content-type" for name in headers):
+                headers["Content-Type"] = "application/json"
+            kwargs["headers"] = headers
+
+        cacheable = self._cache is not None and method.upper() == "GET"
+        if cacheable:
+            cached = self._cache.get(url)  # type: ignore
+            if cached is not None:
+                return cached
+
+        response = self._send(method, url, retry, **kwargs)
+        if cacheable:
+            self._cache.put(url, response)  # type: ignore
+        return response
+
+    def _send(
+        self, method: str, url: str, retry: Optional[bool], **kwargs: Any
+    ) -> requests.Response:
+        kwargs.setdefault("timeout", self._timeout)
+        if retry is None:
+            retry = method.upper() in IDEMPOTENT_METHODS
+        max_retries = self._retry_policy.max_retries if retry else 0
+        rate_limiter = self._rate_limiters.get(urlsplit(url).hostname or "")
+
+        attempt = 0
+        while True:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= max_retries:
+                    raise
+                delay = self._retry_policy.backoff(attempt)
+            else:
+                if (
+                    attempt >= max_retries
+                    or response.status_code not in self._retry_policy.retry_statuses
+                ):
+                    return response
+                delay = self._retry_policy.delay_for(response, attempt)
+                if response.status_code == 429 and rate_limiter is not None:
+                    rate_limiter.pause(delay)
+            attempt += 1
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_json(self, url: str, **kwargs: Any) -> Any:
+        """
+        Sends a GET request and decodes its JSON body.
+
+        :raises NadeoApiError: If the response is an error, after retries.
+        """
+        response = self.get(url, **kwargs)
+        if not response.ok:
+            raise NadeoApiError(response)
+        return self.decode_json(response)
+
+    def post_json(self, url: str, **kwargs: Any) -> Any:
+        """
+        Sends a POST request and decodes its JSON body.
+
+        :raises NadeoApiError: If the response is an error, after retries.
+        """
+        response = self.post(url, **kwargs)
+        if not response.ok:
+            raise NadeoApiError(response)
+        return self.decode_json(response)
+
+    def decode_json(self, response: requests.Response) -> Any:
+        """
+        Decodes the JSON body of a response with the client's codec, straight from its bytes.
+        """
+        return self._codec.loads(response.content)
+
+    def close(self) -> None:
+        """
+        Closes all pooled connections. The client can still be used afterwards,
+        connections will be re-established on demand.
+        """
+        self._session.close()
+
+    def get_decoded(self, url: str, decode: Callable[[Any], T], **kwargs: Any) -> T:
+        """
+        Sends a conditional GET (If-None-Match/If-Modified-Since from the previous response)
+        and builds a model from its JSON body. If the server answers 304, or the body is
+        byte-identical to the previous one, the previous model is returned without decoding.
+
+        NOTE: The returned model may be shared with previous calls and must not be mutated.
+
+        :param url: The URL to request.
+        :param decode: Builds the model from the decoded JSON body.
+        :raises NadeoApiError: If the response is an error, after retries.
+        """
+        headers = dict(kwargs.pop("headers", None) or {})
+        conditional_headers = dict(
+            headers, **self._conditional_store.request_headers(url, decode)
+        )
+        response = self.get(url, headers=conditional_headers, **kwargs)
+        if not response.ok and response.status_code != 304:
+            raise NadeoApiError(response)
+        try:
+            return self._conditional_store.decode(
+                url, response, decode, loads=self._codec.loads
+            )
+        except LookupError:
+            # The previous model was dropped while the request was in flight, get the body.
+            response = self.get(url, headers=headers, **kwargs)
+            if not response.ok:
+                raise NadeoApiError(response)
+            return self._conditional_store.decode(
+                url, response, decode, loads=self._codec.loads
+            )
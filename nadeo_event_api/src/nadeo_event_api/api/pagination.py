@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+""" Default number of items requested per page from paginated Meet endpoints. """
+
+
+def paginate(
+    fetch_page: Callable[[int, int], Sequence[T]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = False,
+) -> Iterator[T]:
+    """
+    Lazily iterates over a paginated collection, one page in memory at a time. Iteration
+    stops at the first page shorter than page_size.
+
+    :param fetch_page: Fetches a page given (length, offset).
+    :param page_size: Number of items requested per page.
+    :param prefetch: Fetch the next page in the background while the current one is consumed.
+    :returns: An iterator over every item of the collection.
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    if not prefetch:
+        offset = 0
+        while True:
+            page = fetch_page(page_size, offset)
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="nadeo-prefetch")
+    try:
+        offset = 0
+        pending = executor.submit(fetch_page, page_size, offset)
+        while True:
+            page = pending.result()
+            if len(page) < page_size:
+                yield from page
+                return
+            offset += page_size
+            pending = executor.submit(fetch_page, page_size, offset)
+            yield from page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
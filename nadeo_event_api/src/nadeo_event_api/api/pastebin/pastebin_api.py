@@ -30,9 +30,11 @@ def post_tmwt_2v2(tmwt_2v2_pastebin: Tmwt2v2Paste, api_dev_key: str) -> str:
     )
     if response.status_code == 200:
         paste_url = response.text
-        raw_url = paste_url.replace("https://pastebin.com/", "https://pastebin.com/raw/")
+        raw_url = paste_url.replace(
+            "https://pastebin.com/", "https://pastebin.com/raw/"
+        )
         return raw_url
     else:
         raise RuntimeError(
             f"Error posting pastebin: {response.status_code} {response.text}"
-        )
\ No newline at end of file
+        )
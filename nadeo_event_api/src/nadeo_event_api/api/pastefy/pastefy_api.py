@@ -5,12 +5,15 @@ import json
 import requests
 from base64 import b64encode
 
-from nadeo_event_api.api.endpoints import PASTEFY_SKIFF_CREATE_URL, PASTEFY_SKIFF_RAW_URL_FMT
+from nadeo_event_api.api.endpoints import (
+    PASTEFY_SKIFF_CREATE_URL,
+    PASTEFY_SKIFF_RAW_URL_FMT,
+)
 from nadeo_event_api.objects.outbound.pastebin.tmwt_2v2 import Tmwt2v2Paste
 
 
 def get_auth(username: str, password: str) -> str:
-    return b64encode(f"{username}:{password}".encode('utf-8')).decode("ascii")
+    return b64encode(f"{username}:{password}".encode("utf-8")).decode("ascii")
 
 
 def post_tmwt_2v2(tmwt_2v2_pastebin: Tmwt2v2Paste, title: str, basic_auth: str) -> str:
@@ -23,11 +26,11 @@ def post_tmwt_2v2(tmwt_2v2_pastebin: Tmwt2v2Paste, title: str, basic_auth: str)
         auth (str): HTTP Basic Authentication header value
 
     Returns:
-        str: The raw URL of the paste. 
+        str: The raw URL of the paste.
     """
     content = json.dumps(tmwt_2v2_pastebin.as_jsonable_dict(), indent=4)
     expiry_date = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
-    formatted = expiry_date.strftime('%Y-%m-%d %H:%M:%S') + '.0'
+    formatted = expiry_date.strftime("%Y-%m-%d %H:%M:%S") + ".0"
     data = {
         "type": "PASTE",
         "title": title,
@@ -36,9 +39,7 @@ def post_tmwt_2v2(tmwt_2v2_pastebin: Tmwt2v2Paste, title: str, basic_auth: str)
         "visibility": "PUBLIC",
     }
 
-    headers = {
-        "Authorization": f"Basic {basic_auth}"
-    }
+    headers = {"Authorization": f"Basic {basic_auth}"}
 
     response = requests.post(
         url=PASTEFY_SKIFF_CREATE_URL,
@@ -47,7 +48,7 @@ def post_tmwt_2v2(tmwt_2v2_pastebin: Tmwt2v2Paste, title: str, basic_auth: str)
     )
     if response.status_code != 200:
         raise Exception(f"Failed to post to pastes.skiff.dev API - {response.content}")
-    
+
     paste_id = response.json()["paste"]["id"]
     paste_url = PASTEFY_SKIFF_RAW_URL_FMT.format(paste_id)
-    return paste_url
\ No newline at end of file
+    return paste_url
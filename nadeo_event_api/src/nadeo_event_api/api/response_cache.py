@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import math
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Protocol
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .codec import get_codec
+
+INFINITE_TTL = math.inf
+""" TTL of resources which never change once they reach their final state. """
+
+
+class CachePolicy(Protocol):
+    def ttl(self, url: str, body: Callable[[], Any]) -> Optional[float]:
+        """
+        Returns for how many seconds the response of a GET to url may be served from cache,
+        or None to not cache it. body() decodes the JSON body, only call it when the TTL
+        depends on it: decoding is the main cost of caching a response.
+        """
+
+
+_MATCH_INFO_RE = re.compile(r"/api/matches/([^/?]+)$")
+_MATCH_RESULTS_RE = re.compile(r"/api/matches/(\d+)/results")
+_ROUND_MATCHES_RE = re.compile(r"/api/rounds/(\d+)/matches")
+_EVENT_ROUNDS_RE = re.compile(r"/api/competitions/\d+/rounds$")
+_CAMPAIGN_RE = re.compile(r"/api/token/club/\d+/campaign/\d+")
+
+
+class MeetCachePolicy:
+    def __init__(
+        self,
+        live_ttl: float = 10,
+        campaign_ttl: float = 3600,
+        max_rounds: int = 8,
+    ):
+        """
+        Default cache policy for the Meet and Live APIs. Completed matches and rounds never
+        change, so they are cached forever; resources which may still change are cached
+        for live_ttl seconds. Results of a match are cached forever once a match list
+        reported that match as completed.
+
+        :param live_ttl: TTL of resources which may still change.
+        :param campaign_ttl: TTL of club campaigns.
+        :param max_rounds: Number of rounds, most recently listed first, whose completed matches are remembered.
+        """
+        self._live_ttl = live_ttl
+        self._campaign_ttl = campaign_ttl
+        self._max_rounds = max_rounds
+        self._completed_matches: OrderedDict[int, set] = OrderedDict()
+        """ Round ID -> IDs of its matches reported as completed. """
+        self._lock = threading.Lock()
+
+    def _match_completed(self, match_id: int) -> bool:
+        with self._lock:
+            return any(
+                match_id in match_ids for match_ids in self._completed_matches.values()
+            )
+
+    def _add_completed_matches(self, round_id: int, match_ids: set) -> None:
+        with self._lock:
+            round_match_ids = self._completed_matches.setdefault(round_id, set())
+            round_match_ids |= match_ids
+            self._completed_matches.move_to_end(round_id)
+            while len(self._completed_matches) > self._max_rounds:
+                self._completed_matches.popitem(last=False)
+
+    def ttl(self, url: str, body: Callable[[], Any]) -> Optional[float]:
+        path = url.split("?", 1)[0]
+
+        match = _MATCH_RESULTS_RE.search(path)
+        if match is not None:
+            if self._match_completed(int(match.group(1))):
+                return INFINITE_TTL
+            return self._live_ttl
+
+        match = _ROUND_MATCHES_RE.search(path)
+        if match is not None:
+            data = body()
+            matches = data.get("matches", []) if isinstance(data, dict) else []
+            self._add_completed_matches(
+                int(match.group(1)),
+                {m.get("id") for m in matches if m.get("isCompleted")},
+            )
+            if matches and all(m.get("isCompleted") for m in matches):
+                return INFINITE_TTL
+            return self._live_ttl
+
+        if _EVENT_ROUNDS_RE.search(path) is not None:
+            data = body()
+            if (
+                isinstance(data, list)
+                and data
+                and all(
+                    isinstance(r, dict) and r.get("status") == "COMPLETED" for r in data
+                )
+            ):
+                return INFINITE_TTL
+            return self._live_ttl
+
+        if _MATCH_INFO_RE.search(path) is not None:
+            data = body()
+            if isinstance(data, dict) and data.get("status") == "COMPLETED":
+                return INFINITE_TTL
+            return self._live_ttl
+
+        if _CAMPAIGN_RE.search(path) is not None:
+            return self._campaign_ttl
+
+        return None
+
+
+@dataclass
+class _CacheEntry:
+    expires_at: float
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        policy: CachePolicy = None,  # type: ignore
+        clock: Callable[[], float] = time.monotonic,
+        loads: Optional[Callable[[bytes], Any]] = None,
+    ):
+        """
+        Thread-safe LRU cache of successful GET responses, keyed by URL (endpoint and
+        query parameters). How long each response is kept is decided by the policy.
+
+        :param max_entries: Maximum number of responses kept.
+        :param max_bytes: Maximum total size of the response bodies kept.
+        :param policy: Decides the TTL of each response. Defaults to MeetCachePolicy().
+        :param loads: Decodes response bodies for the policy. Defaults to the loads of codec.get_codec().
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._policy = policy if policy is not None else MeetCachePolicy()
+        self._clock = clock
+        self._loads = loads if loads is not None else get_codec().loads
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[requests.Response]:
+        """
+        Returns the cached response of a URL, None if it's missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(url)
+                entry = None
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(url)
+            self._stats.hits += 1
+
+        response = requests.Response()
+        response.status_code = entry.status_code
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = entry.content
+        response.url = url
+        response.encoding = "utf-8"
+        return response
+
+    def put(self, url: str, response: requests.Response) -> None:
+        """
+        Caches a response if it succeeded and the policy allows it.
+        """
+        if response.status_code != 200:
+            return
+        content = response.content
+        if len(content) > self._max_bytes:
+            return
+        try:
+            ttl = self._policy.ttl(url, lambda: self._loads(content))
+        except ValueError:  # The policy needed the body, which isn't valid JSON.
+            return
+        if ttl is None or ttl <= 0:
+            return
+
+        with self._lock:
+            if url in self._entries:
+                self._remove(url)
+            self._entries[url] = _CacheEntry(
+                expires_at=self._clock() + ttl,
+                status_code=response.status_code,
+                headers=dict(response.headers),
+                content=content,
+            )
+            self._bytes += len(content)
+            while (
+                len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+
+    def _remove(self, url: str) -> None:
+        entry = self._entries.pop(url)
+        self._bytes -= len(entry.content)
+
+    def invalidate(self, url: str) -> None:
+        with self._lock:
+            if url in self._entries:
+                self._remove(url)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
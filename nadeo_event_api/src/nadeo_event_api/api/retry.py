@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from typing import FrozenSet, Optional
+
+import requests
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+""" Methods retried by default. Other methods (e.g. POST) are only retried when opted in. """
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 3
+    """ Number of retries after the first attempt. """
+    backoff_factor: float = 0.5
+    """ Upper bound in seconds of the first backoff, doubled for each following retry. """
+    max_backoff: float = 30.0
+    """ Upper bound in seconds of any backoff, including delays requested by Retry-After. """
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    """ Response status codes which are retried. """
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the delay before the given retry (0 for the first one), using exponential
+        backoff with full jitter so concurrent clients don't retry in lockstep.
+        """
+        return random.uniform(
+            0, min(self.max_backoff, self.backoff_factor * 2**attempt)
+        )
+
+    def delay_for(self, response: requests.Response, attempt: int) -> float:
+        """
+        Returns the delay before retrying a failed response, honoring its Retry-After header.
+        """
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(self.max_backoff, retry_after)
+        return self.backoff(attempt)
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header, given either in seconds or as an HTTP date.
+
+    :returns: The delay in seconds, None if the header is missing or malformed.
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int = 1):
+        """
+        Thread-safe token bucket limiting the rate of requests to a host.
+
+        :param rate: Tokens added per second, i.e. the sustained request rate.
+        :param capacity: Maximum number of tokens, i.e. the allowed burst.
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Takes a token, returning how long the caller must wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Holds back every request for the given time, e.g. after the host answered 429.
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -1,10 +1,12 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional, Tuple
 from warnings import warn
 import requests
 
 from .enums import ParticipantType
 from ...utils import dt_standardize
+from .registration import RegistrationReport, RegistrationResult, dispatch_registrations
+from .round.bracket import BracketGraph
 from .round.spot_structure import SpotStructure
 from ...constants import (
     ADD_LOGO_URL_FMT,
@@ -17,6 +19,8 @@ from ...constants import (
 )
 
 from ..authenticate import UbiTokenManager
+from ..http_client import NadeoHttpClient
+from ..pagination import DEFAULT_PAGE_SIZE, paginate
 
 from .round.round import Round
 
@@ -65,11 +69,14 @@ class Event:
             print("Event is not valid, and therefore will not post.")
             return
         token = UbiTokenManager().nadeo_club_token
-        response = requests.post(
-            url=CREATE_COMP_URL,
-            headers={"Authorization": "nadeo_v1 t=" + token},
-            json=self._as_jsonable_dict(),
-        ).json()
+        client = NadeoHttpClient()
+        response = client.decode_json(
+            client.post(
+                url=CREATE_COMP_URL,
+                headers={"Authorization": "nadeo_v1 t=" + token},
+                json=self._as_jsonable_dict(),
+            )
+        )
         if "exception" in response:
             print("Failed to post event: ", response)
             return
@@ -87,7 +94,7 @@ class Event:
             print("Could not delete event since it hasn't been posted.")
             return
         token = UbiTokenManager().nadeo_club_token
-        requests.post(
+        NadeoHttpClient().post(
             url=DELETE_COMP_URL_FMT.format(self._registered_id),
             headers={"Authorization": "nadeo_v1 t=" + token},
         )
@@ -111,13 +118,56 @@ class Event:
                 "WARNING! You tried adding a player with seed zero, they will not be part of the event. Start at 1."
             )
             return
+        response = self._post_participant((player_uuid, seed))
+        if not response.ok:
+            print(f"Failed to add participant {player_uuid}: ", response.text)
+
+    def add_participants(
+        self,
+        participants: List[Tuple[str, int]],
+        max_workers: int = 8,
+    ) -> RegistrationReport[Tuple[str, int]]:
+        """
+        Adds many participants to the event in parallel. Transient failures are retried
+        following the HTTP client's retry policy.
+
+        :param participants: The (account ID, seed) of each player, seeds start at 1.
+        :param max_workers: Maximum number of registrations in flight at once.
+        :returns: A report with the outcome of each registration, in the same order as participants.
+        """
+        error = self._registration_error(ParticipantType.PLAYER)
+        if error is not None:
+            print(error)
+            return RegistrationReport(
+                [
+                    RegistrationResult(p, success=False, error=error)
+                    for p in participants
+                ]
+            )
+        return dispatch_registrations(
+            participants,
+            self._post_participant,
+            validate=lambda p: "Seeds start at 1." if p[1] == 0 else None,
+            max_workers=max_workers,
+        )
+
+    def _post_participant(self, participant: Tuple[str, int]) -> requests.Response:
+        player_uuid, seed = participant
         token = UbiTokenManager().nadeo_club_token
-        requests.post(
+        return NadeoHttpClient().post(
             url=ADD_PARTICIPANT_URL_FMT.format(self._registered_id),
             headers={"Authorization": "nadeo_v1 t=" + token},
+            retry=True,
             json={"participant": player_uuid, "seed": seed},
         )
 
+    def _registration_error(self, participant_type: ParticipantType) -> Optional[str]:
+        if not self._registered_id:
+            return "Could not register to event since it hasn't been posted."
+        if self._participant_type != participant_type:
+            return f"Could not register since this event is not type {participant_type.value}"
+        return None
+
     def get_participants(self) -> List[str]:
         """
         Gets the participants registered to the event.
@@ -143,11 +193,43 @@ class Event:
         if self._participant_type != ParticipantType.TEAM:
             print("Could not add team since this event is not type TEAM")
             return
+        response = self._post_team((name, members, seed))
+        if not response.ok:
+            print(f"Failed to add team {name}: ", response.text)
+
+    def add_teams(
+        self,
+        teams: List[Tuple[str, List[str], int]],
+        max_workers: int = 8,
+    ) -> RegistrationReport[Tuple[str, List[str], int]]:
+        """
+        Adds many teams to the event in parallel. Transient failures are retried following
+        the HTTP client's retry policy.
+
+        :param teams: The (name, member account IDs, seed) of each team, seeds start at 1.
+        :param max_workers: Maximum number of registrations in flight at once.
+        :returns: A report with the outcome of each registration, in the same order as teams.
+        """
+        error = self._registration_error(ParticipantType.TEAM)
+        if error is not None:
+            print(error)
+            return RegistrationReport(
+                [RegistrationResult(t, success=False, error=error) for t in teams]
+            )
+        return dispatch_registrations(
+            teams,
+            self._post_team,
+            max_workers=max_workers,
+        )
+
+    def _post_team(self, team: Tuple[str, List[str], int]) -> requests.Response:
+        name, members, seed = team
         token = UbiTokenManager().nadeo_club_token
         team_members = [{"member": member} for member in members]
-        requests.post(
+        return NadeoHttpClient().post(
             url=ADD_TEAM_URL_FMT.format(self._registered_id),
             headers={"Authorization": "nadeo_v1 t=" + token},
+            retry=True,
             json={"id": name, "name": name, "seed": seed, "members": team_members},
         )
 
@@ -160,19 +242,23 @@ class Event:
         if not self._registered_id:
             print("Could not add logo to event since it hasn't been posted.")
             return
-        response = requests.get(logo_url)
+        response = NadeoHttpClient().get(logo_url)
         if response.status_code != 200:
             print(f"Failed to download logo from url: {logo_url}")
             return
         token = UbiTokenManager().nadeo_club_token
-        response = requests.post(
-            url=ADD_LOGO_URL_FMT.format(self._registered_id),
-            headers={
-                "Authorization": "nadeo_v1 t=" + token,
-                "Content-Type": "application/binary",
-            },
-            data=response.content,
-        ).json()
+        response = (
+            NadeoHttpClient()
+            .post(
+                url=ADD_LOGO_URL_FMT.format(self._registered_id),
+                headers={
+                    "Authorization": "nadeo_v1 t=" + token,
+                    "Content-Type": "application/binary",
+                },
+                data=response.content,
+            )
+            .json()
+        )
         self._personal_logo_url = logo_url
         self._registered_logo_url = response
 
@@ -184,29 +270,40 @@ class Event:
         :param event_id: The ID of the event to delete.
         """
         token = UbiTokenManager().nadeo_club_token
-        requests.post(
+        NadeoHttpClient().post(
             url=DELETE_COMP_URL_FMT.format(event_id),
             headers={"Authorization": "nadeo_v1 t=" + token},
         )
 
     @staticmethod
-    def get_participants_from_id(event_id: int) -> List[str]:
+    def get_participants_from_id(
+        event_id: int, page_size: int = DEFAULT_PAGE_SIZE
+    ) -> List[str]:
+        """
+        Gets every participant registered to the event with the given ID.
+
+        :param event_id: The ID of the event.
+        :param page_size: Number of participants requested per page.
+        :returns: A list of player UUIDs
+        """
+
         # TODO return type Participant
-        token = UbiTokenManager().nadeo_club_token
-        response = requests.get(
-            url=GET_PARTICIPANTS_URL_FMT.format(
-                event_id, 0, 50
-            ),  # TODO pagination support
-            headers={"Authorization": "nadeo_v1 t=" + token},
-        ).json()
-        uuids = []
-        for participant_info in response:
-            uuids.append(participant_info["participant"])
-        return uuids
+        def fetch_page(length: int, offset: int) -> List[dict]:
+            token = UbiTokenManager().nadeo_club_token
+            return NadeoHttpClient().get_json(
+                url=GET_PARTICIPANTS_URL_FMT.format(event_id, offset, length),
+                headers={"Authorization": "nadeo_v1 t=" + token},
+            )
+
+        return [
+            participant_info["participant"]
+            for participant_info in paginate(fetch_page, page_size=page_size)
+        ]
 
     def _as_jsonable_dict(self) -> dict:
         """
-        Returns the event as a JSON-able dictionary.
+        Returns the event as a JSON-able dictionary. The dictionaries of unchanged rounds,
+        matches and spots are reused from the previous call, so they must not be mutated.
         """
         event = {}
         event["name"] = self._name
@@ -222,9 +319,10 @@ class Event:
             if self._registration_end_date
             else None
         )
-        event["rounds"] = [round.as_jsonable_dict() for round in self._rounds]
-        for i in range(len(self._rounds)):
-            event["rounds"][i]["position"] = i
+        event["rounds"] = [
+            {**round.as_jsonable_dict(), "position": i}
+            for i, round in enumerate(self._rounds)
+        ]
         event["rulesUrl"] = None
         event["spotStructure"] = SpotStructure(self._rounds).as_jsonable_dict()
         event["startDate"] = ""
@@ -283,7 +381,11 @@ class Event:
 
         # TODO check that maps are real
 
-        # TODO check that matches requiring outcomes from previous rounds have ends before this match starts
+        bracket = BracketGraph(self._rounds)
+        for error in bracket.errors:
+            print(error)
+        if not bracket.valid:
+            return False
 
         # TODO check that club id belongs to authorized user
 
@@ -3,8 +3,10 @@ from typing import List
 
 import requests
 
+from .memoized import Memoized
 
-class Map:
+
+class Map(Memoized):
     def __init__(self, uuid: str):
         self._uuid = uuid
 
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from operator import is_
+from typing import Any, Callable, Iterator, Tuple, TypeVar
+import weakref
+
+T = TypeVar("T")
+
+
+def _is_memoized(value: object) -> bool:
+    # Duck typed rather than isinstance, so components loaded through another import
+    # path of this package (e.g. src.nadeo_event_api) are still tracked.
+    return getattr(type(value), "_memo_invalidate", None) is not None
+
+
+def _unchanged(before: Tuple[Any, ...], now: Tuple[Any, ...]) -> bool:
+    # Each item is a list's length (shallow lists) or a tuple of the items it held.
+    for old, new in zip(before, now):
+        if type(old) is int:
+            if old != new:
+                return False
+        elif len(old) != len(new) or not all(map(is_, old, new)):
+            return False
+    return True
+
+
+def _children(value: object) -> Iterator[Memoized]:
+    if _is_memoized(value):
+        yield value  # type: ignore
+    elif isinstance(value, list):
+        for item in value:
+            if _is_memoized(item):
+                yield item
+
+
+class Memoized:
+    """
+    Mixin memoizing the serialization of an event component. Assigning any attribute of
+    the component invalidates it and, through the components holding it, every cached
+    serialization it is part of (e.g. a spot invalidates its match). Components held
+    directly or in a list (e.g. a round's config, a match's spots) are tracked.
+
+    A cache hit checks that the component's lists still hold the same items, so items
+    appended, removed or replaced in place (lst[i] = x) are noticed.
+    """
+
+    _memo_shallow: Tuple[str, ...] = ()
+    """ List attributes whose items don't affect the serialization, only their count. """
+
+    _memo_lists: Tuple[str, ...] = ()
+    """ Names of the attributes currently holding a list. """
+
+    _memo_adopted: Tuple[Any, ...] = ()
+    """ State of those lists when their items were last tracked, see _memo_state. """
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        if name.startswith("_memo"):
+            return
+        if isinstance(value, list):
+            if name not in self._memo_lists:
+                object.__setattr__(self, "_memo_lists", self._memo_lists + (name,))
+        elif name in self._memo_lists:
+            lists = tuple(n for n in self._memo_lists if n != name)
+            object.__setattr__(self, "_memo_lists", lists)
+        if name not in self._memo_shallow:
+            for child in _children(value):
+                child._memo_adopt(self)
+        if isinstance(value, list):
+            object.__setattr__(self, "_memo_adopted", self._memo_state())
+        self._memo_invalidate()
+
+    def _memo_adopt(self, parent: Memoized) -> None:
+        parents = self.__dict__.get("_memo_parents")
+        if parents is None:
+            parents = weakref.WeakSet()
+            object.__setattr__(self, "_memo_parents", parents)
+        parents.add(parent)
+
+    def _memo_invalidate(self) -> None:
+        """
+        Drops the cached serialization of this component and of every component holding it.
+        """
+        self.__dict__.pop("_memo_cache", None)
+        parents = self.__dict__.get("_memo_parents")
+        if parents:
+            for parent in list(parents):
+                parent._memo_invalidate()
+
+    def _memo_state(self) -> Tuple[Any, ...]:
+        # The items themselves are kept rather than their id, which could be reused once
+        # a replaced item is freed.
+        attributes = self.__dict__
+        return tuple(
+            len(attributes[name]) if name in self._memo_shallow else tuple(attributes[name])  # type: ignore
+            for name in self._memo_lists
+        )
+
+    def _memoized(self, build: Callable[[], T]) -> T:
+        """
+        Returns the result of build, reusing the previous one if nothing changed since.
+
+        NOTE: The result is shared between calls, so callers must not mutate it.
+        """
+        state = self._memo_state() if self._memo_lists else ()
+        cached = self.__dict__.get("_memo_cache")
+        if cached is not None and _unchanged(cached[0], state):
+            return cached[1]
+        if not _unchanged(self._memo_adopted, state):
+            # Lists changed since they were assigned, track their current items.
+            for name in self._memo_lists:
+                if name not in self._memo_shallow:
+                    for child in _children(self.__dict__[name]):
+                        child._memo_adopt(self)
+            object.__setattr__(self, "_memo_adopted", state)
+        value = build()
+        object.__setattr__(self, "_memo_cache", (state, value))
+        return value
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+
+@dataclass
+class RegistrationResult(Generic[T]):
+    item: T
+    """ The participant/team that was registered, as passed in. """
+    success: bool
+    status_code: Optional[int] = None
+    """ Status code of the last response, None if the item wasn't sent or no response came. """
+    error: Optional[str] = None
+
+
+@dataclass
+class RegistrationReport(Generic[T]):
+    results: List[RegistrationResult[T]] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[RegistrationResult[T]]:
+        return [result for result in self.results if result.success]
+
+    @property
+    def failed(self) -> List[RegistrationResult[T]]:
+        return [result for result in self.results if not result.success]
+
+    @property
+    def all_succeeded(self) -> bool:
+        return all(result.success for result in self.results)
+
+
+def _register(
+    item: T,
+    post: Callable[[T], requests.Response],
+    validate: Optional[Callable[[T], Optional[str]]],
+) -> RegistrationResult[T]:
+    result = RegistrationResult(item=item, success=False)
+    if validate is not None:
+        result.error = validate(item)
+        if result.error is not None:
+            return result
+    try:
+        response = post(item)
+    except requests.RequestException as e:
+        result.error = str(e)
+        return result
+    result.status_code = response.status_code
+    result.success = response.ok
+    if not response.ok:
+        result.error = response.text
+    return result
+
+
+def dispatch_registrations(
+    items: Sequence[T],
+    post: Callable[[T], requests.Response],
+    validate: Optional[Callable[[T], Optional[str]]] = None,
+    max_workers: int = 8,
+) -> RegistrationReport[T]:
+    """
+    Registers items in parallel. Retrying transient failures is left to post, e.g. a
+    NadeoHttpClient().post(..., retry=True), which follows the client's RetryPolicy.
+
+    :param items: The items to register.
+    :param post: Sends the registration request for one item.
+    :param validate: Returns an error message for items which must not be sent, None otherwise.
+    :param max_workers: Maximum number of registrations in flight at once.
+    :returns: A report with one result per item, in the same order as items.
+    """
+    if not items:
+        return RegistrationReport()
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)), thread_name_prefix="nadeo-register"
+    ) as executor:
+        results = list(
+            executor.map(lambda item: _register(item, post, validate), items)
+        )
+    return RegistrationReport(results=results)
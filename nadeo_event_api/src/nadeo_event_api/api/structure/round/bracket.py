@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from .match_spot import (
+    MatchParticipantMatchSpot,
+    QualificationMatchSpot,
+    SeedMatchSpot,
+    TeamMatchSpot,
+)
+from .round import Round
+
+MatchKey = Tuple[int, int]
+""" (round position, match position) """
+
+OutcomeKey = Tuple[int, int, int]
+""" (round position, match position, rank) """
+
+SpotKey = Tuple[int, int, int]
+""" (round position, match position, spot index) """
+
+
+class BracketGraph:
+    def __init__(self, rounds: List[Round]):
+        """
+        Compiles the rounds of an event into the graph of its matches: which match outcome
+        (round, match, rank) feeds which spot, and which matches each match depends on. The
+        graph is built and validated in a single pass over the spots, in round order.
+
+        Errors found:
+        - references to a round, match or rank which doesn't exist
+        - references to the same or a later round (which would make a cycle)
+        - an outcome, seed or qualifier rank feeding more than one spot
+        - matches with more spots than their round's max players
+        - rounds starting before a round they depend on has ended
+        - qualification spots referencing a round without a qualifier, or starting before it ended
+
+        :param rounds: The rounds of the event, in order.
+        """
+        self._rounds = rounds
+        self.consumers: Dict[OutcomeKey, SpotKey] = {}
+        """ Match outcome -> the spot it fills. """
+        self.upstream: Dict[MatchKey, List[MatchKey]] = {}
+        """ Match -> the matches whose outcomes fill its spots, without duplicates. """
+        self.errors: List[str] = []
+        self._compile()
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def consumer_of(self, round: int, match: int, rank: int) -> Optional[SpotKey]:
+        """
+        Returns the spot filled by a match outcome, None if the participant doesn't advance.
+        """
+        return self.consumers.get((round, match, rank))
+
+    def _compile(self) -> None:
+        rounds = self._rounds
+        errors = self.errors
+        # Seeds and qualifier ranks may be reused by later rounds, but only once per round.
+        for round_idx, round in enumerate(rounds):
+            seeds_used: Dict[Tuple[type, int], SpotKey] = {}
+            max_players = round._config._max_players
+            for match_idx, match in enumerate(round._matches):
+                key = (round_idx, match_idx)
+                upstream = self.upstream[key] = []
+                if len(match._spots) > max_players:
+                    errors.append(
+                        f"Round {round_idx} match {match_idx} has {len(match._spots)} spots but the round allows {max_players} players."
+                    )
+                for spot_idx, spot in enumerate(match._spots):
+                    spot_key = (round_idx, match_idx, spot_idx)
+                    where = f"Round {round_idx} match {match_idx} spot {spot_idx}"
+                    if isinstance(spot, MatchParticipantMatchSpot):
+                        error = self._add_outcome(round_idx, spot, spot_key, upstream)
+                        if error is not None:
+                            errors.append(f"{where} {error}")
+                    elif isinstance(spot, (SeedMatchSpot, TeamMatchSpot)):
+                        previous = seeds_used.setdefault(
+                            (type(spot), spot._seed), spot_key
+                        )
+                        if previous != spot_key:
+                            errors.append(
+                                f"{where} uses seed {spot._seed}, already used by round {previous[0]} match {previous[1]} spot {previous[2]}."
+                            )
+                    elif isinstance(spot, QualificationMatchSpot):
+                        previous = seeds_used.setdefault(
+                            (type(spot), spot._round_position, spot._rank), spot_key  # type: ignore
+                        )
+                        if previous != spot_key:
+                            errors.append(
+                                f"{where} uses qualifier rank {spot._rank}, already used by round {previous[0]} match {previous[1]} spot {previous[2]}."
+                            )
+                        error = self._check_qualifier(round_idx, spot)
+                        if error is not None:
+                            errors.append(f"{where} {error}")
+
+    def _add_outcome(
+        self,
+        round_idx: int,
+        spot: MatchParticipantMatchSpot,
+        spot_key: SpotKey,
+        upstream: List[MatchKey],
+    ) -> Optional[str]:
+        source_round, source_match, rank = (
+            spot._round_position,
+            spot._match_position,
+            spot._rank,
+        )
+        if source_round >= round_idx or source_round < 0:
+            return f"references round {source_round}, but may only reference earlier rounds."
+        matches = self._rounds[source_round]._matches
+        if not 0 <= source_match < len(matches):
+            return f"references round {source_round} match {source_match}, which doesn't exist."
+        if not 1 <= rank <= len(matches[source_match]._spots):
+            return f"references rank {rank} of round {source_round} match {source_match}, which only has {len(matches[source_match]._spots)} spots."
+        if self._rounds[source_round]._end_date > self._rounds[round_idx]._start_date:
+            return f"depends on round {source_round}, which ends after round {round_idx} starts."
+
+        outcome = (source_round, source_match, rank)
+        previous = self.consumers.setdefault(outcome, spot_key)
+        if previous != spot_key:
+            return f"uses rank {rank} of round {source_round} match {source_match}, already used by round {previous[0]} match {previous[1]} spot {previous[2]}."
+        if (source_round, source_match) not in upstream:
+            upstream.append((source_round, source_match))
+        return None
+
+    def _check_qualifier(
+        self, round_idx: int, spot: QualificationMatchSpot
+    ) -> Optional[str]:
+        position = spot._round_position
+        if not 0 <= position <= round_idx:
+            return f"references the qualifier of round {position}, but may only reference this or earlier rounds."
+        qualifier = self._rounds[position]._qualifier
+        if qualifier is None:
+            return f"references the qualifier of round {position}, which has none."
+        if qualifier._end_date > self._rounds[round_idx]._start_date:
+            return f"depends on the qualifier of round {position}, which ends after round {round_idx} starts."
+        return None
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple, Union
+
+from .match import Match
+from .match_spot import MatchParticipantMatchSpot, MatchSpot, SeedMatchSpot
+from .round import Round, RoundConfig
+
+# Generators of common competition formats return the matches of every round (a list of
+# rounds, each a list of matches), ready for rounds_from_matches. Outcome references are
+# numbered from round_offset, the position of the first generated round in the event.
+
+# Irreducible polynomials used to build GF(2^e), as bit masks.
+_GF2_POLYNOMIALS = {2: 0b111, 3: 0b1011, 4: 0b10011, 5: 0b100101, 6: 0b1000011}
+
+
+def rounds_from_matches(
+    matches: List[List[Match]],
+    start_date: datetime,
+    round_duration: timedelta,
+    config: Union[RoundConfig, Callable[[int], RoundConfig]],
+    name_fmt: str = "Round {}",
+    gap: timedelta = timedelta(minutes=5),
+) -> List[Round]:
+    """
+    Turns generated matches into back to back rounds.
+
+    :param matches: The matches of each round, e.g. from single_elimination.
+    :param start_date: Start of the first round.
+    :param round_duration: Duration of each round.
+    :param config: Config of every round, or a function returning the config of each round index.
+    :param name_fmt: Round names, formatted with the round number (starting at 1).
+    :param gap: Time between the end of a round and the start of the next.
+    """
+    rounds = []
+    for index, round_matches in enumerate(matches):
+        round_start = start_date + index * (round_duration + gap)
+        rounds.append(
+            Round(
+                name=name_fmt.format(index + 1),
+                start_date=round_start,
+                end_date=round_start + round_duration,
+                matches=round_matches,
+                config=config(index) if callable(config) else config,
+            )
+        )
+    return rounds
+
+
+def bracket_order(size: int, branching: int = 2) -> List[int]:
+    """
+    Returns the seeds (starting at 1) of size bracket slots, so that when groups of
+    branching consecutive slots merge every round, the best seeds meet as late as possible.
+    E.g. bracket_order(4) == [1, 4, 2, 3].
+
+    :raises ValueError: If size isn't a power of branching.
+    """
+    order = [1]
+    while len(order) < size:
+        length = len(order)
+        order = [
+            x + j * length if j % 2 == 0 else (j + 1) * length + 1 - x
+            for x in order
+            for j in range(branching)
+        ]
+    if len(order) != size:
+        raise ValueError(f"{size} isn't a power of {branching}.")
+    return order
+
+
+def snake_groups(num_players: int, num_groups: int) -> List[List[int]]:
+    """
+    Splits seeds 1..num_players into groups in snake order: 1..n left to right, then n+1..2n
+    right to left, and so on, which balances the seeds of each group.
+    """
+    groups: List[List[int]] = [[] for _ in range(num_groups)]
+    for index in range(num_players):
+        tier, slot = divmod(index, num_groups)
+        groups[slot if tier % 2 == 0 else num_groups - 1 - slot].append(index + 1)
+    return groups
+
+
+def group_matches(
+    num_players: int,
+    group_size: int,
+    spot: Callable[[int], MatchSpot] = SeedMatchSpot,
+) -> List[List[Match]]:
+    """
+    Returns a single round of snake-seeded groups of group_size players.
+
+    :param spot: Builds the spot of a seed, e.g. lambda seed: QualificationMatchSpot(0, seed).
+    """
+    num_groups = -(-num_players // group_size)
+    return [
+        [
+            Match(spots=[spot(seed) for seed in group])
+            for group in snake_groups(num_players, num_groups)
+        ]
+    ]
+
+
+def single_elimination(
+    num_players: int,
+    match_size: int = 2,
+    advance: int = 0,
+    spot: Callable[[int], MatchSpot] = SeedMatchSpot,
+    round_offset: int = 0,
+) -> List[List[Match]]:
+    """
+    Returns a single elimination bracket where the top advance players of each match move
+    on, until a final match. The first round is seeded so that the best seeds meet last.
+
+    :param num_players: Number of players, must be match_size * (match_size / advance) ** n.
+    :param match_size: Players per match.
+    :param advance: Players advancing from each match. Defaults to half of match_size.
+    :param spot: Builds the first round spot of a seed, e.g. lambda seed: QualificationMatchSpot(0, seed).
+    :param round_offset: Position in the event of the first generated round.
+    :raises ValueError: If the sizes don't form a complete bracket.
+    """
+    advance = advance or match_size // 2
+    if advance < 1 or match_size % advance != 0 or match_size == advance:
+        raise ValueError("advance must divide match_size and be smaller than it.")
+    branching = match_size // advance
+    num_matches = num_players // match_size
+    if num_matches * match_size != num_players:
+        raise ValueError(
+            f"{num_players} players can't be split into matches of {match_size}."
+        )
+    order = bracket_order(num_matches, branching)
+
+    rounds = [
+        [
+            Match(
+                spots=[
+                    spot(
+                        tier * num_matches + s
+                        if tier % 2 == 0
+                        else (tier + 1) * num_matches + 1 - s
+                    )
+                    for tier in range(match_size)
+                ]
+            )
+            for s in order
+        ]
+    ]
+    while num_matches > 1:
+        previous = round_offset + len(rounds) - 1
+        num_matches //= branching
+        rounds.append(
+            [
+                Match(
+                    spots=[
+                        MatchParticipantMatchSpot(
+                            previous, match * branching + source, rank
+                        )
+                        for rank in range(1, advance + 1)
+                        for source in range(branching)
+                    ]
+                )
+                for match in range(num_matches)
+            ]
+        )
+    return rounds
+
+
+def double_elimination(
+    num_players: int,
+    spot: Callable[[int], MatchSpot] = SeedMatchSpot,
+    round_offset: int = 0,
+) -> List[List[Match]]:
+    """
+    Returns a 1v1 double elimination bracket: an upper bracket, a lower bracket fed by the
+    losers of the upper one, and a grand final between the winners of both. Each round holds
+    the upper bracket round and the lower bracket round that can be played alongside it.
+
+    :param num_players: Number of players, a power of 2 (at least 4).
+    :raises ValueError: If num_players isn't a power of 2 of at least 4.
+    """
+    if num_players < 4 or num_players & (num_players - 1):
+        raise ValueError("Double elimination needs a power of 2 of at least 4 players.")
+    upper = single_elimination(num_players, 2, 1, spot, round_offset)
+    num_upper = len(upper)
+    rounds: List[List[Match]] = [list(matches) for matches in upper]
+    # Where each bracket's matches sit: (round index, match position) by bracket round.
+    upper_positions = [[(r, m) for m in range(len(upper[r]))] for r in range(num_upper)]
+    lower_positions: List[List[Tuple[int, int]]] = []
+
+    def add(round_index: int, match: Match) -> Tuple[int, int]:
+        while len(rounds) <= round_index:
+            rounds.append([])
+        rounds[round_index].append(match)
+        return round_index, len(rounds[round_index]) - 1
+
+    def ref(position: Tuple[int, int], rank: int) -> MatchParticipantMatchSpot:
+        return MatchParticipantMatchSpot(round_offset + position[0], position[1], rank)
+
+    # Lower round 1: losers of upper round 1, paired.
+    first_losers = upper_positions[0]
+    lower_positions.append(
+        [
+            add(
+                1,
+                Match(
+                    spots=[ref(first_losers[2 * i], 2), ref(first_losers[2 * i + 1], 2)]
+                ),
+            )
+            for i in range(len(first_losers) // 2)
+        ]
+    )
+    for upper_round in range(1, num_upper):
+        # Drop-in round: lower winners against the losers of the next upper round, in
+        # alternating order to delay rematches.
+        losers = upper_positions[upper_round]
+        if upper_round % 2 == 1:
+            losers = list(reversed(losers))
+        previous = lower_positions[-1]
+        round_index = 2 * upper_round
+        lower_positions.append(
+            [
+                add(round_index, Match(spots=[ref(previous[i], 1), ref(losers[i], 2)]))
+                for i in range(len(previous))
+            ]
+        )
+        if len(lower_positions[-1]) > 1:
+            # Consolidation round: lower winners paired.
+            previous = lower_positions[-1]
+            lower_positions.append(
+                [
+                    add(
+                        round_index + 1,
+                        Match(
+                            spots=[ref(previous[2 * i], 1), ref(previous[2 * i + 1], 1)]
+                        ),
+                    )
+                    for i in range(len(previous) // 2)
+                ]
+            )
+
+    rounds.append(
+        [Match(spots=[ref(upper_positions[-1][0], 1), ref(lower_positions[-1][0], 1)])]
+    )
+    return rounds
+
+
+def swiss(
+    num_players: int,
+    num_rounds: int,
+    match_size: int = 2,
+    spot: Callable[[int], MatchSpot] = SeedMatchSpot,
+    round_offset: int = 0,
+) -> List[List[Match]]:
+    """
+    Returns a Swiss system pre-wired by record: after each round, players are grouped by the
+    sum of their ranks so far, and each group is split into matches, top half against bottom
+    half. For pairings that avoid rematches from actual results, see swiss_pairing.
+
+    :param num_players: Number of players.
+    :param num_rounds: Number of rounds.
+    :param match_size: Players per match.
+    :raises ValueError: If some record group can't be split into full matches.
+    """
+    # A slot is a future player: a seed, or the outcome (round, match, rank) of a match.
+    slots: Dict[int, List[Callable[[], MatchSpot]]] = {
+        0: [lambda seed=seed: spot(seed) for seed in range(1, num_players + 1)]
+    }
+    rounds: List[List[Match]] = []
+    for round_index in range(num_rounds):
+        matches: List[Match] = []
+        next_slots: Dict[int, List[Callable[[], MatchSpot]]] = {}
+        for record in sorted(slots):
+            group = slots[record]
+            if len(group) % match_size:
+                raise ValueError(
+                    f"Round {round_index + 1} has {len(group)} players with the same record, which can't be split into matches of {match_size}."
+                )
+            num_matches = len(group) // match_size
+            for match in range(num_matches):
+                position = len(matches)
+                matches.append(
+                    Match(
+                        spots=[
+                            group[tier * num_matches + match]()
+                            for tier in range(match_size)
+                        ]
+                    )
+                )
+                for rank in range(1, match_size + 1):
+                    next_slots.setdefault(record + rank, []).append(
+                        lambda p=position, r=rank, i=round_index: MatchParticipantMatchSpot(
+                            round_offset + i, p, r
+                        )
+                    )
+        rounds.append(matches)
+        slots = next_slots
+    return rounds
+
+
+def _galois_field(
+    order: int,
+) -> Tuple[Callable[[int, int], int], Callable[[int, int], int]]:
+    prime = next(p for p in range(2, order + 1) if order % p == 0)
+    exponent, rest = 0, order
+    while rest % prime == 0:
+        rest //= prime
+        exponent += 1
+    if rest != 1:
+        raise ValueError(f"{order} isn't a prime power.")
+    if exponent == 1:
+        return (lambda a, b: (a + b) % order), (lambda a, b: (a * b) % order)
+    if prime != 2 or exponent not in _GF2_POLYNOMIALS:
+        raise ValueError(
+            f"Match size {order} isn't supported, use a prime or 4, 8, 16, 32 or 64."
+        )
+    polynomial = _GF2_POLYNOMIALS[exponent]
+
+    def multiply(a: int, b: int) -> int:
+        product = 0
+        while b:
+            if b & 1:
+                product ^= a
+            b >>= 1
+            a <<= 1
+            if a & order:
+                a ^= polynomial
+        return product
+
+    return (lambda a, b: a ^ b), multiply
+
+
+def round_robin(
+    num_players: int,
+    match_size: int = 2,
+    spot: Callable[[int], MatchSpot] = SeedMatchSpot,
+) -> List[List[Match]]:
+    """
+    Returns rounds in which every pair of players meets exactly once, each player playing
+    once per round.
+
+    - 1v1: the circle method, num_players - 1 rounds (num_players rounds with a bye each if
+      num_players is odd).
+    - Larger matches: the parallel classes of the affine plane over GF(match_size), which
+      needs num_players == match_size ** 2 and match_size a prime power, and gives
+      match_size + 1 rounds (e.g. 16 players, 5 rounds of 4 matches of 4). Players are
+      numbered so that the first round is made of snake-seeded groups (see snake_groups).
+
+    :param spot: Builds the spot of a seed, e.g. lambda seed: QualificationMatchSpot(0, seed).
+    :raises ValueError: If no such schedule can be built for these sizes.
+    """
+    if match_size == 2:
+        players = num_players + num_players % 2
+        rounds = []
+        for r in range(players - 1):
+            pairs = [(players - 1, r)] + [
+                ((r + i) % (players - 1), (r - i) % (players - 1))
+                for i in range(1, players // 2)
+            ]
+            rounds.append(
+                [
+                    Match(spots=[spot(a + 1), spot(b + 1)])
+                    for a, b in pairs
+                    if a < num_players and b < num_players
+                ]
+            )
+        return rounds
+
+    if num_players != match_size**2:
+        raise ValueError(
+            f"A round robin of matches of {match_size} needs {match_size ** 2} players."
+        )
+    add, multiply = _galois_field(match_size)
+    q = match_size
+    lines = [
+        [
+            [x * q + add(multiply(slope, x), intercept) for x in range(q)]
+            for intercept in range(q)
+        ]
+        for slope in range(q)
+    ]
+    lines.append([[x * q + y for y in range(q)] for x in range(q)])
+    seeds = {
+        player: seed
+        for line, group in zip(lines[0], snake_groups(num_players, q))
+        for player, seed in zip(line, group)
+    }
+    return [
+        [Match(spots=[spot(seeds[player]) for player in line]) for line in parallel]
+        for parallel in lines
+    ]
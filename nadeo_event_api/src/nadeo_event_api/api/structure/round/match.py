@@ -1,9 +1,10 @@
 from typing import List
 
+from ..memoized import Memoized
 from .match_spot import MatchSpot
 
 
-class Match:
+class Match(Memoized):
     def __init__(
         self,
         spots: List[MatchSpot],
@@ -13,6 +14,9 @@ class Match:
         self._settings = settings
 
     def as_jsonable_dict(self) -> dict:
+        return self._memoized(self._build_jsonable_dict)
+
+    def _build_jsonable_dict(self) -> dict:
         match = {}
         match["spots"] = [spot.as_jsonable_dict() for spot in self._spots]  # type: ignore
         match["settings"] = self._settings
@@ -1,9 +1,13 @@
 from abc import ABC
 
 from ..enums import SpotType
+from ..memoized import Memoized
 
 
-class MatchSpot(ABC):
+class MatchSpot(Memoized, ABC):
+    # Spots are cheap to serialize, so they aren't cached themselves: being Memoized only
+    # lets changing one invalidate the match holding it.
+
     def __init__(
         self,
         spot_type: SpotType,
@@ -13,6 +13,7 @@ from ...structure.settings.script_settings import (
 )
 from ....constants import NADEO_DATE_FMT
 from ...structure.maps import Map
+from ..memoized import Memoized
 from ...structure.enums import (
     LeaderboardType,
     PluginType,
@@ -20,7 +21,7 @@ from ...structure.enums import (
 )
 
 
-class QualifierConfig:
+class QualifierConfig(Memoized):
     def __init__(
         self,
         map_pool: List[Map],
@@ -40,6 +41,9 @@ class QualifierConfig:
         self._plugin_settings = plugin_settings
 
     def as_jsonable_dict(self) -> dict:
+        return self._memoized(self._build_jsonable_dict)
+
+    def _build_jsonable_dict(self) -> dict:
         config = {}
         config["maps"] = [map._uuid for map in self._map_pool]
         config["script"] = self._script.value
@@ -53,7 +57,7 @@ class QualifierConfig:
 
 # TODO this shares a lot with round, minus matches and qualifier
 # so find some way to consolidate that
-class Qualifier:
+class Qualifier(Memoized):
     def __init__(
         self,
         name: str,
@@ -70,8 +74,12 @@ class Qualifier:
 
     def as_jsonable_dict(self) -> dict:
         """
-        Returns the qualifier as a JSON-able dictionary.
+        Returns the qualifier as a JSON-able dictionary. It is reused until the qualifier
+        changes, so it must not be mutated.
         """
+        return self._memoized(self._build_jsonable_dict)
+
+    def _build_jsonable_dict(self) -> dict:
         qualifier = {}
         qualifier["name"] = self._name
         qualifier["startDate"] = self._start_date.strftime(NADEO_DATE_FMT)
@@ -79,8 +87,7 @@ class Qualifier:
         qualifier["leaderboardType"] = self._leaderboard_type.value
         qualifier["position"] = 0
         qualifier["id"] = None
-        qualifier["config"] = self._config.as_jsonable_dict()
-        qualifier["config"]["name"] = self._name
+        qualifier["config"] = {**self._config.as_jsonable_dict(), "name": self._name}
         qualifier["isQualification"] = True
         return qualifier
 
@@ -11,11 +11,12 @@ from ..enums import (
     ScriptType,
 )
 from ..maps import Map
+from ..memoized import Memoized
 from ...structure.settings.plugin_settings import ClassicPluginSettings, PluginSettings
 from ...structure.settings.script_settings import CupScriptSettings, ScriptSettings
 
 
-class RoundConfig:
+class RoundConfig(Memoized):
     def __init__(
         self,
         map_pool: List[Map],
@@ -36,8 +37,12 @@ class RoundConfig:
 
     def as_jsonable_dict(self) -> dict:
         """
-        Returns the round config as a JSON-able dictionary.
+        Returns the round config as a JSON-able dictionary. It is reused until the config
+        changes, so it must not be mutated.
         """
+        return self._memoized(self._build_jsonable_dict)
+
+    def _build_jsonable_dict(self) -> dict:
         config = {}
         config["maps"] = [map._uuid for map in self._map_pool]
         config["script"] = self._script.value
@@ -49,7 +54,11 @@ class RoundConfig:
         return config
 
 
-class Round:
+class Round(Memoized):
+    # Only the number of matches is part of the round's dict, the matches themselves
+    # are serialized in the spot structure.
+    _memo_shallow = ("_matches",)
+
     def __init__(
         self,
         name: str,
@@ -72,16 +81,19 @@ class Round:
 
     def as_jsonable_dict(self) -> dict:
         """
-        Returns the round as a JSON-able dictionary.
+        Returns the round as a JSON-able dictionary. It is reused until the round changes,
+        so it must not be mutated.
         """
+        return self._memoized(self._build_jsonable_dict)
+
+    def _build_jsonable_dict(self) -> dict:
         round = {}
         round["name"] = self._name
         round["startDate"] = self._start_date.strftime(NADEO_DATE_FMT)
         round["endDate"] = self._end_date.strftime(NADEO_DATE_FMT)
         round["nbMatches"] = len(self._matches)
         round["leaderboardType"] = self._leaderboard_type.value
-        round["config"] = self._config.as_jsonable_dict()
-        round["config"]["name"] = self._name
+        round["config"] = {**self._config.as_jsonable_dict(), "name": self._name}
         round["qualifier"] = (
             self._qualifier.as_jsonable_dict() if self._qualifier else None
         )
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+import random
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from .bracket import OutcomeKey, SpotKey
+from .match_spot import (
+    CompetitionMatchSpot,
+    MatchParticipantMatchSpot,
+    MatchSpot,
+    QualificationMatchSpot,
+    SeedMatchSpot,
+    TeamMatchSpot,
+)
+from .round import Round
+from .spot_structure import SpotStructure
+
+try:
+    import numpy as np
+except (
+    ImportError
+):  # NumPy is optional, the pure Python path gives the same statistics.
+    np = None
+
+Source = Tuple[int, ...]
+""" Where a spot's player comes from: (SEED, seed), (QUALIFIER, round, rank), (OUTCOME, round, match, rank) or (EMPTY,). """
+
+EMPTY, SEED, QUALIFIER, OUTCOME = range(4)
+NO_PLAYER = -1
+
+
+@dataclass(slots=True, frozen=True)
+class SimulationReport:
+    simulations: int
+    num_players: int
+    reach: List[List[float]]
+    """ reach[round position][seed - 1]: probability that the seed plays in the round. """
+    outcomes: Dict[OutcomeKey, List[float]]
+    """ (round, match, rank) -> probability of each seed (seed - 1) finishing there. """
+    unreachable: List[SpotKey]
+    """ Spots never filled in any simulation. """
+    duplicates: List[SpotKey]
+    """ Spots whose player also played another spot of the same round in some simulation. """
+
+    def outcome_probability(
+        self, round: int, match: int, rank: int, seed: int
+    ) -> float:
+        """
+        Returns the probability that a seed finishes a match at a rank, 0 if the match doesn't exist.
+        """
+        probabilities = self.outcomes.get((round, match, rank))
+        return probabilities[seed - 1] if probabilities is not None else 0.0
+
+
+class BracketSimulator:
+    def __init__(
+        self,
+        structure: Union[SpotStructure, List[Round]],
+        num_players: Optional[int] = None,
+        strengths: Optional[Sequence[float]] = None,
+    ):
+        """
+        Plays a bracket many times offline, to see how seeds flow through it before posting.
+
+        Players are identified by their seed. Each match ranks its players by strength plus
+        Gumbel noise (a Plackett-Luce model), and each qualifier ranks every player the same
+        way. Seed, team and competition spots all resolve to the player with that seed/rank.
+
+        Usage:
+            report = BracketSimulator(event._rounds, num_players=64).run(10_000)
+            report.reach[-1]  # chances of each seed to reach the last round
+            report.unreachable, report.duplicates
+
+        :param structure: The rounds of the event, or their spot structure.
+        :param num_players: Number of players, defaults to the highest seed or qualifier rank referenced.
+        :param strengths: Strength of each seed (seed - 1), in log odds. Defaults to equal strengths, i.e. random outcomes.
+        """
+        rounds = (
+            structure._rounds if isinstance(structure, SpotStructure) else structure
+        )
+        self._matches: List[List[List[Source]]] = [
+            [[self._source(spot) for spot in match._spots] for match in round._matches]
+            for round in rounds
+        ]
+        if num_players is None:
+            num_players = max(
+                (
+                    source[-1]
+                    for round in self._matches
+                    for match in round
+                    for source in match
+                    if source[0] in (SEED, QUALIFIER)
+                ),
+                default=0,
+            )
+        self._num_players = num_players
+        if strengths is not None and len(strengths) != num_players:
+            raise ValueError(f"Expected {num_players} strengths, got {len(strengths)}.")
+        self._strengths = (
+            list(strengths) if strengths is not None else [0.0] * num_players
+        )
+
+    @staticmethod
+    def _source(spot: MatchSpot) -> Source:
+        if isinstance(spot, MatchParticipantMatchSpot):
+            return (OUTCOME, spot._round_position, spot._match_position, spot._rank)
+        if isinstance(spot, QualificationMatchSpot):
+            return (QUALIFIER, spot._round_position, spot._rank)
+        if isinstance(spot, (SeedMatchSpot, TeamMatchSpot)):
+            return (SEED, spot._seed)
+        if isinstance(spot, CompetitionMatchSpot):
+            return (SEED, spot._rank)
+        return (EMPTY,)
+
+    def run(
+        self, simulations: int = 10_000, seed: Optional[int] = None
+    ) -> SimulationReport:
+        """
+        Runs the simulations, all at once with NumPy if it's installed.
+
+        :param simulations: Number of simulations.
+        :param seed: Seed of the random generator, for reproducible reports.
+        """
+        if simulations < 1:
+            raise ValueError("simulations must be at least 1")
+        if np is not None:
+            counts = self._run_numpy(simulations, seed)
+        else:
+            counts = self._run_python(simulations, seed)
+        reach, outcomes, filled, duplicated = counts
+        return SimulationReport(
+            simulations=simulations,
+            num_players=self._num_players,
+            reach=[[count / simulations for count in row] for row in reach],
+            outcomes={
+                key: [count / simulations for count in row]
+                for key, row in outcomes.items()
+            },
+            unreachable=sorted(
+                key for key, is_filled in filled.items() if not is_filled
+            ),
+            duplicates=sorted(
+                key for key, is_duplicated in duplicated.items() if is_duplicated
+            ),
+        )
+
+    def _run_numpy(self, simulations: int, seed: Optional[int]) -> tuple:
+        rng = np.random.default_rng(seed)
+        size = self._num_players
+        # One extra entry so NO_PLAYER (-1) indexes a harmless strength.
+        strengths = np.array(self._strengths + [0.0])
+        qualifiers: Dict[int, np.ndarray] = {}
+        outcomes: Dict[OutcomeKey, np.ndarray] = {}
+        nobody = np.full(simulations, NO_PLAYER, dtype=np.int64)
+
+        def players(source: Source) -> np.ndarray:
+            kind = source[0]
+            if kind == SEED:
+                return np.full(
+                    simulations,
+                    source[1] - 1 if 1 <= source[1] <= size else NO_PLAYER,
+                    dtype=np.int64,
+                )
+            if kind == QUALIFIER:
+                _, round, rank = source
+                if round not in qualifiers:
+                    noisy = strengths[:size] + rng.gumbel(size=(simulations, size))
+                    qualifiers[round] = np.argsort(-noisy, axis=1)
+                return qualifiers[round][:, rank - 1] if 1 <= rank <= size else nobody
+            if kind == OUTCOME:
+                return outcomes.get(source[1:], nobody)
+            return nobody
+
+        reach, outcome_counts, filled, duplicated = [], {}, {}, {}
+        for round_idx, matches in enumerate(self._matches):
+            width = max((len(match) for match in matches), default=0)
+            if width == 0:
+                reach.append([0] * size)
+                continue
+            # (simulation, match, spot) -> player, padded with NO_PLAYER.
+            occupants = np.full(
+                (simulations, len(matches), width), NO_PLAYER, dtype=np.int64
+            )
+            for match_idx, match in enumerate(matches):
+                for spot_idx, source in enumerate(match):
+                    occupants[:, match_idx, spot_idx] = players(source)
+
+            present = occupants >= 0
+            keys = np.where(
+                present,
+                strengths[occupants] + rng.gumbel(size=occupants.shape),
+                -np.inf,
+            )
+            ranked = np.take_along_axis(
+                occupants, np.argsort(-keys, axis=2, kind="stable"), axis=2
+            )
+            for match_idx, match in enumerate(matches):
+                for rank in range(1, len(match) + 1):
+                    outcomes[(round_idx, match_idx, rank)] = ranked[
+                        :, match_idx, rank - 1
+                    ]
+
+            flat = ranked.reshape(simulations, -1)
+            slots = np.arange(flat.shape[1])
+            valid = flat >= 0
+            per_outcome = np.bincount(
+                (flat + slots * size)[valid], minlength=flat.shape[1] * size
+            ).reshape(len(matches), width, size)
+            for match_idx, match in enumerate(matches):
+                for rank in range(1, len(match) + 1):
+                    outcome_counts[(round_idx, match_idx, rank)] = per_outcome[
+                        match_idx, rank - 1
+                    ].tolist()
+            reach.append(per_outcome.sum(axis=(0, 1)).tolist())
+
+            spots = occupants.reshape(simulations, -1)
+            order = np.argsort(spots, axis=1, kind="stable")
+            in_order = np.take_along_axis(spots, order, axis=1)
+            same = (in_order[:, 1:] == in_order[:, :-1]) & (in_order[:, 1:] >= 0)
+            repeated = np.zeros(spots.shape, dtype=bool)
+            repeated[:, 1:] |= same
+            repeated[:, :-1] |= same
+            spot_repeated = np.zeros(spots.shape, dtype=bool)
+            np.put_along_axis(spot_repeated, order, repeated, axis=1)
+            spot_repeated = spot_repeated.any(axis=0).reshape(len(matches), width)
+            spot_filled = present.any(axis=0)
+            for match_idx, match in enumerate(matches):
+                for spot_idx in range(len(match)):
+                    filled[(round_idx, match_idx, spot_idx)] = bool(
+                        spot_filled[match_idx, spot_idx]
+                    )
+                    duplicated[(round_idx, match_idx, spot_idx)] = bool(
+                        spot_repeated[match_idx, spot_idx]
+                    )
+        return reach, outcome_counts, filled, duplicated
+
+    def _run_python(self, simulations: int, seed: Optional[int]) -> tuple:
+        rng = random.Random(seed)
+        size = self._num_players
+        strengths = self._strengths
+
+        def gumbel() -> float:
+            return -math.log(max(rng.expovariate(1.0), 1e-300))
+
+        reach = [[0] * size for _ in self._matches]
+        outcome_counts: Dict[OutcomeKey, List[int]] = {
+            (round_idx, match_idx, rank): [0] * size
+            for round_idx, matches in enumerate(self._matches)
+            for match_idx, match in enumerate(matches)
+            for rank in range(1, len(match) + 1)
+        }
+        filled = {
+            (round_idx, match_idx, spot_idx): False
+            for round_idx, matches in enumerate(self._matches)
+            for match_idx, match in enumerate(matches)
+            for spot_idx in range(len(match))
+        }
+        duplicated = dict(filled)
+
+        for _ in range(simulations):
+            qualifiers: Dict[int, List[int]] = {}
+            outcomes: Dict[OutcomeKey, int] = {}
+
+            def player(source: Source) -> int:
+                kind = source[0]
+                if kind == SEED:
+                    return source[1] - 1 if 1 <= source[1] <= size else NO_PLAYER
+                if kind == QUALIFIER:
+                    _, round, rank = source
+                    if round not in qualifiers:
+                        noisy = [strengths[p] + gumbel() for p in range(size)]
+                        qualifiers[round] = sorted(range(size), key=lambda p: -noisy[p])
+                    return (
+                        qualifiers[round][rank - 1] if 1 <= rank <= size else NO_PLAYER
+                    )
+                if kind == OUTCOME:
+                    return outcomes.get(source[1:], NO_PLAYER)
+                return NO_PLAYER
+
+            for round_idx, matches in enumerate(self._matches):
+                spots_of: Dict[int, List[SpotKey]] = {}
+                for match_idx, match in enumerate(matches):
+                    occupants = []
+                    for spot_idx, source in enumerate(match):
+                        p = player(source)
+                        if p != NO_PLAYER:
+                            filled[(round_idx, match_idx, spot_idx)] = True
+                            spots_of.setdefault(p, []).append(
+                                (round_idx, match_idx, spot_idx)
+                            )
+                            occupants.append((strengths[p] + gumbel(), p))
+                    occupants.sort(key=lambda occupant: -occupant[0])
+                    for rank, (_, p) in enumerate(occupants, 1):
+                        outcomes[(round_idx, match_idx, rank)] = p
+                        outcome_counts[(round_idx, match_idx, rank)][p] += 1
+                        reach[round_idx][p] += 1
+                for keys in spots_of.values():
+                    if len(keys) > 1:
+                        for key in keys:
+                            duplicated[key] = True
+        return reach, outcome_counts, filled, duplicated
@@ -1,10 +1,11 @@
 from abc import ABC
 
 from ...structure.enums import AutoStartMode
+from ..memoized import Memoized
 
 
 # TODO add all these settings https://doc.trackmania.com/club/competition-tool/plugin-settings/
-class PluginSettings(ABC):
+class PluginSettings(Memoized, ABC):
     def __init__(
         self,
         ad_image_urls="",
@@ -92,7 +93,7 @@ class TMWTPluginSettings(ClassicPluginSettings):
         use_auto_ready: bool = True,
         ready_minimum_team_size: int = 2,
         pick_ban_use_gamepad_version: bool = True,
-        enable_ready_manager: bool = True
+        enable_ready_manager: bool = True,
     ):
         super().__init__(
             ad_image_urls=ad_image_urls,
@@ -111,5 +112,5 @@ class TMWTPluginSettings(ClassicPluginSettings):
     def as_jsonable_dict(self) -> dict:
         plugin_settings = super().as_jsonable_dict()
         plugin_settings["S_ReadyMinimumTeamSize"] = self._ready_minimum_team_size
-        
+
         return plugin_settings
@@ -4,11 +4,12 @@ from typing import Dict, Optional
 from nadeo_event_api.objects.outbound.settings.pick_ban_style import PickBanStyle
 
 from ...structure.enums import RespawnBehavior
+from ..memoized import Memoized
 
 # Nadeo api documentation: https://wiki.trackmania.io/en/dedicated-server/Usage/OfficialGameModesSettings
 
 
-class BaseScriptSettings:
+class BaseScriptSettings(Memoized):
     def __init__(
         self,
         chat_time: int = 10,
@@ -39,7 +40,7 @@ class BaseScriptSettings:
         self._pick_ban_enable = pick_ban_enable
 
 
-class BaseTMWTScriptSettings:
+class BaseTMWTScriptSettings(Memoized):
     def __init__(
         self,
         base_script_settings: BaseScriptSettings = BaseScriptSettings(),
@@ -59,9 +60,9 @@ class BaseTMWTScriptSettings:
         self._teams_url = teams_url
         self._match_points_limit = match_points_limit
         self._match_info = match_info
-        
 
-class ScriptSettings(ABC):
+
+class ScriptSettings(Memoized, ABC):
     def __init__(self, base_script_settings: BaseScriptSettings = BaseScriptSettings()):
         """
         Declares the list of script settings to use in a round.
@@ -92,9 +93,12 @@ class ScriptSettings(ABC):
 
         return script_settings
 
+
 class TMWTScriptSettings(ScriptSettings):
-    def __init__(self, tmwt_script_settings: BaseTMWTScriptSettings = BaseTMWTScriptSettings()) -> None:
-        """Declares TMWT script settings shared by all TMWT game modes. 
+    def __init__(
+        self, tmwt_script_settings: BaseTMWTScriptSettings = BaseTMWTScriptSettings()
+    ) -> None:
+        """Declares TMWT script settings shared by all TMWT game modes.
 
         Args:
             tmwt_script_settings (BaseTMWTScriptSettings, optional): The base TMWT script settings to use. Defaults to BaseTMWTScriptSettings().
@@ -108,12 +112,15 @@ class TMWTScriptSettings(ScriptSettings):
         # NOTE: THIS WILL BREAK AND REJECT POSTING THE EVENT IF YOU PUT "" FOR THIS VALUE
         if self._tmwt_script_settings._teams_url is not None:
             script_settings["S_TeamsUrl"] = self._tmwt_script_settings._teams_url
-        
-        script_settings["S_MatchPointsLimit"] = self._tmwt_script_settings._match_points_limit
+
+        script_settings[
+            "S_MatchPointsLimit"
+        ] = self._tmwt_script_settings._match_points_limit
         script_settings["S_MatchInfo"] = self._tmwt_script_settings._match_info
 
         return script_settings
 
+
 class ChampionScriptSettings(ScriptSettings):
     def __init__(
         self,
@@ -661,4 +668,4 @@ class TMWT2025ScriptSettings(TMWTScriptSettings):
         script_settings["S_ApiCompetitionUid"] = self._api_competition_uid
         script_settings["S_ApiAuthorizationHeader"] = self._api_authorization_header
 
-        return script_settings
\ No newline at end of file
+        return script_settings
@@ -0,0 +1,495 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from enum import Enum
+import functools
+import inspect
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from ..codec import get_codec
+from .enums import LeaderboardType, ParticipantType, PluginType, ScriptType
+from .event import Event
+from .maps import Map
+from .round import generators
+from .round.match import Match
+from .round.match_spot import (
+    MatchParticipantMatchSpot,
+    QualificationMatchSpot,
+    SeedMatchSpot,
+)
+from .round.qualifier import Qualifier, QualifierConfig
+from .round.round import Round, RoundConfig
+from .settings import plugin_settings, script_settings
+
+_SETTINGS_CLASSES: Dict[str, type] = {
+    name: value
+    for module in (script_settings, plugin_settings)
+    for name, value in vars(module).items()
+    if isinstance(value, type) and value.__module__ == module.__name__
+}
+""" Settings class name -> class, for the "type" of settings in templates. """
+
+_BRACKETS: Dict[str, Callable[..., List[List[Match]]]] = {
+    "single_elimination": generators.single_elimination,
+    "double_elimination": generators.double_elimination,
+    "swiss": generators.swiss,
+    "round_robin": generators.round_robin,
+    "groups": generators.group_matches,
+}
+
+_DURATION = re.compile(r"^(-)?(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?$")
+_PARAM = re.compile(r"^\{(\w+)\}$")
+
+
+def parse_duration(value: Any) -> timedelta:
+    """
+    Parses a template duration: minutes as a number, or a string like "1h30m", "90s" or "-5m".
+
+    :raises ValueError: If the duration can't be parsed.
+    """
+    if isinstance(value, (int, float)):
+        return timedelta(minutes=value)
+    match = _DURATION.match(str(value).replace(" ", ""))
+    if match is None or not any(match.groups()[1:]):
+        raise ValueError(
+            f"Invalid duration {value!r}, expected e.g. 45, '1h30m' or '-5m'."
+        )
+    sign, days, hours, minutes, seconds = match.groups()
+    duration = timedelta(
+        days=int(days or 0),
+        hours=int(hours or 0),
+        minutes=int(minutes or 0),
+        seconds=int(seconds or 0),
+    )
+    return -duration if sign else duration
+
+
+def _resolve(value: Any, params: Dict[str, Any]) -> Any:
+    # "{name}" is replaced by the parameter itself, other strings are formatted with them.
+    if isinstance(value, str):
+        match = _PARAM.match(value)
+        if match is not None and match.group(1) in params:
+            return params[match.group(1)]
+        if "{" not in value:
+            return value
+        try:
+            return value.format(**params)
+        except KeyError as e:
+            raise ValueError(
+                f"Invalid event template: unknown parameter {e.args[0]!r} in {value!r}"
+            ) from None
+        except IndexError:
+            raise ValueError(
+                f"Invalid event template: unnamed parameter in {value!r}"
+            ) from None
+    if isinstance(value, list):
+        return [_resolve(item, params) for item in value]
+    if isinstance(value, dict):
+        return {key: _resolve(item, params) for key, item in value.items()}
+    return value
+
+
+def _uses_params(value: Any) -> bool:
+    if isinstance(value, str):
+        return "{" in value
+    if isinstance(value, list):
+        return any(_uses_params(item) for item in value)
+    if isinstance(value, dict):
+        return any(_uses_params(item) for item in value.values())
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def _parameters(function: Callable[..., Any]) -> Dict[str, inspect.Parameter]:
+    return dict(inspect.signature(function).parameters)
+
+
+def _check_arguments(
+    name: str, function: Callable[..., Any], kwargs: Dict[str, Any]
+) -> None:
+    # Raised as a ValueError here rather than a TypeError from the call.
+    parameters = _parameters(function)
+    for key in kwargs:
+        if key not in parameters:
+            raise ValueError(f"Invalid event template: {name} has no setting '{key}'")
+    for key, parameter in parameters.items():
+        if parameter.default is inspect.Parameter.empty and key not in kwargs:
+            raise ValueError(f"Invalid event template: {name} is missing '{key}'")
+
+
+def _enum(cls: type, name: Any) -> Any:
+    try:
+        return cls[name]
+    except KeyError:
+        raise ValueError(
+            f"Invalid event template: unknown {cls.__name__} {name!r}"
+        ) from None
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+class EventTemplate:
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        An event described as data, turned into Event objects by build. Templates are usually
+        loaded from YAML or JSON with from_file.
+
+        Any string may use parameters: "{players}" alone is replaced by the parameter's value,
+        other strings are formatted with the parameters (e.g. "Daily KO {start:%d/%m}"). The
+        parameter "start" is always given. Dates are offsets from the event start
+        and durations are minutes or strings like "1h30m".
+
+        Example:
+            name: Daily KO {start:%d/%m}
+            club_id: 69352
+            registration: {start: -5m, end: 6m}
+            rounds:
+              - name: Knockout
+                start: 7m
+                duration: 53m
+                qualifier:
+                  name: Qualifier
+                  duration: 6m
+                  leaderboard_type: SUMSCORE
+                  config:
+                    script: TIME_ATTACK
+                    plugin: CLUB
+                    script_settings: {type: TimeAttackScriptSettings, time_limit: 300}
+                    plugin_settings: {type: QualifierPluginSettings}
+                config:
+                  script: KNOCKOUT
+                  max_players: "{players}"
+                  script_settings:
+                    type: KnockoutScriptSettings
+                    base_script_settings: {type: BaseScriptSettings, warmup_number: 1}
+                matches: {seeds: "{players}"}
+
+        A round may also be a bracket, expanded into one round per bracket round. Its
+        qualifier, if any, is the qualifier of the first one:
+            - bracket: {type: single_elimination, num_players: 64, match_size: 4}
+              name: Round {}  # formatted with the bracket round number only
+              duration: 40m
+              gap: 5m
+              config: ...
+
+        Matches are {seeds: N} (one match of seeds 1 to N) or a list of matches, each a list
+        of spots: a seed, [round, match, rank] for a previous match's outcome or
+        {qualifier: rank} for a rank of the round's qualifier.
+
+        Settings, configs, matches and their JSON-able dicts are built once per set of
+        parameter values they depend on, and shared by every event of the template built with
+        those values, so they must not be mutated.
+
+        :param spec: The template, as loaded from YAML or JSON.
+        :raises ValueError: If the template is invalid.
+        """
+        for key in ("name", "club_id", "rounds"):
+            if key not in spec:
+                raise ValueError(f"Invalid event template: missing '{key}'")
+        self._spec = spec
+        self._cache: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+        self._static: Dict[int, Any] = {}
+        # Settings without parameters are built now, once.
+        for settings in self._iter_settings(spec):
+            if not _uses_params(settings):
+                self._static[id(settings)] = self._settings(settings, {})
+
+    @classmethod
+    def from_file(cls, path: str) -> EventTemplate:
+        """
+        Loads a template from a .yaml/.yml (needs PyYAML, the yaml extra) or .json file. Templates are cached
+        until the file changes.
+        """
+        return _load_template(os.path.abspath(path), os.path.getmtime(path))
+
+    @staticmethod
+    def _iter_settings(spec: Dict[str, Any]):
+        for round in spec["rounds"]:
+            for holder in (round, round.get("qualifier") or {}):
+                config = holder.get("config") or {}
+                for key in ("script_settings", "plugin_settings"):
+                    if isinstance(config.get(key), dict):
+                        yield config[key]
+
+    def _cached(self, key: Any, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = build()
+            return self._cache[key]
+
+    def _settings(self, spec: Dict[str, Any], params: Dict[str, Any]) -> Any:
+        if id(spec) in self._static:
+            return self._static[id(spec)]
+        values = _resolve(spec, params)
+        return self._cached(
+            ("settings", _freeze(values)), lambda: self._construct(values)
+        )
+
+    def _construct(self, values: Dict[str, Any]) -> Any:
+        values = dict(values)
+        name = values.pop("type", None)
+        if name not in _SETTINGS_CLASSES:
+            raise ValueError(f"Invalid event template: unknown settings type {name!r}")
+        cls = _SETTINGS_CLASSES[name]
+        _check_arguments(name, cls, values)
+        parameters = _parameters(cls)
+        kwargs = {}
+        for key, value in values.items():
+            annotation = parameters[key].annotation
+            if isinstance(value, dict):
+                value = self._construct(value)
+            elif (
+                isinstance(annotation, type)
+                and issubclass(annotation, Enum)
+                and isinstance(value, str)
+            ):
+                value = _enum(annotation, value)
+            kwargs[key] = value
+        return cls(**kwargs)
+
+    def _config(
+        self,
+        spec: Dict[str, Any],
+        params: Dict[str, Any],
+        map_pool: List[Map],
+        cls: type,
+    ) -> Any:
+        values = _resolve(
+            {
+                key: value
+                for key, value in spec.items()
+                if key not in ("script_settings", "plugin_settings")
+            },
+            params,
+        )
+        maps = (
+            [Map(uid) for uid in values.pop("maps")] if "maps" in values else map_pool
+        )
+        settings = {
+            key: self._settings(spec[key], params)
+            for key in ("script_settings", "plugin_settings")
+            if key in spec
+        }
+
+        def build() -> Any:
+            kwargs = dict(values, map_pool=maps, **settings)
+            _check_arguments(cls.__name__, cls, kwargs)
+            kwargs["script"] = _enum(ScriptType, values["script"])
+            if "plugin" in values:
+                kwargs["plugin"] = _enum(PluginType, values["plugin"])
+            return cls(**kwargs)
+
+        # Settings are cached too, so their identity stands for their values.
+        key = (
+            cls.__name__,
+            _freeze(values),
+            tuple(map._uuid for map in maps),
+            tuple((key, id(value)) for key, value in settings.items()),
+        )
+        return self._cached(key, build)
+
+    def _matches(self, spec: Any, params: Dict[str, Any]) -> List[Match]:
+        spec = _resolve(spec, params)
+        if spec is None:
+            return []
+        # The list is the round's own, the matches are shared like the settings.
+        return list(
+            self._cached(("matches", _freeze(spec)), lambda: self._build_matches(spec))
+        )
+
+    @staticmethod
+    def _build_matches(spec: Any) -> List[Match]:
+        if isinstance(spec, dict):
+            if "seeds" not in spec:
+                raise ValueError("Invalid event template: matches is missing 'seeds'")
+            return [
+                Match(
+                    spots=[
+                        SeedMatchSpot(seed) for seed in range(1, int(spec["seeds"]) + 1)
+                    ]
+                )
+            ]
+        matches = []
+        for match in spec:
+            spots = []
+            for spot in match:
+                if isinstance(spot, int):
+                    spots.append(SeedMatchSpot(spot))
+                elif isinstance(spot, dict):
+                    if "qualifier" not in spot:
+                        raise ValueError(
+                            f"Invalid event template: spot {spot!r} is missing 'qualifier'"
+                        )
+                    spots.append(
+                        QualificationMatchSpot(
+                            int(spot.get("round", 0)), int(spot["qualifier"])
+                        )
+                    )
+                elif isinstance(spot, list) and len(spot) == 3:
+                    spots.append(MatchParticipantMatchSpot(*spot))
+                else:
+                    raise ValueError(
+                        f"Invalid event template: invalid spot {spot!r}, expected a seed,"
+                        " [round, match, rank] or {qualifier: rank}"
+                    )
+            matches.append(Match(spots=spots))
+        return matches
+
+    def _rounds(
+        self,
+        spec: Dict[str, Any],
+        start: datetime,
+        previous_end: datetime,
+        params: Dict[str, Any],
+        map_pool: List[Map],
+        position: int,
+    ) -> List[Round]:
+        missing = [key for key in ("name", "config", "duration") if key not in spec]
+        if "bracket" in spec and "name" in missing:
+            missing.remove("name")
+        if "qualifier" in spec:
+            missing += [
+                f"qualifier.{key}"
+                for key in ("config", "duration")
+                if key not in spec["qualifier"]
+            ]
+        if missing:
+            raise ValueError(
+                f"Invalid event template: round is missing {', '.join(map(repr, missing))}"
+            )
+        round_start = (
+            start + parse_duration(spec["start"]) if "start" in spec else previous_end
+        )
+        qualifier = None
+        if "qualifier" in spec:
+            qualifier_spec = spec["qualifier"]
+            qualifier_start = (
+                start + parse_duration(qualifier_spec["start"])
+                if "start" in qualifier_spec
+                else round_start
+            )
+            qualifier = Qualifier(
+                name=_resolve(qualifier_spec.get("name", "Qualifier"), params),
+                start_date=qualifier_start,
+                end_date=qualifier_start + parse_duration(qualifier_spec["duration"]),
+                leaderboard_type=_enum(
+                    LeaderboardType, qualifier_spec.get("leaderboard_type", "SUMSCORE")
+                ),
+                config=self._config(
+                    qualifier_spec["config"], params, map_pool, QualifierConfig
+                ),
+            )
+            if "start" not in spec:
+                round_start = max(round_start, qualifier._end_date)
+
+        config = self._config(spec["config"], params, map_pool, RoundConfig)
+        if "bracket" in spec:
+            bracket = _resolve(spec["bracket"], params)
+            bracket_type = bracket.pop("type", None)
+            if bracket_type not in _BRACKETS:
+                raise ValueError(
+                    f"Invalid event template: unknown bracket type {bracket_type!r}"
+                )
+            generate = _BRACKETS[bracket_type]
+            _check_arguments(f"{bracket_type} bracket", generate, bracket)
+            if "round_offset" in _parameters(generate):
+                bracket.setdefault("round_offset", position)
+            rounds = generators.rounds_from_matches(
+                generate(**bracket),
+                start_date=round_start,
+                round_duration=parse_duration(spec["duration"]),
+                config=config,
+                name_fmt=spec.get("name", "Round {}"),
+                gap=parse_duration(spec.get("gap", 0)),
+            )
+            # The qualifier seeds the bracket, so it belongs to its first round.
+            if rounds:
+                rounds[0]._qualifier = qualifier
+            return rounds
+        return [
+            Round(
+                name=_resolve(spec["name"], params),
+                start_date=round_start,
+                end_date=round_start + parse_duration(spec["duration"]),
+                matches=self._matches(spec.get("matches"), params),
+                config=config,
+                qualifier=qualifier,
+            )
+        ]
+
+    def build(
+        self, start: datetime, map_pool: Optional[List[Map]] = None, **params: Any
+    ) -> Event:
+        """
+        Builds an event from the template.
+
+        :param start: Start of the event, which every date of the template is relative to.
+        :param map_pool: Maps of every round and qualifier without its own "maps".
+        :param params: Values of the template's parameters.
+        """
+        spec = self._spec
+        params = {**spec.get("defaults", {}), **params, "start": start}
+        map_pool = map_pool or []
+        rounds: List[Round] = []
+        previous_end = start
+        for round_spec in spec["rounds"]:
+            for round in self._rounds(
+                round_spec, start, previous_end, params, map_pool, len(rounds)
+            ):
+                rounds.append(round)
+                previous_end = round._end_date
+
+        registration = spec.get("registration") or {}
+        return Event(
+            name=_resolve(spec["name"], params),
+            club_id=int(_resolve(spec["club_id"], params)),
+            rounds=rounds,
+            description=_resolve(spec.get("description"), params),  # type: ignore
+            registration_start_date=(
+                start + parse_duration(registration["start"]) if "start" in registration else None  # type: ignore
+            ),
+            registration_end_date=(
+                start + parse_duration(registration["end"]) if "end" in registration else None  # type: ignore
+            ),
+            participant_type=_enum(
+                ParticipantType, spec.get("participant_type", "PLAYER")
+            ),
+        )
+
+    def build_many(
+        self,
+        starts: List[datetime],
+        map_pool: Optional[List[Map]] = None,
+        **params: Any,
+    ) -> List[Event]:
+        """
+        Builds one event per start date, e.g. a daily event for a month.
+        """
+        return [self.build(start, map_pool, **params) for start in starts]
+
+
+def _load_spec(path: str) -> Dict[str, Any]:
+    with open(path, "rb") as file:
+        data = file.read()
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError("PyYAML is required to load YAML event templates") from e
+        return yaml.safe_load(data)
+    return get_codec().loads(data)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_template(path: str, mtime: float) -> EventTemplate:
+    return EventTemplate(_load_spec(path))
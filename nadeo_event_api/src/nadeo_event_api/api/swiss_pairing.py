@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..objects.inbound.match_results import MatchResults
+from .event_results import EventResults
+from .structure.round.match import Match
+from .structure.round.match_spot import MatchParticipantMatchSpot
+
+
+@dataclass(slots=True, frozen=True)
+class SwissStanding:
+    participant: str
+    points: int
+    buchholz: int
+    """ Sum of the points of every opponent met, once per meeting. """
+    score: int
+    matches: int
+
+
+class SwissPairing:
+    def __init__(
+        self,
+        match_size: int = 2,
+        points_for_rank: Optional[Sequence[int]] = None,
+        max_steps: int = 100_000,
+    ):
+        """
+        Pairs the next round of a Swiss system from the results of the previous ones. Standings
+        (points, then Buchholz, then score) are updated as results are added, and each round
+        groups players of close standings while avoiding rematches, so tie-break rounds can be
+        generated as soon as the previous round ends.
+
+        Usage:
+            swiss = SwissPairing(match_size=4, points_for_rank=[3, 2, 1, 0])
+            swiss.add_event_results(EventResults(event_id).refresh(), round_positions=[4, 5, 6])
+            matches = swiss.next_round(swiss.pair(tied_players))
+
+        :param match_size: Players per match.
+        :param points_for_rank: Points given for each match rank, starting at rank 1. Ranks past its end give 0 points. Defaults to match_size - rank.
+        :param max_steps: Search steps allowed to avoid rematches before falling back to pairing in standings order.
+        """
+        if match_size < 2:
+            raise ValueError("match_size must be at least 2")
+        self._match_size = match_size
+        self._points_for_rank = (
+            list(points_for_rank)
+            if points_for_rank is not None
+            else [match_size - rank for rank in range(1, match_size + 1)]
+        )
+        self._max_steps = max_steps
+
+        self._points: Dict[str, int] = {}
+        self._buchholz: Dict[str, int] = {}
+        self._scores: Dict[str, int] = {}
+        self._matches: Dict[str, int] = {}
+        self._met: Dict[str, Dict[str, int]] = {}
+        """ Participant -> opponent -> number of meetings. """
+        self._last: Dict[str, Tuple[int, int, int]] = {}
+        """ Participant -> (round position, match position, rank) of their latest match. """
+        self._added: Set[str] = set()
+
+    def _points_for(self, rank: int) -> int:
+        return (
+            self._points_for_rank[rank - 1] if rank <= len(self._points_for_rank) else 0
+        )
+
+    def add_results(self, match_position: int, results: MatchResults) -> None:
+        """
+        Adds the results of a match to the standings. Adding the same match twice has no effect.
+
+        :param match_position: Position of the match in its round.
+        :param results: The match's results. Participants without a rank are ignored.
+        """
+        if results.match_live_id in self._added:
+            return
+        self._added.add(results.match_live_id)
+
+        ranked: Dict[str, int] = {}
+        for result in results.results:
+            if result.rank is not None and result.participant not in ranked:
+                ranked[result.participant] = result.rank
+                self._scores[result.participant] = self._scores.get(
+                    result.participant, 0
+                ) + (result.score or 0)
+
+        points, buchholz = self._points, self._buchholz
+        for participant, rank in ranked.items():
+            gained = self._points_for(rank)
+            points[participant] = points.get(participant, 0) + gained
+            buchholz.setdefault(participant, 0)
+            self._matches[participant] = self._matches.get(participant, 0) + 1
+            self._last[participant] = (results.round_position, match_position, rank)
+            # Earlier opponents' Buchholz follows this player's points.
+            for opponent, meetings in self._met.get(participant, {}).items():
+                buchholz[opponent] += gained * meetings
+
+        for a, b in combinations(ranked, 2):
+            met_a = self._met.setdefault(a, {})
+            met_a[b] = met_a.get(b, 0) + 1
+            met_b = self._met.setdefault(b, {})
+            met_b[a] = met_b.get(a, 0) + 1
+            buchholz[a] += points[b]
+            buchholz[b] += points[a]
+
+    def add_event_results(
+        self, results: EventResults, round_positions: Iterable[int]
+    ) -> None:
+        """
+        Adds the results of every completed match of some rounds of an event.
+
+        :param results: The event's results, refreshed.
+        :param round_positions: Positions of the Swiss rounds in the event, starting at 0.
+        """
+        positions = set(round_positions)
+        for round in results.rounds:
+            if round.position not in positions:
+                continue
+            for match in results.matches.get(round.id, []):
+                match_results = results.results.get(match.id)
+                if match.is_completed and match_results is not None:
+                    self.add_results(match.position, match_results)
+
+    def standing(self, participant_id: str) -> SwissStanding:
+        return SwissStanding(
+            participant=participant_id,
+            points=self._points.get(participant_id, 0),
+            buchholz=self._buchholz.get(participant_id, 0),
+            score=self._scores.get(participant_id, 0),
+            matches=self._matches.get(participant_id, 0),
+        )
+
+    def standings(
+        self, participant_ids: Optional[Iterable[str]] = None
+    ) -> List[SwissStanding]:
+        """
+        Returns the standings, best first: by points, then Buchholz, then score.
+
+        :param participant_ids: The players to rank, defaults to every player with results.
+        """
+        participants = self._points if participant_ids is None else participant_ids
+        return sorted(
+            (self.standing(participant) for participant in participants),
+            key=lambda s: (-s.points, -s.buchholz, -s.score, s.participant),
+        )
+
+    def have_met(self, a: str, b: str) -> bool:
+        return b in self._met.get(a, ())
+
+    def pair(self, participant_ids: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """
+        Groups players into matches of match_size, in standings order, so that no two players
+        of a match have met before. Each match takes the best unpaired player and the closest
+        players below them it can; the search backtracks when the remaining players can't be
+        grouped. If no grouping without rematches is found within max_steps, players are
+        grouped in standings order instead.
+
+        If the number of players isn't a multiple of match_size, the last match is smaller.
+
+        :param participant_ids: The players to pair, defaults to every player with results.
+        """
+        order = [s.participant for s in self.standings(participant_ids)]
+        size = self._match_size
+        steps = 0
+
+        def search(remaining: List[str]) -> Optional[List[List[str]]]:
+            nonlocal steps
+            if not remaining:
+                return []
+            head, rest = remaining[0], remaining[1:]
+            for companions in combinations(rest, min(size, len(remaining)) - 1):
+                steps += 1
+                if steps > self._max_steps:
+                    return None
+                group = (head, *companions)
+                if any(self.have_met(a, b) for a, b in combinations(group, 2)):
+                    continue
+                chosen = set(companions)
+                groups = search([p for p in rest if p not in chosen])
+                if groups is not None:
+                    return [list(group)] + groups
+                if steps > self._max_steps:
+                    return None
+            return None
+
+        groups = search(order)
+        if groups is None:
+            groups = [order[i : i + size] for i in range(0, len(order), size)]
+        return groups
+
+    def next_round(self, groups: List[List[str]]) -> List[Match]:
+        """
+        Returns the matches of the next round, each player's spot referencing their rank in
+        their latest match.
+
+        :param groups: The players of each match, e.g. from pair.
+        :raises ValueError: If a player has no results yet.
+        """
+        matches = []
+        for group in groups:
+            spots = []
+            for participant in group:
+                if participant not in self._last:
+                    raise ValueError(f"{participant} has no results to advance from.")
+                spots.append(MatchParticipantMatchSpot(*self._last[participant]))
+            matches.append(Match(spots=spots))
+        return matches
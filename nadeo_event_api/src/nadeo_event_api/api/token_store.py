@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import json
+import os
+import tempfile
+from typing import Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from .authenticate import NadeoToken
+from .enums import NadeoService
+
+
+class TokenStore(ABC):
+    """
+    Persists Nadeo tokens outside of the process, so short-lived processes can start
+    with a valid token instead of logging in again.
+    """
+
+    @abstractmethod
+    def load(self, service: NadeoService) -> Optional[NadeoToken]:
+        """
+        Returns the stored token of a service, if any.
+        """
+
+    @abstractmethod
+    def save(self, service: NadeoService, token: NadeoToken) -> None:
+        """
+        Stores the token of a service, replacing any previous one.
+        """
+
+
+class FileTokenStore(TokenStore):
+    def __init__(self, path: str):
+        """
+        Stores tokens as JSON in a file shared by all processes on the machine. Reads and
+        writes are serialized with an advisory lock on a sidecar ".lock" file (POSIX only),
+        and writes replace the file atomically so readers never see a partial file.
+
+        :param path: The path of the token file. Its directory is created if needed.
+        """
+        self._path = path
+        self._lock_path = path + ".lock"
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self._lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def load(self, service: NadeoService) -> Optional[NadeoToken]:
+        with self._locked(exclusive=False):
+            entry = self._read().get(service.value)
+        if not isinstance(entry, dict) or "accessToken" not in entry:
+            return None
+        return NadeoToken(
+            access_token=entry["accessToken"],
+            refresh_token=entry.get("refreshToken"),
+            expires_at=entry.get("expiresAt"),
+        )
+
+    def save(self, service: NadeoService, token: NadeoToken) -> None:
+        with self._locked(exclusive=True):
+            data = self._read()
+            data[service.value] = {
+                "accessToken": token.access_token,
+                "refreshToken": token.refresh_token,
+                "expiresAt": token.expires_at,
+            }
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self._path))
+            )
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                # Tokens are credentials, keep them private to the current user.
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, self._path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
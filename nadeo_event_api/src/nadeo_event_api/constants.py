@@ -6,6 +6,13 @@ NADEO_AUTH_URL = (
     "https://prod.trackmania.core.nadeo.online/v2/authentication/token/ubiservices"
 )
 
+NADEO_REFRESH_URL = (
+    "https://prod.trackmania.core.nadeo.online/v2/authentication/token/refresh"
+)
+
+TOKEN_REFRESH_MARGIN_SECONDS = 120
+""" Access tokens are refreshed this many seconds before they expire. """
+
 CLUB_CAMPAIGN_URL_FMT = (
     "https://live-services.trackmania.nadeo.live/api/token/club/{0}/campaign/{1}"
 )
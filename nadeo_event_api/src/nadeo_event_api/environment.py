@@ -8,3 +8,12 @@ SECRETS_BUCKET_NAME = "SECRETS_BUCKET_NAME"
 # The lambda picks up the auth from the secrets bucket.
 UBI_AUTH = "UBI_AUTH"
 MY_CLUB = "MY_CLUB"
+
+# Optional path of a file used to persist Nadeo access/refresh tokens across processes.
+NADEO_TOKEN_CACHE = "NADEO_TOKEN_CACHE"
+
+# Optional path of a file caching club campaign playlists across runs.
+NADEO_CAMPAIGN_CATALOG = "NADEO_CAMPAIGN_CATALOG"
+
+# Optional name of the JSON codec used for request and response bodies (orjson, msgspec or json).
+NADEO_JSON_CODEC = "NADEO_JSON_CODEC"
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+from .schema import api_field, decoder, list_of
+
 """
 Example:
 
@@ -17,37 +21,28 @@ Example:
   }
 """
 
-@dataclass
+
+@dataclass(slots=True)
 class Participant:
-    participant: str
-    # TODO add more fields 
+    participant: str = api_field(required=True)
+    # TODO add more fields
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
-        participant = data.get("participant")
-
-        if participant is None:
-            raise ValueError("Invalid participant data: missing 'participant'")
+    def from_dict(cls, data: Dict[str, Any]) -> Participant:
+        return decoder(cls)(data)
 
-        return cls(participant)
 
-@dataclass
+@dataclass(slots=True)
 class TeamPlayer:
-    account_id: str
+    account_id: str = api_field("AccountId")
 
-@dataclass
+
+@dataclass(slots=True)
 class Team:
-    id: str
-    name: str
-    players: List[TeamPlayer]
+    id: str = api_field("Id", required=True)
+    name: str = api_field("Name", required=True)
+    players: List[TeamPlayer] = api_field("Players", decode=list_of(TeamPlayer))
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
-        id = data.get("Id")
-        name = data.get("Name")
-        players = [TeamPlayer(account_id=player.get("AccountId")) for player in data.get("Players", [])]
-
-        if id is None or name is None:
-            raise ValueError("Invalid team data: missing 'Id' or 'Name'")
-
-        return cls(id=id, name=name, players=players)
\ No newline at end of file
+    def from_dict(cls, data: Dict[str, Any]) -> Team:
+        return decoder(cls)(data)
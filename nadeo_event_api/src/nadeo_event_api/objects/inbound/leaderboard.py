@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from .schema import decoder
+
+"""
+Example:
+
+{"participant": "df9448f1-a8d5-4682-9003-1c2777c62b91", "rank": 1, "score": 0, "zone": "World"}
+"""
+
+
+@dataclass(slots=True)
+class LeaderboardEntry:
+    participant: str
+    rank: int | None
+    score: int | None
+    zone: str | None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> LeaderboardEntry:
+        return decoder(cls)(data)
+
+
+@dataclass(slots=True)
+class Leaderboard:
+    entries: List[LeaderboardEntry]
+    _by_participant: Dict[str, LeaderboardEntry] = field(
+        init=False, repr=False, compare=False
+    )
+    _by_rank: Dict[int, List[LeaderboardEntry]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._by_participant = {}
+        self._by_rank = {}
+        for entry in self.entries:
+            self._by_participant[entry.participant] = entry
+            if entry.rank is not None:
+                self._by_rank.setdefault(entry.rank, []).append(entry)
+
+    @classmethod
+    def from_list(cls, data: Iterable[Dict[str, Any]]):
+        decode = decoder(LeaderboardEntry)
+        return cls([decode(entry) for entry in data])
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def get_entry(self, participant_id: str) -> Optional[LeaderboardEntry]:
+        """Returns a player's leaderboard entry.
+
+        Args:
+            participant_id (str): The player's tm account ID.
+
+        Returns:
+            Optional[LeaderboardEntry]: The player's entry, if they are on the leaderboard.
+        """
+        return self._by_participant.get(participant_id)
+
+    def get_rank(self, participant_id: str) -> Optional[int]:
+        """Returns a player's rank on the leaderboard.
+
+        Args:
+            participant_id (str): The player's tm account ID.
+
+        Returns:
+            Optional[int]: The player's rank, if they are ranked on the leaderboard.
+        """
+        entry = self._by_participant.get(participant_id)
+        return entry.rank if entry is not None else None
+
+    def at_rank(self, rank: int) -> List[LeaderboardEntry]:
+        """Returns the entries at a given rank, more than one if players are tied.
+
+        Args:
+            rank (int): The rank, starting at 1.
+
+        Returns:
+            List[LeaderboardEntry]: The entries at that rank.
+        """
+        return list(self._by_rank.get(rank, ()))
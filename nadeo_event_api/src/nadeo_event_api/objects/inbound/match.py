@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from typing import Any, Dict, List
 
+from .schema import decoder
+
 """
 Example:
 
@@ -8,7 +12,7 @@ Example:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     id: int
     name: str
@@ -19,13 +23,5 @@ class Match:
     deleted_on: int | None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
-        id = data.get("id")
-        name = data.get("name")
-        club_match_live_id = data.get("clubMatchLiveId")
-        position = data.get("position")
-        is_completed = data.get("isCompleted")
-        tags = data.get("tags")
-        deleted_on = data.get("deletedOn")
-
-        return cls(id, name, club_match_live_id, position, is_completed, tags, deleted_on)  # type: ignore
+    def from_dict(cls, data: Dict[str, Any]) -> Match:
+        return decoder(cls)(data)
@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List
 from ...api.structure.enums import ParticipantType, ScriptType
+from .schema import api_field, decoder
 
 
-@dataclass
+@dataclass(slots=True)
 class PublicConfig:
     script: ScriptType | None
     maps: List[str] | None
@@ -32,7 +33,7 @@ Example:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchInfo:
     id: int | None
     live_id: str | None
@@ -44,32 +45,8 @@ class MatchInfo:
     join_link: str | None
     server_status: str | None  # TODO - enumerate
     manialink: str | None
-    public_config: PublicConfig | None
+    public_config: PublicConfig | None = api_field(decode=PublicConfig.from_dict)
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
-        id = data.get("id")
-        live_id = data.get("liveId")
-        name = data.get("name")
-        start_date = data.get("startDate")
-        end_date = data.get("endDate")
-        status = data.get("status")
-        participant_type = data.get("participantType")
-        join_link = data.get("joinLink")
-        server_status = data.get("serverStatus")
-        manialink = data.get("manialink")
-        public_config = data.get("publicConfig")
-
-        return cls(
-            id=id,
-            live_id=live_id,
-            name=name,
-            start_date=start_date,
-            end_date=end_date,
-            status=status,
-            participant_type=participant_type,
-            join_link=join_link,
-            server_status=server_status,
-            manialink=manialink,
-            public_config=PublicConfig.from_dict(public_config),  # type: ignore
-        )
+    def from_dict(cls, data: Dict[str, Any]) -> MatchInfo:
+        return decoder(cls)(data)
@@ -1,5 +1,9 @@
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .schema import api_field, decoder, list_of
 
 """
 Example: 
@@ -8,7 +12,7 @@ Example:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class RankedParticipant:
     participant: str
     rank: int | None
@@ -17,14 +21,8 @@ class RankedParticipant:
     team: str | None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
-        participant = data.get("participant")
-        rank = data.get("rank")
-        score = data.get("score")
-        zone = data.get("zone")
-        team = data.get("team")
-
-        return cls(participant, rank, score, zone, team)  # type: ignore
+    def from_dict(cls, data: Dict[str, Any]) -> RankedParticipant:
+        return decoder(cls)(data)
 
 
 """
@@ -34,7 +32,7 @@ Example:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class RankedTeam:
     position: int
     team: str
@@ -42,13 +40,8 @@ class RankedTeam:
     score: int
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
-        position = data.get("position")
-        team = data.get("team")
-        rank = data.get("rank")
-        score = data.get("score")
-
-        return cls(position, team, rank, score)  # type: ignore
+    def from_dict(cls, data: Dict[str, Any]) -> RankedTeam:
+        return decoder(cls)(data)
 
 
 """
@@ -58,21 +51,45 @@ Example:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResults:
     match_live_id: str
     round_position: int
-    results: List[RankedParticipant]
-    teams: List[RankedTeam]
+    results: List[RankedParticipant] = api_field(decode=list_of(RankedParticipant))
+    teams: List[RankedTeam] = api_field(decode=list_of(RankedTeam))
+    _ranks: Optional[Tuple[tuple, Dict[str, Optional[int]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
-        match_live_id = data.get("matchLiveId")
-        round_position = data.get("roundPosition")
-        results = [RankedParticipant.from_dict(result) for result in data.get("results", [])]
-        teams = [RankedTeam.from_dict(team) for team in data.get("teams", [])]  
+    def from_dict(cls, data: Dict[str, Any]) -> MatchResults:
+        return decoder(cls)(data)
+
+    def _rank_index(self) -> Dict[str, Optional[int]]:
+        # Built on first lookup and rebuilt if results or teams were reassigned or
+        # resized since. Ranks edited in place on an entry aren't noticed.
+        key = (id(self.results), len(self.results), id(self.teams), len(self.teams))
+        if self._ranks is not None and self._ranks[0] == key:
+            return self._ranks[1]
+
+        if self.teams == []:
+            ranks = {}
+            for result in self.results:
+                ranks.setdefault(result.participant, result.rank)
+        else:
+            # As before indexing: a player's last result gives their team, the first
+            # entry of that team gives its rank.
+            team_ranks = {}
+            for team in self.teams:
+                team_ranks.setdefault(team.team, team.rank)
+            player_teams = {result.participant: result.team for result in self.results}
+            ranks = {
+                participant: team_ranks.get(team) if team is not None else None
+                for participant, team in player_teams.items()
+            }
 
-        return cls(match_live_id, round_position, results, teams)  # type: ignore
+        self._ranks = (key, ranks)
+        return ranks
 
     def get_rank(self, participant_id: str) -> Optional[int]:
         """Returns a player's rank for a match, defaulting to their team rank if it was a teams match.
@@ -81,26 +98,21 @@ class MatchResults:
             participant_id (str): The player's tm account ID.
 
         Returns:
-            Optional[int]: The player's rank, if they had results in the match. 
+            Optional[int]: The player's rank, if they had results in the match.
         """
-        # If not teams match, get player's individual rank
-        if self.teams == []:        
-            for result in self.results:
-                if result.participant == participant_id:
-                    return result.rank
-                
-        # If teams match, get player's team's rank
-        else: 
-            player_team = None
-            for result in self.results:
-                if result.participant == participant_id:
-                    player_team = result.team
+        return self._rank_index().get(participant_id)
 
-            if player_team is None:
-                return None
-            
-            for team in self.teams:
-                if team.team == player_team:
-                    return team.rank
+    def ranks_for(self, participant_ids: Iterable[str]) -> Dict[str, Optional[int]]:
+        """Returns the rank of several players at once, see get_rank.
+
+        Args:
+            participant_ids (Iterable[str]): The players' tm account IDs.
 
-        return None
\ No newline at end of file
+        Returns:
+            Dict[str, Optional[int]]: Each player's rank, None if they had no results in the match.
+        """
+        ranks = self._rank_index()
+        return {
+            participant_id: ranks.get(participant_id)
+            for participant_id in participant_ids
+        }
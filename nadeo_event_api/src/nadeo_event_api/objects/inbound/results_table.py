@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .match_results import MatchResults
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the pure Python path gives the same results.
+    np = None
+
+NO_RANK = 0
+""" Rank stored for a participant without a rank (ranks start at 1). """
+
+
+@dataclass(slots=True, frozen=True)
+class PlayerStanding:
+    participant: str
+    matches: int
+    """ Number of results rows of the participant. """
+    total_points: int
+    """ Sum of the points given by points_for_rank, 0 if no table was given. """
+    total_score: int
+    best_rank: Optional[int]
+    mean_rank: Optional[float]
+
+
+class ResultsTable:
+    def __init__(self):
+        """Column store of match results: one row per (match, participant), with participant
+        IDs dictionary-encoded. Rows can be appended straight from the JSON pages of the
+        match results endpoint, without building a RankedParticipant per row, and standings
+        are computed with a few array operations (vectorized with NumPy when installed).
+        """
+        self.participants: List[str] = []
+        """ Distinct participant IDs, indexed by participant code. """
+        self._codes: Dict[str, int] = {}
+        self.participant_codes = array("i")
+        self.match_ids = array("q")
+        self.round_positions = array("i")
+        self.ranks = array("i")
+        """ Rank of each row, NO_RANK if the participant isn't ranked. """
+        self.scores = array("q")
+        """ Score of each row, 0 if the participant has no score. """
+
+    def __len__(self) -> int:
+        return len(self.match_ids)
+
+    def _code(self, participant: str) -> int:
+        code = self._codes.get(participant)
+        if code is None:
+            code = self._codes[participant] = len(self.participants)
+            self.participants.append(participant)
+        return code
+
+    def append(
+        self,
+        match_id: int,
+        round_position: int,
+        participant: str,
+        rank: Optional[int],
+        score: Optional[int],
+    ) -> None:
+        """Appends one result row.
+
+        Args:
+            match_id (int): ID of the match.
+            round_position (int): Position of the match's round in the event.
+            participant (str): The player's tm account ID.
+            rank (Optional[int]): Rank of the player in the match.
+            score (Optional[int]): Score of the player in the match.
+        """
+        self.participant_codes.append(self._code(participant))
+        self.match_ids.append(match_id)
+        self.round_positions.append(round_position)
+        self.ranks.append(rank or NO_RANK)
+        self.scores.append(score or 0)
+
+    def extend_from_response(self, match_id: int, response: Dict[str, Any]) -> int:
+        """Appends the rows of one page of the match results endpoint, as decoded JSON.
+
+        Args:
+            match_id (int): ID of the match the page belongs to.
+            response (Dict[str, Any]): The page, e.g. {"roundPosition": 0, "results": [...], ...}.
+
+        Returns:
+            int: Number of rows appended.
+        """
+        results = response.get("results") or ()
+        round_position = response.get("roundPosition") or 0
+        code = self._code
+        self.participant_codes.extend(code(row["participant"]) for row in results)
+        self.match_ids.extend([match_id] * len(results))
+        self.round_positions.extend([round_position] * len(results))
+        self.ranks.extend(row.get("rank") or NO_RANK for row in results)
+        self.scores.extend(row.get("score") or 0 for row in results)
+        return len(results)
+
+    def extend_from_results(self, match_id: int, results: MatchResults) -> None:
+        """Appends the rows of already decoded match results.
+
+        Args:
+            match_id (int): ID of the match.
+            results (MatchResults): The results of the match.
+        """
+        for result in results.results:
+            self.append(
+                match_id,
+                results.round_position,
+                result.participant,
+                result.rank,
+                result.score,
+            )
+
+    def select_rounds(self, round_positions: Iterable[int]) -> ResultsTable:
+        """Returns a table with the rows of some rounds only. Participant codes are kept."""
+        wanted = set(round_positions)
+        table = ResultsTable()
+        table.participants = list(self.participants)
+        table._codes = dict(self._codes)
+        for i, position in enumerate(self.round_positions):
+            if position in wanted:
+                table.participant_codes.append(self.participant_codes[i])
+                table.match_ids.append(self.match_ids[i])
+                table.round_positions.append(position)
+                table.ranks.append(self.ranks[i])
+                table.scores.append(self.scores[i])
+        return table
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Returns a copy of the columns as NumPy arrays.
+
+        The arrays don't share the table's memory: a view would lock the table's buffers
+        and make any later append raise BufferError.
+
+        Raises:
+            ImportError: If NumPy isn't installed.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for ResultsTable.to_numpy")
+        return {
+            "participant_codes": np.array(self.participant_codes, dtype=np.int32),
+            "match_ids": np.array(self.match_ids, dtype=np.int64),
+            "round_positions": np.array(self.round_positions, dtype=np.int32),
+            "ranks": np.array(self.ranks, dtype=np.int32),
+            "scores": np.array(self.scores, dtype=np.int64),
+        }
+
+    def _aggregate(self, points_for_rank: Sequence[int]) -> tuple:
+        size = len(self.participants)
+        if np is not None:
+            columns = self.to_numpy()
+            codes, ranks = columns["participant_codes"], columns["ranks"]
+            is_ranked = ranks != NO_RANK
+            ranked_codes, ranked_ranks = codes[is_ranked], ranks[is_ranked]
+
+            # Points of every rank up to the worst one, 0 for NO_RANK and past points_for_rank.
+            points_table = np.zeros(
+                max(len(points_for_rank), int(ranks.max(initial=0))) + 1
+            )
+            points_table[1 : len(points_for_rank) + 1] = points_for_rank
+            unranked = np.iinfo(np.int64).max
+            best = np.full(size, unranked, dtype=np.int64)
+            np.minimum.at(best, ranked_codes, ranked_ranks)
+
+            def group_sum(group_codes, weights=None) -> list:
+                return np.bincount(
+                    group_codes, weights=weights, minlength=size
+                ).tolist()
+
+            return (
+                group_sum(codes),
+                group_sum(codes, points_table[ranks]),
+                group_sum(codes, columns["scores"]),
+                group_sum(ranked_codes),
+                group_sum(ranked_codes, ranked_ranks),
+                [None if rank == unranked else rank for rank in best.tolist()],
+            )
+
+        matches, points, scores = [0] * size, [0] * size, [0] * size
+        ranked, rank_sums, best = [0] * size, [0] * size, [None] * size
+        for code, rank, score in zip(self.participant_codes, self.ranks, self.scores):
+            matches[code] += 1
+            scores[code] += score
+            if rank != NO_RANK:
+                ranked[code] += 1
+                rank_sums[code] += rank
+                if rank <= len(points_for_rank):
+                    points[code] += points_for_rank[rank - 1]
+                if best[code] is None or rank < best[code]:
+                    best[code] = rank
+        return matches, points, scores, ranked, rank_sums, best
+
+    def standings(self, points_for_rank: Sequence[int] = ()) -> List[PlayerStanding]:
+        """Aggregates the rows per participant and ranks the participants.
+
+        Args:
+            points_for_rank (Sequence[int], optional): Points given for each rank, starting at rank 1. Ranks past its end give 0 points. Defaults to ().
+
+        Returns:
+            List[PlayerStanding]: One standing per participant, by most points, then highest total score, then best mean rank.
+        """
+        matches, points, scores, ranked, rank_sums, best = self._aggregate(
+            points_for_rank
+        )
+        standings = [
+            PlayerStanding(
+                participant=participant,
+                matches=matches[code],
+                total_points=int(points[code]),
+                total_score=int(scores[code]),
+                best_rank=best[code],
+                mean_rank=rank_sums[code] / ranked[code] if ranked[code] else None,
+            )
+            for code, participant in enumerate(self.participants)
+            if matches[code]
+        ]
+        standings.sort(
+            key=lambda s: (
+                -s.total_points,
+                -s.total_score,
+                s.mean_rank if s.mean_rank is not None else math.inf,
+            )
+        )
+        return standings
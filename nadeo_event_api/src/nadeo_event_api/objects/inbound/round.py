@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
 from typing import Any, Dict
 
 from ...api.structure.enums import LeaderboardType
+from .schema import api_field, decoder
 
 """
 Example:
@@ -10,7 +13,7 @@ Example:
 """
 
 
-@dataclass
+@dataclass(slots=True)
 class Round:
     id: int
     position: int
@@ -23,29 +26,14 @@ class Round:
     auto_needs_matches: bool
     match_score_direction: str  # TODO - enum
     leaderboard_compute_type: LeaderboardType
-    team_leadaerboard_compute_type: str  # TODO - enum
+    team_leadaerboard_compute_type: str = api_field(
+        "teamLeaderboardComputeType"
+    )  # TODO - enum
     deleted_on: int | None
-    num_matches: int
+    num_matches: int = api_field("nbMatches")
     qualifier_challenge_id: int | None
     training_challenge_id: int | None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]):
-        id = data.get("id")
-        position = data.get("position")
-        name = data.get("name")
-        start_date = data.get("startDate")
-        end_date = data.get("endDate")
-        lock_date = data.get("lockDate")
-        status = data.get("status")
-        is_locked = data.get("isLocked")
-        auto_needs_matches = data.get("autoNeedsMatches")
-        match_score_direction = data.get("matchScoreDirection")
-        leaderboard_compute_type = data.get("leaderboardComputeType")
-        team_leaderboard_compute_type = data.get("teamLeaderboardComputeType")
-        deleted_on = data.get("deletedOn")
-        num_matches = data.get("nbMatches")
-        qualifier_challenge_id = data.get("qualifierChallengeId")
-        training_challenge_id = data.get("trainingChallengeId")
-
-        return cls(id, position, name, start_date, end_date, lock_date, status, is_locked, auto_needs_matches, match_score_direction, leaderboard_compute_type, team_leaderboard_compute_type, deleted_on, num_matches, qualifier_challenge_id, training_challenge_id)  # type: ignore
+    def from_dict(cls, data: Dict[str, Any]) -> Round:
+        return decoder(cls)(data)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from dataclasses import MISSING, field, fields
+import threading
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+_API_NAME = "api_name"
+_REQUIRED = "required"
+_DECODE = "decode"
+
+
+def api_field(
+    api_name: Optional[str] = None,
+    required: bool = False,
+    decode: Optional[Callable[[Any], Any]] = None,
+    **kwargs: Any,
+) -> Any:
+    """Declares how a dataclass field is read from the API's JSON.
+
+    Args:
+        api_name (Optional[str], optional): Key of the field in the JSON. Defaults to the camelCase field name.
+        required (bool, optional): Raise a ValueError if the key is missing or null. Defaults to False.
+        decode (Optional[Callable[[Any], Any]], optional): Converts the raw JSON value (possibly None). Defaults to None.
+
+    Returns:
+        Any: The dataclass field.
+    """
+    metadata = dict(kwargs.pop("metadata", None) or {})
+    metadata.update({_API_NAME: api_name, _REQUIRED: required, _DECODE: decode})
+    return field(metadata=metadata, **kwargs)
+
+
+def camel_case(name: str) -> str:
+    """Converts a snake_case field name to the camelCase used by the API, e.g. club_match_live_id -> clubMatchLiveId."""
+    first, *rest = name.split("_")
+    return first + "".join(part.capitalize() for part in rest)
+
+
+def list_of(cls: Type[T]) -> Callable[[Optional[List[Dict[str, Any]]]], List[T]]:
+    """Returns a decode function for a JSON list of cls objects, where null means empty."""
+
+    def decode(data: Optional[List[Dict[str, Any]]]) -> List[T]:
+        item_decoder = decoder(cls)
+        return [item_decoder(item) for item in data or ()]
+
+    return decode
+
+
+class _Decoders(Dict[type, Callable[[Dict[str, Any]], Any]]):
+    """Decoder of each dataclass, compiled on first lookup."""
+
+    def __missing__(self, cls: type) -> Callable[[Dict[str, Any]], Any]:
+        with _decoders_lock:
+            compiled = self.get(cls)
+            if compiled is None:
+                compiled = self[cls] = _compile(cls)
+        return compiled
+
+
+_decoders = _Decoders()
+_decoders_lock = threading.Lock()
+
+decoder: Callable[[type], Callable[[Dict[str, Any]], Any]] = _decoders.__getitem__
+"""Returns the function building a cls dataclass from its JSON dict, compiling it on first use.
+
+Fields are read from their camelCase name unless declared otherwise with api_field. The key
+of every field is resolved once and the generated function reads them with no per-field
+lookups, then sets the fields of a new instance directly instead of calling __init__.
+Frozen dataclasses can't be set that way and go through __init__, which is about three
+times slower.
+
+This is the dict lookup itself rather than a function wrapping it: from_dict methods call it
+on every decode, and an extra Python call costs about as much as decoding a small model.
+"""
+
+
+def _compile(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    cls_fields = fields(cls)
+    frozen = cls.__dataclass_params__.frozen  # type: ignore
+    namespace: Dict[str, Any] = {"cls": cls, "new": object.__new__}
+    lines = ["def decode(data):", "    get = data.get"]
+    args = []
+    for f in cls_fields:
+        if not f.init:
+            continue
+        key = f.metadata.get(_API_NAME) or camel_case(f.name)
+        value = f"get({key!r})"
+        if f.default is not MISSING and f.default is not None:
+            namespace[f"default_{f.name}"] = f.default
+            value = f"get({key!r}, default_{f.name})"
+        if f.metadata.get(_DECODE) is not None:
+            namespace[f"decode_{f.name}"] = f.metadata[_DECODE]
+            value = f"decode_{f.name}({value})"
+        lines.append(f"    v_{f.name} = {value}")
+        if f.metadata.get(_REQUIRED):
+            message = f"Invalid {cls.__name__} data: missing '{key}'"
+            lines.append(f"    if v_{f.name} is None: raise ValueError({message!r})")
+        args.append(f"v_{f.name}")
+
+    if frozen:
+        lines.append(f"    return cls({', '.join(args)})")
+    else:
+        # Same result as cls(...), including init=False defaults and __post_init__, without
+        # the cost of calling __init__.
+        lines.append("    obj = new(cls)")
+        for f in cls_fields:
+            if f.init:
+                lines.append(f"    obj.{f.name} = v_{f.name}")
+            elif f.default is not MISSING:
+                namespace[f"default_{f.name}"] = f.default
+                lines.append(f"    obj.{f.name} = default_{f.name}")
+            elif f.default_factory is not MISSING:
+                namespace[f"factory_{f.name}"] = f.default_factory
+                lines.append(f"    obj.{f.name} = factory_{f.name}()")
+        if hasattr(cls, "__post_init__"):
+            lines.append("    obj.__post_init__()")
+        lines.append("    return obj")
+
+    exec("\n".join(lines), namespace)
+    decode = namespace["decode"]
+    decode.__qualname__ = f"decoder({cls.__name__})"
+    return decode
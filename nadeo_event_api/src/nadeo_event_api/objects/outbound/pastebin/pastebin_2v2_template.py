@@ -1,34 +1,18 @@
 PASTEBIN_TEMPLATE_DICT = [
-  {
-    "Id": "",
-    "Name": "",
-    "Players": [
-      {
-        "AccountId": "",
-        "Name": "",
-        "PhotoUrl": ""
-      },
-      {
-        "AccountId": "",
-        "Name": "",
-        "PhotoUrl": ""
-      }
-    ]
-  },
     {
-    "Id": "",
-    "Name": "",
-    "Players": [
-      {
-        "AccountId": "",
+        "Id": "",
         "Name": "",
-        "PhotoUrl": ""
-      },
-      {
-        "AccountId": "",
+        "Players": [
+            {"AccountId": "", "Name": "", "PhotoUrl": ""},
+            {"AccountId": "", "Name": "", "PhotoUrl": ""},
+        ],
+    },
+    {
+        "Id": "",
         "Name": "",
-        "PhotoUrl": ""
-      }
-    ]
-  }
-]
\ No newline at end of file
+        "Players": [
+            {"AccountId": "", "Name": "", "PhotoUrl": ""},
+            {"AccountId": "", "Name": "", "PhotoUrl": ""},
+        ],
+    },
+]
@@ -1,6 +1,8 @@
 from typing import List
 
-from nadeo_event_api.objects.outbound.pastebin.pastebin_2v2_template import PASTEBIN_TEMPLATE_DICT
+from nadeo_event_api.objects.outbound.pastebin.pastebin_2v2_template import (
+    PASTEBIN_TEMPLATE_DICT,
+)
 
 
 class Tmwt2v2PasteTeam:
@@ -19,6 +21,7 @@ class Tmwt2v2PasteTeam:
     def members(self) -> List[str]:
         return [self.p1_tm_account_id, self.p2_tm_account_id]
 
+
 class Tmwt2v2Paste:
     def __init__(
         self,
@@ -40,4 +43,4 @@ class Tmwt2v2Paste:
         pastebin_json[1]["Players"][0]["AccountId"] = self.team_b.p1_tm_account_id
         pastebin_json[1]["Players"][1]["AccountId"] = self.team_b.p2_tm_account_id
 
-        return pastebin_json
\ No newline at end of file
+        return pastebin_json
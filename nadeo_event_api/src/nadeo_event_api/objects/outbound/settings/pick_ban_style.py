@@ -1,7 +1,9 @@
 import json
 
+from ....api.structure.memoized import Memoized
 
-class PickBanStyle:
+
+class PickBanStyle(Memoized):
     def __init__(
         self,
         background: str = "",
@@ -13,7 +15,7 @@ class PickBanStyle:
         self.top_left_logo = top_left_logo
         self.top_right_logo = top_right_logo
         self.bottom_logo = bottom_logo
-        
+
     def as_jsonable_string(self) -> str:
         pick_ban_style = {
             "Background": self.background,
@@ -22,4 +24,4 @@ class PickBanStyle:
             "BottomLogo": self.bottom_logo,
         }
 
-        return json.dumps(pick_ban_style)
\ No newline at end of file
+        return json.dumps(pick_ban_style)
@@ -1,10 +1,16 @@
 import os
+import tempfile
 import pytest
 from src.nadeo_event_api.environment import MY_CLUB
+from src.nadeo_event_api.api.authenticate import UbiTokenManager
 from src.nadeo_event_api.api.club.campaign import Campaign
+from src.nadeo_event_api.api.club.campaign_catalog import CampaignCatalog
+from src.nadeo_event_api.api.http_client import NadeoApiError, NadeoHttpClient
 from src.nadeo_event_api.api.structure.maps import PlaylistMap
 import unittest
 
+from ..utils_for_test import FakeAdapter
+
 
 class TestCampaign(unittest.TestCase):
     @pytest.mark.integration
@@ -23,3 +29,66 @@ class TestCampaign(unittest.TestCase):
         ]
 
         self.assertEqual(expected, test_campaign._playlist)
+
+    def test_playlist_is_loaded_lazily_and_cataloged(self):
+        adapter = FakeAdapter(
+            [
+                (
+                    200,
+                    {
+                        "campaign": {
+                            "playlist": [{"id": 1, "position": 0, "mapUid": "map_0"}]
+                        }
+                    },
+                )
+            ]
+        )
+        NadeoHttpClient().configure(adapter=adapter)
+        UbiTokenManager().nadeo_live_token = "token"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "catalog.json")
+            try:
+                campaign = Campaign(1, 2, catalog=CampaignCatalog(path))
+                self.assertEqual(adapter.sent, [])
+
+                self.assertEqual(campaign.playlist, [PlaylistMap("map_0", 0)])
+                self.assertEqual(campaign._playlist, [PlaylistMap("map_0", 0)])
+                self.assertEqual(len(adapter.sent), 1)
+
+                cataloged = Campaign(1, 2, catalog=CampaignCatalog(path))
+                self.assertEqual(cataloged.playlist, [PlaylistMap("map_0", 0)])
+                self.assertEqual(len(adapter.sent), 1)
+            finally:
+                NadeoHttpClient().configure()
+                UbiTokenManager().nadeo_live_token = None
+
+    def test_failed_playlist_fetch_is_remembered(self):
+        adapter = FakeAdapter([(404, [{"message": "Campaign not found"}])])
+        NadeoHttpClient().configure(adapter=adapter)
+        UbiTokenManager().nadeo_live_token = "token"
+        try:
+            campaign = Campaign(1, 2)
+            with self.assertRaises(NadeoApiError) as raised:
+                campaign.playlist
+            self.assertEqual(raised.exception.status_code, 404)
+
+            with self.assertRaises(NadeoApiError):
+                campaign._playlist
+            self.assertEqual(len(adapter.sent), 1)
+        finally:
+            NadeoHttpClient().configure()
+            UbiTokenManager().nadeo_live_token = None
+
+    def test_catalog_keeps_entries_written_by_others(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "catalog.json")
+            first = CampaignCatalog(path)
+            second = CampaignCatalog(path)
+
+            first.put(1, 2, [PlaylistMap("map_0", 0)])
+            second.put(3, 4, [PlaylistMap("map_1", 0)])
+
+            reloaded = CampaignCatalog(path)
+            self.assertEqual(reloaded.get(1, 2), [PlaylistMap("map_0", 0)])
+            self.assertEqual(reloaded.get(3, 4), [PlaylistMap("map_1", 0)])
+            self.assertEqual(second.get(1, 2), [PlaylistMap("map_0", 0)])
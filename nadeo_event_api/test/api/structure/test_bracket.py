@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+import unittest
+
+from src.nadeo_event_api.api.structure.enums import ScriptType
+from src.nadeo_event_api.api.structure.event import Event
+from src.nadeo_event_api.api.structure.maps import Map
+from src.nadeo_event_api.api.structure.round.bracket import BracketGraph
+from src.nadeo_event_api.api.structure.round.match import Match
+from src.nadeo_event_api.api.structure.round.match_spot import (
+    MatchParticipantMatchSpot,
+    SeedMatchSpot,
+)
+from src.nadeo_event_api.api.structure.round.round import Round, RoundConfig
+
+START = datetime(2030, 1, 1, 20)
+
+
+def make_round(index, matches, max_players=4):
+    return Round(
+        name=f"round_{index}",
+        start_date=START + timedelta(hours=index),
+        end_date=START + timedelta(hours=index, minutes=50),
+        matches=matches,
+        config=RoundConfig(
+            map_pool=[Map("map")], script=ScriptType.CUP, max_players=max_players
+        ),
+    )
+
+
+def seeds(*seeds):
+    return Match(spots=[SeedMatchSpot(seed) for seed in seeds])
+
+
+def outcomes(*refs):
+    return Match(spots=[MatchParticipantMatchSpot(*ref) for ref in refs])
+
+
+class TestBracketGraph(unittest.TestCase):
+    def setUp(self):
+        self.rounds = [
+            make_round(0, [seeds(1, 4), seeds(2, 3)]),
+            make_round(1, [outcomes((0, 0, 1), (0, 1, 1))]),
+            make_round(2, [outcomes((1, 0, 1), (0, 0, 2))]),
+            make_round(3, []),
+        ]
+
+    def test_valid_bracket(self):
+        graph = BracketGraph(self.rounds)
+        self.assertEqual(graph.errors, [])
+        self.assertEqual(graph.upstream[(2, 0)], [(1, 0), (0, 0)])
+        self.assertEqual(graph.consumer_of(0, 0, 2), (2, 0, 1))
+        self.assertIsNone(graph.consumer_of(0, 1, 2))
+
+    def test_invalid_references(self):
+        self.rounds[1]._matches.append(
+            outcomes((0, 0, 1), (0, 5, 1), (0, 1, 3), (1, 0, 1))
+        )
+        self.rounds[2]._matches.append(seeds(1, 1, 2, 3, 4))
+
+        errors = BracketGraph(self.rounds).errors
+
+        self.assertEqual(len(errors), 6)
+        self.assertIn("already used by round 1 match 0 spot 0", errors[0])
+        self.assertIn("round 0 match 5, which doesn't exist", errors[1])
+        self.assertIn("rank 3 of round 0 match 1", errors[2])
+        self.assertIn("may only reference earlier rounds", errors[3])
+        self.assertIn("has 5 spots but the round allows 4 players", errors[4])
+        self.assertIn("uses seed 1", errors[5])
+
+    def test_timing(self):
+        self.rounds[1]._start_date = self.rounds[0]._end_date - timedelta(minutes=1)
+        errors = BracketGraph(self.rounds).errors
+        self.assertEqual(len(errors), 2)
+        self.assertIn("depends on round 0, which ends after round 1 starts", errors[0])
+
+    def test_event_valid(self):
+        self.assertTrue(Event(name="bracket", club_id=1, rounds=self.rounds).valid())
+        self.rounds[2]._matches[0]._spots[1]._rank = 1
+        self.assertFalse(Event(name="bracket", club_id=1, rounds=self.rounds).valid())
@@ -14,7 +14,10 @@ from src.nadeo_event_api.api.structure.round.match_spot import SeedMatchSpot
 from src.nadeo_event_api.api.structure.round.match import Match
 from src.nadeo_event_api.api.structure.round.round import Round, RoundConfig
 from src.nadeo_event_api.api.structure.event import Event
-from src.nadeo_event_api.api.event_api import get_rounds_for_event, get_matches_for_round
+from src.nadeo_event_api.api.event_api import (
+    get_rounds_for_event,
+    get_matches_for_round,
+)
 
 
 class TestEvent(unittest.TestCase):
@@ -68,6 +71,78 @@ class TestEvent(unittest.TestCase):
 
         self.assertTrue(are_json_structures_equal(expected, actual))
 
+    def test_as_jsonable_dict_reuses_unchanged_components(self):
+        spot = SeedMatchSpot(seed=1)
+        config = RoundConfig(
+            map_pool=[Map("round_map")], script=ScriptType.CUP, max_players=32
+        )
+        round = Round(
+            name="round_1",
+            start_date=datetime(2023, 11, 3, 21, 5),
+            end_date=datetime(2023, 11, 3, 21, 15),
+            matches=[Match(spots=[spot, SeedMatchSpot(seed=2)])],
+            config=config,
+        )
+        event = Event(name="my_event", club_id=123, rounds=[round])
+
+        first = event._as_jsonable_dict()
+        second = event._as_jsonable_dict()
+        self.assertIs(
+            first["rounds"][0]["config"]["scriptSettings"],
+            second["rounds"][0]["config"]["scriptSettings"],
+        )
+        first_match = first["spotStructure"]["rounds"][0]["matchGeneratorData"][
+            "matches"
+        ][0]
+        second_match = second["spotStructure"]["rounds"][0]["matchGeneratorData"][
+            "matches"
+        ][0]
+        self.assertIs(first_match, second_match)
+
+        spot._seed = 3
+        config._map_pool[0]._uuid = "other_map"
+        round._matches.append(Match(spots=[SeedMatchSpot(seed=4)]))
+        third = event._as_jsonable_dict()
+        matches = third["spotStructure"]["rounds"][0]["matchGeneratorData"]["matches"]
+        self.assertEqual(matches[0]["spots"][0]["seed"], 3)
+        self.assertEqual(len(matches), 2)
+        self.assertEqual(third["rounds"][0]["nbMatches"], 2)
+        self.assertEqual(third["rounds"][0]["config"]["maps"], ["other_map"])
+        self.assertEqual(first_match["spots"][0]["seed"], 1)
+
+    def test_as_jsonable_dict_notices_items_replaced_in_place(self):
+        match = Match(spots=[SeedMatchSpot(seed=1), SeedMatchSpot(seed=2)])
+        config = RoundConfig(
+            map_pool=[Map("round_map")], script=ScriptType.CUP, max_players=32
+        )
+        round = Round(
+            name="round_1",
+            start_date=datetime(2023, 11, 3, 21, 5),
+            end_date=datetime(2023, 11, 3, 21, 15),
+            matches=[match],
+            config=config,
+        )
+        event = Event(name="my_event", club_id=123, rounds=[round])
+        event._as_jsonable_dict()
+
+        match._spots[0] = SeedMatchSpot(seed=5)
+        config._map_pool[0] = Map("other_map")
+        event._rounds[0] = Round(
+            name="round_2",
+            start_date=round._start_date,
+            end_date=round._end_date,
+            matches=[match],
+            config=config,
+        )
+        payload = event._as_jsonable_dict()
+
+        self.assertEqual(payload["rounds"][0]["name"], "round_2")
+        self.assertEqual(payload["rounds"][0]["config"]["maps"], ["other_map"])
+        spots = payload["spotStructure"]["rounds"][0]["matchGeneratorData"]["matches"][
+            0
+        ]["spots"]
+        self.assertEqual(spots[0]["seed"], 5)
+
     @pytest.mark.integration
     def test_post_and_delete_event(self):
         now = datetime.utcnow()
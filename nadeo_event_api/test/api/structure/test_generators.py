@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+from itertools import combinations
+import unittest
+
+from src.nadeo_event_api.api.structure.enums import ScriptType
+from src.nadeo_event_api.api.structure.maps import Map
+from src.nadeo_event_api.api.structure.round.bracket import BracketGraph
+from src.nadeo_event_api.api.structure.round.generators import (
+    bracket_order,
+    double_elimination,
+    group_matches,
+    round_robin,
+    rounds_from_matches,
+    single_elimination,
+    snake_groups,
+    swiss,
+)
+from src.nadeo_event_api.api.structure.round.match_spot import QualificationMatchSpot
+from src.nadeo_event_api.api.structure.round.round import RoundConfig
+
+
+def compile(matches, max_players=2) -> BracketGraph:
+    config = RoundConfig(
+        map_pool=[Map("map")], script=ScriptType.CUP, max_players=max_players
+    )
+    return BracketGraph(
+        rounds_from_matches(matches, datetime(2030, 1, 1), timedelta(hours=1), config)
+    )
+
+
+def seeds(match):
+    return [spot._seed for spot in match._spots]
+
+
+class TestGenerators(unittest.TestCase):
+    def test_seeding(self):
+        self.assertEqual(bracket_order(8), [1, 8, 4, 5, 2, 7, 3, 6])
+        self.assertEqual(snake_groups(10, 3), [[1, 6, 7], [2, 5, 8], [3, 4, 9, 10]])
+        group = group_matches(8, 4, lambda seed: QualificationMatchSpot(0, seed))[0][0]
+        self.assertEqual([spot._rank for spot in group._spots], [1, 4, 5, 8])
+
+    def test_single_elimination(self):
+        matches = single_elimination(256)
+        self.assertEqual([len(r) for r in matches], [128, 64, 32, 16, 8, 4, 2, 1])
+        self.assertEqual(seeds(matches[0][0]), [1, 256])
+        self.assertTrue(compile(matches).valid)
+
+        matches = single_elimination(64, match_size=4, advance=1)
+        self.assertEqual([len(r) for r in matches], [16, 4, 1])
+        self.assertEqual(seeds(matches[0][0]), [1, 32, 33, 64])
+        self.assertTrue(compile(matches, 4).valid)
+        with self.assertRaises(ValueError):
+            single_elimination(48)
+
+    def test_double_elimination(self):
+        matches = double_elimination(8)
+        # Upper round, then upper + lower rounds, then the lower final and the grand final.
+        self.assertEqual([len(r) for r in matches], [4, 4, 3, 1, 1, 1])
+        self.assertTrue(compile(matches).valid)
+        self.assertTrue(compile(double_elimination(256)).valid)
+
+    def test_swiss(self):
+        self.assertTrue(compile(swiss(256, 5)).valid)
+        self.assertTrue(compile(swiss(64, 2, match_size=4), 4).valid)
+        with self.assertRaises(ValueError):
+            swiss(16, 5)
+
+    def test_round_robin(self):
+        for num_players, match_size in ((7, 2), (16, 2), (16, 4), (25, 5), (64, 8)):
+            pairs = set()
+            for matches in round_robin(num_players, match_size):
+                players = [seed for match in matches for seed in seeds(match)]
+                self.assertEqual(len(players), len(set(players)))
+                for match in matches:
+                    pairs.update(combinations(sorted(seeds(match)), 2))
+            self.assertEqual(len(pairs), num_players * (num_players - 1) // 2)
+        with self.assertRaises(ValueError):
+            round_robin(36, 6)
+
+        first_round = round_robin(16, 4)[0]
+        self.assertEqual([seeds(match) for match in first_round], snake_groups(16, 4))
+        match = round_robin(4, spot=lambda seed: QualificationMatchSpot(0, seed))[0][0]
+        self.assertEqual([spot._rank for spot in match._spots], [4, 1])
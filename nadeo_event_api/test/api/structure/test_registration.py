@@ -0,0 +1,79 @@
+from datetime import datetime
+import unittest
+
+import requests
+
+from src.nadeo_event_api.api.authenticate import UbiTokenManager
+from src.nadeo_event_api.api.http_client import NadeoHttpClient
+from src.nadeo_event_api.api.retry import RetryPolicy
+from src.nadeo_event_api.api.structure.event import Event
+from src.nadeo_event_api.api.structure.registration import dispatch_registrations
+from ..utils_for_test import FakeAdapter
+
+
+def make_response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"{}"
+    return response
+
+
+class TestRegistration(unittest.TestCase):
+    def setUp(self):
+        UbiTokenManager().nadeo_club_token = "token"
+
+    def tearDown(self):
+        NadeoHttpClient().configure()
+        UbiTokenManager().nadeo_club_token = None
+
+    def test_dispatch_reports_each_item(self):
+        statuses = {"a": 200, "b": 400}
+
+        def post(item):
+            if item == "c":
+                raise requests.ConnectionError("unreachable")
+            return make_response(statuses[item])
+
+        report = dispatch_registrations(["a", "b", "c"], post)
+
+        self.assertEqual([r.item for r in report.results], ["a", "b", "c"])
+        self.assertEqual([r.success for r in report.results], [True, False, False])
+        self.assertEqual([r.status_code for r in report.results], [200, 400, None])
+        self.assertEqual(report.results[2].error, "unreachable")
+        self.assertEqual([r.item for r in report.failed], ["b", "c"])
+        self.assertFalse(report.all_succeeded)
+
+    def test_add_participants_retries_with_client_policy(self):
+        adapter = FakeAdapter([(503, {}), (200, {}), (400, {"error": "full"})])
+        NadeoHttpClient().configure(
+            adapter=adapter, retry_policy=RetryPolicy(max_retries=2, backoff_factor=0)
+        )
+        event = Event(name="my_event", club_id=123, rounds=[])
+        event._registered_id = 42  # type: ignore
+
+        report = event.add_participants([("p1", 1), ("p2", 2)], max_workers=1)
+
+        self.assertEqual([r.success for r in report.results], [True, False])
+        self.assertEqual(report.results[1].status_code, 400)
+        self.assertEqual(len(adapter.sent), 3)
+
+    def test_add_participants(self):
+        adapter = FakeAdapter([(200, {})] * 3)
+        NadeoHttpClient().configure(adapter=adapter)
+        event = Event(name="my_event", club_id=123, rounds=[])
+        event._registered_id = 42  # type: ignore
+
+        report = event.add_participants([("p1", 1), ("p2", 2), ("p3", 0), ("p4", 3)])
+
+        self.assertEqual([r.success for r in report.results], [True, True, False, True])
+        self.assertEqual(report.results[2].error, "Seeds start at 1.")
+        self.assertEqual(len(adapter.sent), 3)
+
+    def test_add_teams_to_player_event_fails(self):
+        event = Event(name="my_event", club_id=123, rounds=[])
+        event._registered_id = 42  # type: ignore
+
+        report = event.add_teams([("team", ["p1", "p2"], 1)])
+
+        self.assertFalse(report.all_succeeded)
+        self.assertIsNone(report.results[0].status_code)
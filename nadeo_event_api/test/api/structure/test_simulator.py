@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+import unittest
+
+from src.nadeo_event_api.api.structure.enums import ScriptType
+from src.nadeo_event_api.api.structure.maps import Map
+from src.nadeo_event_api.api.structure.round.generators import (
+    rounds_from_matches,
+    single_elimination,
+)
+from src.nadeo_event_api.api.structure.round.match import Match
+from src.nadeo_event_api.api.structure.round.match_spot import SeedMatchSpot
+from src.nadeo_event_api.api.structure.round.round import RoundConfig
+from src.nadeo_event_api.api.structure.round.simulator import BracketSimulator
+from src.nadeo_event_api.api.structure.round.spot_structure import SpotStructure
+
+
+def make_rounds(matches):
+    config = RoundConfig(map_pool=[Map("map")], script=ScriptType.CUP, max_players=4)
+    return rounds_from_matches(
+        matches, datetime(2030, 1, 1), timedelta(hours=1), config
+    )
+
+
+class TestBracketSimulator(unittest.TestCase):
+    def test_random_outcomes(self):
+        rounds = make_rounds(single_elimination(8))
+        report = BracketSimulator(SpotStructure(rounds)).run(4000, seed=1)
+
+        self.assertEqual(report.num_players, 8)
+        self.assertEqual(report.reach[0], [1.0] * 8)
+        for probability in report.reach[2]:
+            self.assertAlmostEqual(probability, 0.25, delta=0.05)
+        self.assertAlmostEqual(sum(report.outcomes[(2, 0, 1)]), 1.0)
+        self.assertEqual(report.unreachable, [])
+        self.assertEqual(report.duplicates, [])
+
+    def test_strengths(self):
+        rounds = make_rounds(single_elimination(8))
+        strengths = [4.0] + [0.0] * 7
+        report = BracketSimulator(rounds, strengths=strengths).run(2000, seed=1)
+        self.assertGreater(report.outcome_probability(2, 0, 1, seed=1), 0.8)
+
+    def test_structure_errors(self):
+        matches = single_elimination(8)
+        matches[0][3] = Match(spots=[SeedMatchSpot(1), SeedMatchSpot(9)])
+        report = BracketSimulator(make_rounds(matches), num_players=8).run(100, seed=1)
+
+        self.assertEqual(report.unreachable, [(0, 3, 1)])
+        # Seed 1 plays twice in round 0, then can win both matches and meet itself.
+        self.assertEqual(report.duplicates[:3], [(0, 0, 0), (0, 3, 0), (1, 0, 0)])
+        # Seeds 3 and 6 lost their match.
+        self.assertEqual([report.reach[0][2], report.reach[0][5]], [0.0, 0.0])
+        self.assertEqual(report.reach[0][0], 2.0)
@@ -0,0 +1,220 @@
+from datetime import datetime, timedelta
+import unittest
+
+from src.nadeo_event_api.api.structure.enums import (
+    AutoStartMode,
+    LeaderboardType,
+    PluginType,
+    ScriptType,
+)
+from src.nadeo_event_api.api.structure.event import Event
+from src.nadeo_event_api.api.structure.maps import Map
+from src.nadeo_event_api.api.structure.round.match import Match
+from src.nadeo_event_api.api.structure.round.match_spot import SeedMatchSpot
+from src.nadeo_event_api.api.structure.round.qualifier import Qualifier, QualifierConfig
+from src.nadeo_event_api.api.structure.round.round import Round, RoundConfig
+from src.nadeo_event_api.api.structure.settings.plugin_settings import (
+    ClassicPluginSettings,
+    QualifierPluginSettings,
+)
+from src.nadeo_event_api.api.structure.settings.script_settings import (
+    BaseScriptSettings,
+    KnockoutScriptSettings,
+    TimeAttackScriptSettings,
+)
+from src.nadeo_event_api.api.structure.template import EventTemplate, parse_duration
+
+TEMPLATE = "test/api/structure/resources/daily_ko.yaml"
+
+
+def daily_ko(start: datetime, maps, players: int) -> Event:
+    qualifier = Qualifier(
+        name="Qualifier",
+        start_date=start + timedelta(minutes=7),
+        end_date=start + timedelta(minutes=13),
+        leaderboard_type=LeaderboardType.SUMSCORE,
+        config=QualifierConfig(
+            map_pool=maps,
+            script=ScriptType.TIME_ATTACK,
+            script_settings=TimeAttackScriptSettings(time_limit=300),
+            plugin_settings=QualifierPluginSettings(use_playlist_complete=True),
+            plugin=PluginType.CLUB,
+        ),
+    )
+    return Event(
+        name=f"Daily KO {start:%d/%m}",
+        club_id=69352,
+        description=f"Knockout of {players} players.",
+        registration_start_date=start - timedelta(minutes=3),
+        registration_end_date=start + timedelta(minutes=6),
+        rounds=[
+            Round(
+                name="Knockout",
+                start_date=start + timedelta(minutes=7),
+                end_date=start + timedelta(minutes=66),
+                qualifier=qualifier,
+                matches=[Match([SeedMatchSpot(x) for x in range(1, players + 1)])],
+                config=RoundConfig(
+                    map_pool=maps,
+                    script=ScriptType.KNOCKOUT,
+                    script_settings=KnockoutScriptSettings(
+                        base_script_settings=BaseScriptSettings(
+                            warmup_number=1, warmup_duration=75
+                        ),
+                        finish_timeout=15,
+                        rounds_without_elimination=1,
+                    ),
+                    plugin_settings=ClassicPluginSettings(
+                        auto_start_mode=AutoStartMode.DELAY, auto_start_delay=120
+                    ),
+                    max_players=players,
+                    plugin=PluginType.CLUB,
+                ),
+            )
+        ],
+    )
+
+
+class TestEventTemplate(unittest.TestCase):
+    def test_build_matches_handwritten_event(self):
+        template = EventTemplate.from_file(TEMPLATE)
+        self.assertIs(EventTemplate.from_file(TEMPLATE), template)
+
+        start = datetime(2030, 1, 1, 20)
+        maps = [Map("map_1"), Map("map_2")]
+        for players in (64, 32):
+            self.assertEqual(
+                template.build(start, maps, players=players)._as_jsonable_dict(),
+                daily_ko(start, maps, players)._as_jsonable_dict(),
+            )
+        self.assertEqual(
+            template.build(start, maps)._as_jsonable_dict(),
+            daily_ko(start, maps, 64)._as_jsonable_dict(),
+        )
+
+    def test_settings_shared_between_events(self):
+        template = EventTemplate.from_file(TEMPLATE)
+        maps = [Map("map_1")]
+        first, second = template.build_many(
+            [datetime(2030, 1, 1, 20), datetime(2030, 1, 2, 20)], maps
+        )
+        self.assertIs(first._rounds[0]._config, second._rounds[0]._config)
+        self.assertIs(
+            first._rounds[0]._config.as_jsonable_dict(),
+            second._rounds[0]._config.as_jsonable_dict(),
+        )
+        self.assertNotEqual(first._name, second._name)
+
+    def test_bracket_rounds(self):
+        template = EventTemplate(
+            {
+                "name": "Cup",
+                "club_id": 1,
+                "rounds": [
+                    {
+                        "bracket": {
+                            "type": "single_elimination",
+                            "num_players": "{players}",
+                            "match_size": 4,
+                        },
+                        "duration": "40m",
+                        "gap": 5,
+                        "config": {"script": "CUP", "max_players": 4},
+                    }
+                ],
+            }
+        )
+        event = template.build(datetime(2030, 1, 1, 20), players=64)
+        self.assertEqual([len(r._matches) for r in event._rounds], [16, 8, 4, 2, 1])
+        self.assertEqual(event._rounds[1]._name, "Round 2")
+        self.assertTrue(event.valid())
+
+    def test_bracket_qualifier_on_first_round(self):
+        template = EventTemplate(
+            {
+                "name": "Cup",
+                "club_id": 1,
+                "rounds": [
+                    {
+                        "bracket": {
+                            "type": "single_elimination",
+                            "num_players": 16,
+                            "match_size": 4,
+                        },
+                        "duration": "40m",
+                        "qualifier": {
+                            "duration": "10m",
+                            "config": {"script": "TIME_ATTACK"},
+                        },
+                        "config": {"script": "CUP", "max_players": 4},
+                    }
+                ],
+            }
+        )
+        start = datetime(2030, 1, 1, 20)
+        first, second, *_ = template.build(start)._rounds
+        self.assertEqual(first._qualifier._name, "Qualifier")
+        self.assertEqual(first._qualifier._end_date, start + timedelta(minutes=10))
+        self.assertEqual(first._start_date, start + timedelta(minutes=10))
+        self.assertIsNone(second._qualifier)
+
+    def test_invalid(self):
+        self.assertEqual(parse_duration("-1h30m"), -timedelta(minutes=90))
+        with self.assertRaises(ValueError):
+            parse_duration("soon")
+        with self.assertRaises(ValueError):
+            EventTemplate(
+                {
+                    "name": "Cup",
+                    "club_id": 1,
+                    "rounds": [
+                        {
+                            "config": {
+                                "script": "CUP",
+                                "script_settings": {
+                                    "type": "CupScriptSettings",
+                                    "typo": 1,
+                                },
+                            }
+                        }
+                    ],
+                }
+            )
+
+        def build(round: dict) -> Event:
+            return EventTemplate(
+                {"name": "Cup", "club_id": 1, "rounds": [round]}
+            ).build(datetime(2030, 1, 1))
+
+        round = {
+            "name": "Cup",
+            "duration": 60,
+            "config": {"script": "CUP", "max_players": 4},
+        }
+        bracket = {"type": "single_elimination", "num_players": 16, "match_size": 4}
+        for invalid, message in (
+            (
+                {**round, "config": {"script": "CUP"}},
+                "RoundConfig is missing 'max_players'",
+            ),
+            (
+                {**round, "config": {"script": "CUPS", "max_players": 4}},
+                "unknown ScriptType 'CUPS'",
+            ),
+            (
+                {**round, "bracket": {**bracket, "type": "ladder"}},
+                "unknown bracket type 'ladder'",
+            ),
+            (
+                {**round, "bracket": {**bracket, "size": 4}},
+                "single_elimination bracket has no setting 'size'",
+            ),
+            ({"name": "Cup", "config": round["config"]}, "round is missing 'duration'"),
+            ({**round, "name": "Cup {missing}"}, "unknown parameter 'missing'"),
+            ({**round, "matches": {"players": 4}}, "matches is missing 'seeds'"),
+            ({**round, "matches": [[1, "2"]]}, "invalid spot '2'"),
+        ):
+            with self.assertRaisesRegex(
+                ValueError, f"^Invalid event template: {message}"
+            ):
+                build(invalid)
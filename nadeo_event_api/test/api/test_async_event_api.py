@@ -0,0 +1,57 @@
+import asyncio
+import unittest
+
+from src.nadeo_event_api.api.async_event_api import AsyncEventApi
+from src.nadeo_event_api.api.authenticate import UbiTokenManager
+from src.nadeo_event_api.api.http_client import NadeoHttpClient
+from .utils_for_test import FakeAdapter
+
+
+def match_results_body(match_live_id: str) -> dict:
+    return {
+        "matchLiveId": match_live_id,
+        "roundPosition": 0,
+        "results": [
+            {
+                "participant": "tm_acc_1",
+                "rank": 1,
+                "score": 10,
+                "zone": None,
+                "team": None,
+            }
+        ],
+        "teams": [],
+    }
+
+
+class TestAsyncEventApi(unittest.TestCase):
+    def setUp(self):
+        UbiTokenManager().nadeo_club_token = "token"
+
+    def tearDown(self):
+        NadeoHttpClient().configure()
+        UbiTokenManager().nadeo_club_token = None
+
+    def test_get_results_for_matches(self):
+        adapter = FakeAdapter([(200, match_results_body("LID-MTCH-1"))] * 8)
+        NadeoHttpClient().configure(adapter=adapter)
+
+        async def fetch():
+            async with AsyncEventApi(max_concurrency=4) as api:
+                return await api.get_results_for_matches(range(8), 10, 0)
+
+        results = asyncio.run(fetch())
+
+        self.assertEqual(len(results), 8)
+        self.assertEqual(results[0].get_rank("tm_acc_1"), 1)
+        self.assertEqual(
+            sorted(r.url for r in adapter.sent),
+            sorted(
+                f"https://meet.trackmania.nadeo.club/api/matches/{i}/results?length=10&offset=0"
+                for i in range(8)
+            ),
+        )
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            AsyncEventApi(max_concurrency=0)
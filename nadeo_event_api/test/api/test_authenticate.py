@@ -0,0 +1,116 @@
+import asyncio
+import base64
+from concurrent.futures import ThreadPoolExecutor
+import json
+import time
+import unittest
+
+from src.nadeo_event_api.api.authenticate import (
+    NadeoToken,
+    UbiTokenManager,
+    _jwt_expiry,
+)
+from src.nadeo_event_api.api.enums import NadeoService
+from src.nadeo_event_api.api.http_client import NadeoApiError, NadeoHttpClient
+from .utils_for_test import FakeAdapter
+
+
+def make_jwt(exp: float) -> str:
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'HS256'})}.{encode({'exp': exp})}.signature"
+
+
+class TestUbiTokenManager(unittest.TestCase):
+    def tearDown(self):
+        NadeoHttpClient().configure()
+        UbiTokenManager().nadeo_club_token = None
+
+    def test_jwt_expiry(self):
+        self.assertEqual(_jwt_expiry(make_jwt(1700000000)), 1700000000)
+        self.assertIsNone(_jwt_expiry("not-a-jwt"))
+
+    def test_expires_within(self):
+        self.assertFalse(NadeoToken("token").expires_within(60))
+        self.assertTrue(
+            NadeoToken("token", expires_at=time.time() + 30).expires_within(60)
+        )
+        self.assertFalse(
+            NadeoToken("token", expires_at=time.time() + 3600).expires_within(60)
+        )
+
+    def test_valid_token_is_reused(self):
+        adapter = FakeAdapter([])
+        NadeoHttpClient().configure(adapter=adapter)
+        token = make_jwt(time.time() + 3600)
+        UbiTokenManager().nadeo_club_token = token
+
+        self.assertEqual(UbiTokenManager().nadeo_club_token, token)
+        self.assertEqual(adapter.sent, [])
+
+    def test_expiring_token_is_refreshed(self):
+        refreshed = make_jwt(time.time() + 3600)
+        adapter = FakeAdapter(
+            [(200, {"accessToken": refreshed, "refreshToken": "refresh_2"})]
+        )
+        NadeoHttpClient().configure(adapter=adapter)
+        UbiTokenManager()._tokens[NadeoService.CLUB] = NadeoToken(
+            make_jwt(time.time() + 10), "refresh_1", time.time() + 10
+        )
+
+        self.assertEqual(UbiTokenManager().nadeo_club_token, refreshed)
+        self.assertEqual(len(adapter.sent), 1)
+        self.assertEqual(
+            adapter.sent[0].headers["Authorization"], "nadeo_v1 t=refresh_1"
+        )
+        self.assertEqual(
+            UbiTokenManager()._tokens[NadeoService.CLUB].refresh_token, "refresh_2"
+        )
+
+    def login_responses(self, access_token: str) -> list:
+        return [
+            (200, {"ticket": "ticket"}),
+            (200, {"accessToken": access_token, "refreshToken": "refresh"}),
+        ]
+
+    def test_concurrent_threads_login_once(self):
+        access_token = make_jwt(time.time() + 3600)
+        adapter = FakeAdapter(self.login_responses(access_token))
+        NadeoHttpClient().configure(adapter=adapter)
+        UbiTokenManager().nadeo_club_token = None
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(
+                executor.map(lambda _: UbiTokenManager().nadeo_club_token, range(16))
+            )
+
+        self.assertEqual(set(tokens), {access_token})
+        self.assertEqual(len(adapter.sent), 2)
+
+    def test_concurrent_tasks_login_once(self):
+        access_token = make_jwt(time.time() + 3600)
+        adapter = FakeAdapter(self.login_responses(access_token))
+        NadeoHttpClient().configure(adapter=adapter)
+        UbiTokenManager().nadeo_club_token = None
+
+        async def get_tokens():
+            return await asyncio.gather(
+                *[
+                    UbiTokenManager().get_token_async(NadeoService.CLUB)
+                    for _ in range(16)
+                ]
+            )
+
+        self.assertEqual(set(asyncio.run(get_tokens())), {access_token})
+        self.assertEqual(len(adapter.sent), 2)
+
+    def test_failed_login_raises(self):
+        adapter = FakeAdapter([(401, {"message": "Invalid credentials"})])
+        NadeoHttpClient().configure(adapter=adapter)
+        UbiTokenManager().nadeo_club_token = None
+
+        with self.assertRaises(NadeoApiError) as raised:
+            UbiTokenManager().nadeo_club_token
+        self.assertEqual(raised.exception.status_code, 401)
+        self.assertEqual(len(adapter.sent), 1)
@@ -0,0 +1,40 @@
+import unittest
+
+from src.nadeo_event_api.api.codec import available_codecs, get_codec
+from src.nadeo_event_api.api.http_client import NadeoHttpClient
+from .utils_for_test import FakeAdapter
+
+
+class TestCodec(unittest.TestCase):
+    def tearDown(self):
+        NadeoHttpClient().configure()
+
+    def test_installed_codecs_round_trip(self):
+        payload = {
+            "name": "événement",
+            "rounds": [{"position": 0, "nbMatches": 2}],
+            "x": None,
+        }
+        for name in available_codecs():
+            codec = get_codec(name)
+            self.assertEqual(codec.loads(codec.dumps(payload)), payload, name)
+            self.assertRaises(ValueError, codec.loads, b"{")
+
+    def test_unknown_codec(self):
+        self.assertIn("json", available_codecs())
+        self.assertRaises(ValueError, get_codec, "yaml")
+
+    def test_client_encodes_and_decodes_with_codec(self):
+        adapter = FakeAdapter([(200, {"competition": {"id": 1}})])
+        NadeoHttpClient().configure(adapter=adapter, codec=get_codec("json"))
+
+        response = NadeoHttpClient().post(
+            "https://meet.trackmania.nadeo.club/api/competitions/web/create",
+            json={"name": "my_event"},
+        )
+
+        self.assertEqual(adapter.sent[0].body, b'{"name":"my_event"}')
+        self.assertEqual(adapter.sent[0].headers["Content-Type"], "application/json")
+        self.assertEqual(
+            NadeoHttpClient().decode_json(response), {"competition": {"id": 1}}
+        )
@@ -0,0 +1,92 @@
+import unittest
+
+from src.nadeo_event_api.api.authenticate import UbiTokenManager
+from src.nadeo_event_api.api.event_api import (
+    get_event_leaderboard,
+    get_matches_for_round,
+)
+from src.nadeo_event_api.api.http_client import NadeoHttpClient
+from .utils_for_test import FakeAdapter
+
+LEADERBOARD = [{"participant": "p1", "rank": 1, "score": 3, "zone": "World"}]
+MATCHES = {
+    "matches": [
+        {
+            "id": 1,
+            "name": "m",
+            "clubMatchLiveId": "LID-1",
+            "position": 0,
+            "isCompleted": False,
+            "tags": [],
+            "deletedOn": None,
+        }
+    ]
+}
+
+
+class ValidatorAdapter(FakeAdapter):
+    """Answers 304 when the request carries the ETag of the previous response."""
+
+    def send(self, request, **kwargs):
+        if request.headers.get("If-None-Match") == '"v1"':
+            self.responses.pop(0)
+            self.responses.insert(0, (304, None))
+        response = super().send(request, **kwargs)
+        if response.status_code == 304:
+            response._content = b""
+        response.headers["ETag"] = '"v1"'
+        return response
+
+
+class TestConditionalRequests(unittest.TestCase):
+    def setUp(self):
+        UbiTokenManager().nadeo_club_token = "token"
+
+    def tearDown(self):
+        NadeoHttpClient().configure()
+        UbiTokenManager().nadeo_club_token = None
+
+    def test_not_modified_reuses_model(self):
+        adapter = ValidatorAdapter([(200, LEADERBOARD), (200, LEADERBOARD)])
+        NadeoHttpClient().configure(adapter=adapter)
+
+        first = get_event_leaderboard(1, 10, 0)
+        second = get_event_leaderboard(1, 10, 0)
+
+        self.assertIs(first, second)
+        self.assertEqual(adapter.sent[1].headers["If-None-Match"], '"v1"')
+        self.assertEqual(second.get_rank("p1"), 1)
+
+    def test_identical_body_reuses_model(self):
+        changed = {"matches": MATCHES["matches"] * 2}
+        adapter = FakeAdapter([(200, MATCHES), (200, MATCHES), (200, changed)])
+        NadeoHttpClient().configure(adapter=adapter)
+
+        first = get_matches_for_round(1, 10, 0)
+        second = get_matches_for_round(1, 10, 0)
+        third = get_matches_for_round(1, 10, 0)
+
+        self.assertIs(first[0], second[0])
+        self.assertNotIn("If-None-Match", adapter.sent[1].headers)
+        self.assertEqual(len(third), 2)
+
+    def test_not_modified_after_eviction_gets_the_body(self):
+        client = NadeoHttpClient()
+
+        class EvictingAdapter(ValidatorAdapter):
+            def send(self, request, **kwargs):
+                if "If-None-Match" in request.headers:
+                    client._conditional_store.clear()
+                return super().send(request, **kwargs)
+
+        adapter = EvictingAdapter(
+            [(200, LEADERBOARD), (200, LEADERBOARD), (200, LEADERBOARD)]
+        )
+        client.configure(adapter=adapter)
+
+        get_event_leaderboard(1, 10, 0)
+        leaderboard = get_event_leaderboard(1, 10, 0)
+
+        self.assertEqual(leaderboard.get_rank("p1"), 1)
+        self.assertEqual(len(adapter.sent), 3)
+        self.assertNotIn("If-None-Match", adapter.sent[2].headers)
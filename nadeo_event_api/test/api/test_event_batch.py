@@ -0,0 +1,166 @@
+from contextlib import redirect_stdout
+import io
+import threading
+import time
+import unittest
+
+from src.nadeo_event_api.api.authenticate import UbiTokenManager
+from src.nadeo_event_api.api.event_batch import ScheduledEvent, post_events
+from src.nadeo_event_api.api.http_client import NadeoHttpClient
+from src.nadeo_event_api.api.structure.event import Event
+from src.nadeo_event_api.api.structure.registration import (
+    RegistrationReport,
+    RegistrationResult,
+)
+from .utils_for_test import FakeAdapter
+
+
+class FakeEvent(Event):
+    def __init__(self, name: str, is_valid: bool = True):
+        super().__init__(name=name, club_id=1, rounds=[])
+        self.is_valid = is_valid
+        self.calls = []
+
+    def valid(self) -> bool:
+        print(f"Validating {self._name}")
+        return self.is_valid
+
+    def add_logo(self, logo_url: str) -> None:
+        self.calls.append(("logo", logo_url))
+        if logo_url.startswith("missing"):
+            print(f"Failed to download logo from url: {logo_url}")
+            return
+        self._registered_logo_url = f"https://s3/{logo_url}"
+
+    def add_participants(self, participants, max_workers=8):
+        self.calls.append(("participants", len(participants)))
+        return RegistrationReport(
+            [
+                RegistrationResult(p, success=p[1] != 0, error=None if p[1] else "seed")
+                for p in participants
+            ]
+        )
+
+
+class FakeApi:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def post(self, event: Event):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        if event._name == "broken":
+            return None
+        if event._name == "rejected":
+            raise RuntimeError(
+                'POST /api/competitions failed: 400 {"exception": "bad round"}'
+            )
+        event._registered_id = int(event._name.split("_")[1])
+        event._live_id = f"LID-COMP-{event._registered_id}"
+        return event._registered_id
+
+
+class TestPostEvents(unittest.TestCase):
+    def test_posts_concurrently(self):
+        api = FakeApi(delay=0.05)
+        events = [FakeEvent(f"day_{i}") for i in range(30)]
+        start = time.perf_counter()
+        manifest = post_events(events, max_workers=10, post=api.post)
+
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(api.max_in_flight, 10)
+        self.assertTrue(manifest.all_posted)
+        self.assertEqual(
+            [(e.registered_id, e.live_id) for e in manifest.entries[:2]],
+            [(0, "LID-COMP-0"), (1, "LID-COMP-1")],
+        )
+
+    def test_attaches_logo_and_participants(self):
+        event = FakeEvent("day_1")
+        manifest = post_events(
+            [
+                ScheduledEvent(
+                    event, logo_url="logo.png", participants=[("a", 1), ("b", 0)]
+                ),
+                FakeEvent("broken"),
+            ],
+            post=FakeApi().post,
+        )
+
+        self.assertEqual(event.calls, [("logo", "logo.png"), ("participants", 2)])
+        self.assertEqual([e.name for e in manifest.failed], ["broken"])
+        self.assertEqual(
+            manifest.as_jsonable_dict()[0],
+            {
+                "name": "day_1",
+                "registeredId": 1,
+                "liveId": "LID-COMP-1",
+                "error": None,
+                "logoUrl": "https://s3/logo.png",
+                "failedParticipants": [{"item": ("b", 0), "error": "seed"}],
+                "failedTeams": [],
+            },
+        )
+
+    def test_nothing_posted_if_any_invalid(self):
+        api = FakeApi()
+        events = [FakeEvent(f"day_{i}") for i in range(1, 9)]
+        events[1].is_valid = False
+        output = io.StringIO()
+        with redirect_stdout(output):
+            manifest = post_events(events, post=api.post)
+        self.assertEqual(api.max_in_flight, 0)
+        self.assertEqual(
+            output.getvalue().splitlines(),
+            [f"Validating day_{i}" for i in range(1, 9)],
+        )
+        not_posted = "Not posted, another event is not valid."
+        self.assertEqual(
+            [e.error for e in manifest.entries],
+            [not_posted, "Event is not valid."] + [not_posted] * 6,
+        )
+
+    def test_reports_post_and_logo_errors(self):
+        manifest = post_events(
+            [
+                FakeEvent("rejected"),
+                ScheduledEvent(FakeEvent("day_2"), logo_url="missing.png"),
+            ],
+            post=FakeApi().post,
+        )
+
+        rejected, day = manifest.entries
+        self.assertFalse(rejected.posted)
+        self.assertIn('{"exception": "bad round"}', rejected.error)
+        self.assertTrue(day.posted)
+        self.assertIsNone(day.logo_url)
+        self.assertEqual(day.error, "Failed to add logo from missing.png.")
+
+    def test_server_error_kept_in_manifest(self):
+        UbiTokenManager().nadeo_club_token = "token"
+        NadeoHttpClient().configure(
+            adapter=FakeAdapter(
+                [
+                    (200, {"exception": "Round 1 has no match"}),
+                    (400, {"message": "Invalid name"}),
+                ]
+            )
+        )
+        try:
+            manifest = post_events(
+                [FakeEvent("day_1"), FakeEvent("day_2")], max_workers=1
+            )
+        finally:
+            NadeoHttpClient().configure()
+            UbiTokenManager().nadeo_club_token = None
+
+        self.assertIn("Round 1 has no match", manifest.entries[0].error)
+        self.assertIn("400", manifest.entries[1].error)
+        self.assertIn("Invalid name", manifest.entries[1].error)
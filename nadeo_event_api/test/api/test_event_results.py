@@ -0,0 +1,103 @@
+import unittest
+
+from src.nadeo_event_api.api.event_results import EventResults, PlayerMatchResult
+from src.nadeo_event_api.objects.inbound.match import Match
+from src.nadeo_event_api.objects.inbound.match_results import (
+    MatchResults,
+    RankedParticipant,
+)
+from src.nadeo_event_api.objects.inbound.round import Round
+
+
+def make_round(id: int, position: int, status: str) -> Round:
+    return Round.from_dict(
+        {"id": id, "position": position, "name": f"round_{id}", "status": status}
+    )
+
+
+class FakeEvent:
+    def __init__(self):
+        self.rounds = [make_round(2, 1, "HAS_MATCHES"), make_round(1, 0, "COMPLETED")]
+        self.matches = {
+            1: [
+                Match(10, "m1", "LID-10", 0, True, [], None),
+                Match(11, "m2", "LID-11", 1, True, [], None),
+            ],
+            2: [Match(20, "final", "LID-20", 0, False, [], None)],
+        }
+        self.results = {
+            10: [("a", 1, 30), ("b", 2, 20)],
+            11: [("c", 1, 25), ("d", 2, 10)],
+            # "c" moved from the first to the second page between the two requests.
+            20: [("a", 1, 40), ("c", 2, 35), ("c", 2, 35)],
+        }
+        self.calls = []
+
+    def get_rounds(self, event_id):
+        return self.rounds
+
+    def get_matches(self, round_id, length, offset):
+        self.calls.append(("matches", round_id))
+        return self.matches[round_id][offset : offset + length]
+
+    def get_results(self, match_id, length, offset):
+        self.calls.append(("results", match_id))
+        rows = self.results[match_id][offset : offset + length]
+        return MatchResults(
+            f"LID-{match_id}",
+            0,
+            [RankedParticipant(p, rank, score, None, None) for p, rank, score in rows],
+            [],
+        )
+
+    def event_results(self) -> EventResults:
+        return EventResults(
+            1,
+            max_workers=4,
+            page_size=2,
+            points_for_rank=[3, 1],
+            get_rounds=self.get_rounds,
+            get_matches=self.get_matches,
+            get_results=self.get_results,
+        )
+
+
+class TestEventResults(unittest.TestCase):
+    def test_standings_and_histories(self):
+        event = FakeEvent()
+        results = event.event_results().refresh()
+
+        self.assertEqual(results.participants, ["a", "b", "c", "d"])
+        self.assertEqual(
+            [r.participant for r in results.results[20].results], ["a", "c"]
+        )
+        self.assertEqual(
+            [
+                (s.participant, s.total_points, s.total_score)
+                for s in results.standings()
+            ],
+            [("a", 6, 70), ("c", 4, 60), ("b", 1, 20), ("d", 1, 10)],
+        )
+        self.assertEqual(
+            [s.participant for s in results.round_standings(0)], ["a", "c", "b", "d"]
+        )
+        self.assertEqual(
+            results.history("c"),
+            [
+                PlayerMatchResult(0, 1, 11, 1, 1, 25, None),
+                PlayerMatchResult(1, 2, 20, 0, 2, 35, None),
+            ],
+        )
+
+    def test_refresh_skips_completed(self):
+        event = FakeEvent()
+        results = event.event_results().refresh()
+        event.calls.clear()
+        event.results[20] = [("c", 1, 50), ("a", 2, 45)]
+
+        results.refresh()
+
+        self.assertEqual(
+            sorted(event.calls), [("matches", 2), ("results", 20), ("results", 20)]
+        )
+        self.assertEqual(results.standings()[0].participant, "c")
@@ -0,0 +1,127 @@
+import unittest
+
+from src.nadeo_event_api.api.event_watcher import EventWatcher, WatchEventType
+from src.nadeo_event_api.objects.inbound.match import Match
+from src.nadeo_event_api.objects.inbound.match_info import MatchInfo
+from src.nadeo_event_api.objects.inbound.match_results import (
+    MatchResults,
+    RankedParticipant,
+)
+from src.nadeo_event_api.objects.inbound.round import Round
+
+
+def make_round(status: str, num_matches: int = 2) -> Round:
+    return Round.from_dict(
+        {
+            "id": 1,
+            "position": 0,
+            "name": "round",
+            "startDate": 0,
+            "endDate": 1,
+            "status": status,
+            "nbMatches": num_matches,
+        }
+    )
+
+
+class FakeEvent:
+    def __init__(self):
+        self.round = make_round("HAS_MATCHES")
+        self.matches = {
+            10: Match(10, "m1", "LID-1", 0, False, [], None),
+            11: Match(11, "m2", "LID-2", 1, False, [], None),
+        }
+        self.statuses = {"LID-1": "PENDING", "LID-2": "PENDING"}
+        self.scores = {10: 0, 11: 0}
+        self.calls = []
+
+    def get_rounds(self, event_id):
+        return [self.round]
+
+    def get_matches(self, round_id, length, offset):
+        return list(self.matches.values())[offset : offset + length]
+
+    def get_results(self, match_id, length, offset):
+        self.calls.append(("results", match_id))
+        return MatchResults(
+            f"LID-{match_id}",
+            0,
+            [RankedParticipant("p1", 1, self.scores[match_id], None, None)],
+            [],
+        )
+
+    def get_info(self, live_id):
+        self.calls.append(("info", live_id))
+        return MatchInfo(
+            None,
+            live_id,
+            None,
+            None,
+            None,
+            self.statuses[live_id],
+            None,
+            None,
+            None,
+            None,
+            None,
+        )
+
+    def watcher(self) -> EventWatcher:
+        return EventWatcher(
+            1,
+            get_rounds=self.get_rounds,
+            get_matches=self.get_matches,
+            get_results=self.get_results,
+            get_info=self.get_info,
+        )
+
+
+class TestEventWatcher(unittest.TestCase):
+    def test_emits_changes_and_skips_completed(self):
+        event = FakeEvent()
+        watcher = event.watcher()
+
+        types = [e.type for e in watcher.poll()]
+        self.assertEqual(types.count(WatchEventType.MATCH_ADDED), 2)
+        self.assertEqual(types.count(WatchEventType.RESULTS_CHANGED), 2)
+
+        event.statuses["LID-1"] = "ONGOING"
+        event.scores[10] = 5
+        events = watcher.poll()
+        self.assertEqual(
+            [(e.type, e.match.id) for e in events],  # type: ignore
+            [(WatchEventType.MATCH_STARTED, 10), (WatchEventType.RESULTS_CHANGED, 10)],
+        )
+        self.assertEqual(watcher.next_interval(), 10)
+
+        event.matches[10] = Match(10, "m1", "LID-1", 0, True, [], None)
+        event.statuses["LID-1"] = "COMPLETED"
+        types = [e.type for e in watcher.poll()]
+        self.assertIn(WatchEventType.MATCH_COMPLETED, types)
+
+        event.calls.clear()
+        watcher.poll()
+        self.assertEqual(event.calls, [("info", "LID-2"), ("results", 11)])
+
+        event.matches[11] = Match(11, "m2", "LID-2", 1, True, [], None)
+        types = [e.type for e in watcher.poll()]
+        self.assertIn(WatchEventType.ROUND_COMPLETED, types)
+        self.assertTrue(watcher.finished)
+
+        event.calls.clear()
+        self.assertEqual(watcher.poll(), [])
+        self.assertEqual(event.calls, [])
+
+    def test_next_interval_uses_latest_poll(self):
+        event = FakeEvent()
+        watcher = event.watcher()
+        event.statuses["LID-1"] = "ONGOING"
+        watcher.poll()
+        self.assertEqual(watcher.next_interval(), 10)
+
+        event.matches[10] = Match(10, "m1", "LID-1", 0, True, [], None)
+        watcher.poll()
+        self.assertEqual(watcher.next_interval(), 60)
+
+        watcher.poll()
+        self.assertEqual(watcher.next_interval(), 60)
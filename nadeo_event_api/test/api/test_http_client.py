@@ -0,0 +1,40 @@
+import unittest
+
+from requests.adapters import HTTPAdapter
+
+from src.nadeo_event_api.api.http_client import NadeoHttpClient
+from .utils_for_test import FakeAdapter
+
+
+class TestNadeoHttpClient(unittest.TestCase):
+    def tearDown(self):
+        NadeoHttpClient().configure()
+
+    def test_client_is_shared(self):
+        self.assertIs(NadeoHttpClient(), NadeoHttpClient())
+        self.assertIs(NadeoHttpClient().session, NadeoHttpClient().session)
+
+    def test_configure_sets_pool_size(self):
+        NadeoHttpClient().configure(pool_connections=2, pool_maxsize=64)
+        adapter = NadeoHttpClient().session.get_adapter(
+            "https://meet.trackmania.nadeo.club"
+        )
+        self.assertIsInstance(adapter, HTTPAdapter)
+        self.assertEqual(adapter._pool_maxsize, 64)  # type: ignore
+        self.assertEqual(adapter._pool_connections, 2)  # type: ignore
+
+    def test_requests_reuse_configured_adapter(self):
+        adapter = FakeAdapter([(200, {"a": 1}), (200, [1, 2])])
+        NadeoHttpClient().configure(adapter=adapter)
+
+        self.assertEqual(
+            NadeoHttpClient().get("https://meet.trackmania.nadeo.club/a").json(),
+            {"a": 1},
+        )
+        self.assertEqual(
+            NadeoHttpClient()
+            .post("https://meet.trackmania.nadeo.club/b", json={})
+            .json(),
+            [1, 2],
+        )
+        self.assertEqual([r.method for r in adapter.sent], ["GET", "POST"])
@@ -0,0 +1,38 @@
+import unittest
+
+from src.nadeo_event_api.api.pagination import paginate
+
+
+class TestPaginate(unittest.TestCase):
+    def setUp(self):
+        self.items = list(range(250))
+        self.calls = []
+
+    def fetch_page(self, length, offset):
+        self.calls.append((length, offset))
+        return self.items[offset : offset + length]
+
+    def test_iterates_all_pages(self):
+        self.assertEqual(list(paginate(self.fetch_page, page_size=100)), self.items)
+        self.assertEqual(self.calls, [(100, 0), (100, 100), (100, 200)])
+
+    def test_exact_multiple_fetches_trailing_empty_page(self):
+        self.items = list(range(200))
+        self.assertEqual(list(paginate(self.fetch_page, page_size=100)), self.items)
+        self.assertEqual(self.calls, [(100, 0), (100, 100), (100, 200)])
+
+    def test_prefetch_yields_same_items(self):
+        self.assertEqual(
+            list(paginate(self.fetch_page, page_size=30, prefetch=True)), self.items
+        )
+        self.assertEqual(self.calls, [(30, offset) for offset in range(0, 250, 30)])
+
+    def test_lazy(self):
+        iterator = paginate(self.fetch_page, page_size=10)
+        self.assertEqual(self.calls, [])
+        next(iterator)
+        self.assertEqual(self.calls, [(10, 0)])
+
+    def test_invalid_page_size(self):
+        with self.assertRaises(ValueError):
+            list(paginate(self.fetch_page, page_size=0))
@@ -0,0 +1,143 @@
+import json
+import math
+import unittest
+
+import requests
+
+from src.nadeo_event_api.api.http_client import NadeoHttpClient
+from src.nadeo_event_api.api.response_cache import MeetCachePolicy, ResponseCache
+from .utils_for_test import FakeAdapter
+
+MEET = "https://meet.trackmania.nadeo.club/api"
+
+
+def make_response(body) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
+class FixedPolicy:
+    def ttl(self, url, body):
+        return 10
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+
+    def tearDown(self):
+        NadeoHttpClient().configure()
+
+    def cache(self, **kwargs) -> ResponseCache:
+        return ResponseCache(policy=FixedPolicy(), clock=lambda: self.now, **kwargs)
+
+    def test_ttl_expiry(self):
+        cache = self.cache()
+        cache.put("a", make_response({"a": 1}))
+        self.assertEqual(cache.get("a").json(), {"a": 1})  # type: ignore
+        self.now = 11
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(
+            (cache.stats.hits, cache.stats.misses, cache.stats.entries), (1, 1, 0)
+        )
+
+    def test_lru_eviction_by_count_and_bytes(self):
+        cache = self.cache(max_entries=2)
+        cache.put("a", make_response(1))
+        cache.put("b", make_response(2))
+        cache.get("a")
+        cache.put("c", make_response(3))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.stats.evictions, 1)
+
+        cache = self.cache(max_bytes=10)
+        cache.put("a", make_response("12345"))
+        cache.put("b", make_response("12345"))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats.bytes, 7)
+
+    def test_meet_policy(self):
+        policy = MeetCachePolicy(live_ttl=5)
+
+        def ttl(url, body=None):
+            def decode():
+                if body is None:
+                    self.fail(f"decoded the body of {url}")
+                return body
+
+            return policy.ttl(url, decode)
+
+        self.assertEqual(
+            ttl(f"{MEET}/matches/LID-MTCH-1", {"status": "COMPLETED"}), math.inf
+        )
+        self.assertEqual(ttl(f"{MEET}/matches/LID-MTCH-1", {"status": "ONGOING"}), 5)
+        self.assertEqual(ttl(f"{MEET}/matches/7/results?length=10&offset=0"), 5)
+        self.assertEqual(
+            ttl(
+                f"{MEET}/rounds/3/matches?length=10&offset=0",
+                {
+                    "matches": [
+                        {"id": 7, "isCompleted": True},
+                        {"id": 8, "isCompleted": False},
+                    ]
+                },
+            ),
+            5,
+        )
+        self.assertEqual(ttl(f"{MEET}/matches/7/results?length=10&offset=0"), math.inf)
+        self.assertEqual(
+            ttl(f"{MEET}/competitions/1/rounds", [{"status": "COMPLETED"}]), math.inf
+        )
+        self.assertEqual(
+            ttl(f"{MEET}/competitions/1/rounds", {"status": "COMPLETED"}), 5
+        )
+        self.assertIsNone(ttl(f"{MEET}/competitions/1/participants?length=1&offset=0"))
+
+    def test_meet_policy_remembers_recent_rounds_only(self):
+        policy = MeetCachePolicy(live_ttl=5, max_rounds=2)
+        for round_id in (1, 2, 3):
+            policy.ttl(
+                f"{MEET}/rounds/{round_id}/matches?length=10&offset=0",
+                lambda: {"matches": [{"id": round_id * 10, "isCompleted": True}]},
+            )
+
+        def results_ttl(match_id):
+            return policy.ttl(f"{MEET}/matches/{match_id}/results", lambda: None)
+
+        self.assertEqual(results_ttl(10), 5)
+        self.assertEqual(results_ttl(20), math.inf)
+        self.assertEqual(results_ttl(30), math.inf)
+
+    def test_put_decodes_only_for_the_policy(self):
+        decoded = []
+
+        def loads(content):
+            decoded.append(content)
+            return json.loads(content)
+
+        cache = ResponseCache(policy=MeetCachePolicy(), loads=loads)
+        cache.put(
+            f"{MEET}/matches/7/results?length=10&offset=0",
+            make_response({"results": []}),
+        )
+        cache.put(f"{MEET}/competitions/1/participants", make_response([]))
+        self.assertEqual(decoded, [])
+        cache.put(f"{MEET}/matches/LID-MTCH-1", make_response({"status": "COMPLETED"}))
+        self.assertEqual(len(decoded), 1)
+        self.assertEqual(cache.stats.entries, 2)
+
+    def test_client_serves_cached_gets(self):
+        adapter = FakeAdapter([(200, {"status": "COMPLETED"})])
+        cache = ResponseCache()
+        NadeoHttpClient().configure(adapter=adapter, cache=cache)
+
+        for _ in range(3):
+            self.assertEqual(
+                NadeoHttpClient().get_json(f"{MEET}/matches/LID-MTCH-1"),
+                {"status": "COMPLETED"},
+            )
+        self.assertEqual(len(adapter.sent), 1)
+        self.assertEqual(cache.stats.hits, 2)
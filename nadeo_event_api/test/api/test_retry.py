@@ -0,0 +1,71 @@
+import time
+import unittest
+
+from src.nadeo_event_api.api.http_client import NadeoApiError, NadeoHttpClient
+from src.nadeo_event_api.api.retry import RetryPolicy, TokenBucket, parse_retry_after
+from .utils_for_test import FakeAdapter
+
+URL = "https://meet.trackmania.nadeo.club/api/matches/1"
+
+
+class TestRetry(unittest.TestCase):
+    def tearDown(self):
+        NadeoHttpClient().configure()
+
+    def test_get_is_retried(self):
+        adapter = FakeAdapter([(503, {}), (429, {}), (200, {"id": 1})])
+        NadeoHttpClient().configure(
+            adapter=adapter, retry_policy=RetryPolicy(backoff_factor=0)
+        )
+
+        self.assertEqual(NadeoHttpClient().get_json(URL), {"id": 1})
+        self.assertEqual(len(adapter.sent), 3)
+
+    def test_post_is_not_retried_unless_opted_in(self):
+        adapter = FakeAdapter([(503, {}), (503, {}), (200, {})])
+        NadeoHttpClient().configure(
+            adapter=adapter, retry_policy=RetryPolicy(backoff_factor=0)
+        )
+
+        self.assertEqual(NadeoHttpClient().post(URL).status_code, 503)
+        self.assertEqual(NadeoHttpClient().post(URL, retry=True).status_code, 200)
+        self.assertEqual(len(adapter.sent), 3)
+
+    def test_error_raised_after_retries(self):
+        adapter = FakeAdapter([(500, {})] * 3)
+        NadeoHttpClient().configure(
+            adapter=adapter, retry_policy=RetryPolicy(max_retries=2, backoff_factor=0)
+        )
+
+        with self.assertRaises(NadeoApiError) as context:
+            NadeoHttpClient().get_json(URL)
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertEqual(len(adapter.sent), 3)
+
+    def test_client_errors_are_not_retried(self):
+        adapter = FakeAdapter([(404, {})])
+        NadeoHttpClient().configure(
+            adapter=adapter, retry_policy=RetryPolicy(backoff_factor=0)
+        )
+
+        with self.assertRaises(NadeoApiError):
+            NadeoHttpClient().get_json(URL)
+        self.assertEqual(len(adapter.sent), 1)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_backoff_is_bounded(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=4)
+        for attempt in range(10):
+            self.assertLessEqual(policy.backoff(attempt), min(4, 2**attempt))
+
+    def test_token_bucket_limits_rate(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
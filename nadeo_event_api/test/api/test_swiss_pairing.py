@@ -0,0 +1,73 @@
+from itertools import combinations
+import random
+import unittest
+
+from src.nadeo_event_api.api.swiss_pairing import SwissPairing
+from src.nadeo_event_api.objects.inbound.match_results import (
+    MatchResults,
+    RankedParticipant,
+)
+
+
+def results(round_position, match_position, players):
+    return MatchResults(
+        f"LID-{round_position}-{match_position}",
+        round_position,
+        [
+            RankedParticipant(p, rank, 100 - rank, None, None)
+            for rank, p in enumerate(players, 1)
+        ],
+        [],
+    )
+
+
+class TestSwissPairing(unittest.TestCase):
+    def test_standings(self):
+        swiss = SwissPairing(match_size=2)
+        swiss.add_results(0, results(0, 0, ["a", "b"]))
+        swiss.add_results(1, results(0, 1, ["c", "d"]))
+        swiss.add_results(1, results(0, 1, ["c", "d"]))
+        swiss.add_results(0, results(1, 0, ["a", "c"]))
+        swiss.add_results(1, results(1, 1, ["b", "d"]))
+
+        self.assertEqual(
+            [
+                (s.participant, s.points, s.buchholz, s.matches)
+                for s in swiss.standings()
+            ],
+            [("a", 2, 2, 2), ("b", 1, 2, 2), ("c", 1, 2, 2), ("d", 0, 2, 2)],
+        )
+        # b and c are tied, and a has met both of them already.
+        self.assertEqual(swiss.pair(), [["a", "d"], ["b", "c"]])
+        self.assertEqual(
+            [
+                [(s._round_position, s._match_position, s._rank) for s in m._spots]
+                for m in swiss.next_round(swiss.pair())
+            ],
+            [[(1, 0, 1), (1, 1, 2)], [(1, 1, 1), (1, 0, 2)]],
+        )
+
+    def test_no_rematches(self):
+        rng = random.Random(4)
+        players = [f"p{i}" for i in range(64)]
+        swiss = SwissPairing(match_size=4, points_for_rank=[3, 2, 1])
+        groups = [players[i::16] for i in range(16)]
+        met = set()
+        for round_position in range(5):
+            for position, group in enumerate(groups):
+                for pair in combinations(sorted(group), 2):
+                    self.assertNotIn(pair, met)
+                    met.add(pair)
+                swiss.add_results(
+                    position, results(round_position, position, rng.sample(group, 4))
+                )
+            groups = swiss.pair()
+            self.assertEqual(sorted(p for g in groups for p in g), sorted(players))
+
+        # The incremental Buchholz matches a recomputation from the meetings.
+        points = {s.participant: s.points for s in swiss.standings()}
+        for standing in swiss.standings():
+            opponents = [b for a, b in met if a == standing.participant] + [
+                a for a, b in met if b == standing.participant
+            ]
+            self.assertEqual(standing.buchholz, sum(points[o] for o in opponents))
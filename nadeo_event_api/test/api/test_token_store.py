@@ -0,0 +1,66 @@
+import os
+import tempfile
+import time
+import unittest
+
+from src.nadeo_event_api.api.authenticate import NadeoToken, UbiTokenManager
+from src.nadeo_event_api.api.enums import NadeoService
+from src.nadeo_event_api.api.http_client import NadeoHttpClient
+from src.nadeo_event_api.api.token_store import FileTokenStore
+from .test_authenticate import make_jwt
+from .utils_for_test import FakeAdapter
+
+
+class TestFileTokenStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "cache", "tokens.json")
+
+    def tearDown(self):
+        UbiTokenManager().token_store = None
+        UbiTokenManager().nadeo_live_token = None
+        NadeoHttpClient().configure()
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        store = FileTokenStore(self.path)
+        self.assertIsNone(store.load(NadeoService.LIVE))
+
+        token = NadeoToken("access", "refresh", 1700000000.0)
+        store.save(NadeoService.LIVE, token)
+        store.save(NadeoService.CLUB, NadeoToken("club_access"))
+
+        self.assertEqual(FileTokenStore(self.path).load(NadeoService.LIVE), token)
+        self.assertEqual(
+            FileTokenStore(self.path).load(NadeoService.CLUB), NadeoToken("club_access")
+        )
+
+    def test_manager_uses_stored_token(self):
+        access_token = make_jwt(time.time() + 3600)
+        FileTokenStore(self.path).save(
+            NadeoService.LIVE, NadeoToken(access_token, "refresh", time.time() + 3600)
+        )
+        adapter = FakeAdapter([])
+        NadeoHttpClient().configure(adapter=adapter)
+        UbiTokenManager().nadeo_live_token = None
+        UbiTokenManager().token_store = FileTokenStore(self.path)
+
+        self.assertEqual(UbiTokenManager().nadeo_live_token, access_token)
+        self.assertEqual(adapter.sent, [])
+
+    def test_manager_persists_refreshed_token(self):
+        refreshed = make_jwt(time.time() + 3600)
+        FileTokenStore(self.path).save(
+            NadeoService.LIVE, NadeoToken("expired", "refresh", time.time() - 10)
+        )
+        adapter = FakeAdapter(
+            [(200, {"accessToken": refreshed, "refreshToken": "refresh_2"})]
+        )
+        NadeoHttpClient().configure(adapter=adapter)
+        UbiTokenManager().nadeo_live_token = None
+        UbiTokenManager().token_store = FileTokenStore(self.path)
+
+        self.assertEqual(UbiTokenManager().nadeo_live_token, refreshed)
+        stored = FileTokenStore(self.path).load(NadeoService.LIVE)
+        self.assertEqual(stored.access_token, refreshed)  # type: ignore
+        self.assertEqual(stored.refresh_token, "refresh_2")  # type: ignore
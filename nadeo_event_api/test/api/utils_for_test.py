@@ -1,5 +1,8 @@
 import json
 
+from requests import Response
+from requests.adapters import BaseAdapter
+
 
 def deep_sort(obj):
     """
@@ -36,3 +39,29 @@ def are_json_structures_equal(json1: dict, json2: dict):
     print(json.dumps(sorted_json2))
 
     return sorted_json1 == sorted_json2
+
+
+class FakeAdapter(BaseAdapter):
+    """
+    Transport adapter returning canned responses instead of hitting the network.
+    Responses are (status_code, body) tuples consumed in order; requests sent are recorded.
+    """
+
+    def __init__(self, responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request)
+        status_code, body = self.responses.pop(0)
+        response = Response()
+        response.status_code = status_code
+        response._content = json.dumps(body).encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
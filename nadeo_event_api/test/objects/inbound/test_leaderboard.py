@@ -0,0 +1,39 @@
+import unittest
+
+from src.nadeo_event_api.objects.inbound.leaderboard import (
+    Leaderboard,
+    LeaderboardEntry,
+)
+
+
+class TestLeaderboard(unittest.TestCase):
+    def setUp(self):
+        self.leaderboard = Leaderboard.from_list(
+            [
+                {"participant": "tm_acc_1", "rank": 1, "score": 30, "zone": "World"},
+                {"participant": "tm_acc_2", "rank": 2, "score": 20, "zone": "World"},
+                {"participant": "tm_acc_3", "rank": 2, "score": 20, "zone": "World"},
+                {"participant": "tm_acc_4", "rank": None, "score": None, "zone": None},
+            ]
+        )
+
+    def test_lookup_by_participant(self):
+        self.assertEqual(self.leaderboard.get_rank("tm_acc_1"), 1)
+        self.assertEqual(self.leaderboard.get_rank("tm_acc_3"), 2)
+        self.assertIsNone(self.leaderboard.get_rank("tm_acc_4"))
+        self.assertIsNone(self.leaderboard.get_rank("tm_acc_5"))
+        self.assertEqual(
+            self.leaderboard.get_entry("tm_acc_2"),
+            LeaderboardEntry("tm_acc_2", 2, 20, "World"),
+        )
+
+    def test_lookup_by_rank(self):
+        self.assertEqual(
+            [e.participant for e in self.leaderboard.at_rank(2)],
+            ["tm_acc_2", "tm_acc_3"],
+        )
+        self.assertEqual(self.leaderboard.at_rank(3), [])
+
+    def test_entries_are_slotted(self):
+        self.assertFalse(hasattr(self.leaderboard.entries[0], "__dict__"))
+        self.assertEqual(len(self.leaderboard), 4)
@@ -1,6 +1,10 @@
 import unittest
 
-from src.nadeo_event_api.objects.inbound.match_results import MatchResults, RankedParticipant, RankedTeam
+from src.nadeo_event_api.objects.inbound.match_results import (
+    MatchResults,
+    RankedParticipant,
+    RankedTeam,
+)
 
 
 class TestMatchResults(unittest.TestCase):
@@ -24,7 +28,7 @@ class TestMatchResults(unittest.TestCase):
             match_live_id="test_match_1",
             round_position=0,
             results=[ranked_participant_1, ranked_participant_2],
-            teams=[]
+            teams=[],
         )
 
         self.assertEqual(solo_match_results.get_rank("tm_acc_1"), 1)
@@ -75,11 +79,56 @@ class TestMatchResults(unittest.TestCase):
         team_match_results = MatchResults(
             match_live_id="test_match_2",
             round_position=0,
-            results=[ranked_participant_3, ranked_participant_4, ranked_participant_5, ranked_participant_6],
-            teams=[ranked_team_blue, ranked_team_red]
+            results=[
+                ranked_participant_3,
+                ranked_participant_4,
+                ranked_participant_5,
+                ranked_participant_6,
+            ],
+            teams=[ranked_team_blue, ranked_team_red],
         )
 
         self.assertEqual(team_match_results.get_rank("tm_acc_3"), 1)
         self.assertEqual(team_match_results.get_rank("tm_acc_4"), 1)
         self.assertEqual(team_match_results.get_rank("tm_acc_5"), 2)
-        self.assertEqual(team_match_results.get_rank("tm_acc_6"), 2)
\ No newline at end of file
+        self.assertEqual(team_match_results.get_rank("tm_acc_6"), 2)
+
+    def test_ranks_for(self):
+        results = MatchResults.from_dict(
+            {
+                "matchLiveId": "test_match_3",
+                "roundPosition": 0,
+                "results": [
+                    {"participant": "tm_acc_1", "rank": 2, "team": "Blue"},
+                    {"participant": "tm_acc_2", "rank": 1, "team": "Red"},
+                    {"participant": "tm_acc_3", "rank": None, "team": None},
+                ],
+                "teams": [
+                    {"position": 0, "team": "Blue", "rank": 1, "score": 5},
+                    {"position": 1, "team": "Red", "rank": 2, "score": 3},
+                ],
+            }
+        )
+
+        self.assertEqual(
+            results.ranks_for(["tm_acc_1", "tm_acc_2", "tm_acc_3", "tm_acc_4"]),
+            {"tm_acc_1": 1, "tm_acc_2": 2, "tm_acc_3": None, "tm_acc_4": None},
+        )
+        self.assertEqual(results.get_rank("tm_acc_2"), 2)
+
+    def test_rank_index_follows_new_results(self):
+        results = MatchResults.from_dict(
+            {
+                "matchLiveId": "test_match_4",
+                "roundPosition": 0,
+                "results": [{"participant": "tm_acc_1", "rank": 1}],
+                "teams": [],
+            }
+        )
+        self.assertIsNone(results.get_rank("tm_acc_2"))
+
+        results.results.append(RankedParticipant("tm_acc_2", 2, 0, None, None))
+        self.assertEqual(results.get_rank("tm_acc_2"), 2)
+
+        results.results = [RankedParticipant("tm_acc_1", 3, 0, None, None)]
+        self.assertEqual(results.get_rank("tm_acc_1"), 3)
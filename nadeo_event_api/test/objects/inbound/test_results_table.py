@@ -0,0 +1,79 @@
+import unittest
+
+from src.nadeo_event_api.objects.inbound.match_results import MatchResults
+from src.nadeo_event_api.objects.inbound.results_table import (
+    PlayerStanding,
+    ResultsTable,
+)
+
+
+def results_page(round_position, rows):
+    return {
+        "matchLiveId": "LID-MTCH-1",
+        "roundPosition": round_position,
+        "results": [
+            {
+                "participant": participant,
+                "rank": rank,
+                "score": score,
+                "zone": "World",
+                "team": None,
+            }
+            for participant, rank, score in rows
+        ],
+        "teams": [],
+    }
+
+
+class TestResultsTable(unittest.TestCase):
+    def setUp(self):
+        self.table = ResultsTable()
+        self.table.extend_from_response(
+            1, results_page(0, [("a", 1, 30), ("b", 2, 20), ("c", 3, 10)])
+        )
+        self.table.extend_from_response(
+            2, results_page(0, [("d", 1, 25), ("e", None, None)])
+        )
+        self.table.extend_from_response(
+            3, results_page(1, [("b", 1, 40), ("d", 2, 35)])
+        )
+
+    def test_columns(self):
+        self.assertEqual(len(self.table), 7)
+        self.assertEqual(self.table.participants, ["a", "b", "c", "d", "e"])
+        self.assertEqual(list(self.table.participant_codes), [0, 1, 2, 3, 4, 1, 3])
+        self.assertEqual(list(self.table.ranks), [1, 2, 3, 1, 0, 1, 2])
+        self.assertEqual(list(self.table.round_positions), [0, 0, 0, 0, 0, 1, 1])
+
+    def test_append_after_to_numpy(self):
+        try:
+            columns = self.table.to_numpy()
+        except ImportError:
+            self.skipTest("NumPy isn't installed")
+        self.table.append(4, 1, "f", 3, 5)
+        self.assertEqual(len(self.table), 8)
+        self.assertEqual(self.table.participants[-1], "f")
+        self.assertEqual(len(columns["ranks"]), 7)
+
+    def test_standings(self):
+        standings = self.table.standings(points_for_rank=[10, 5])
+        self.assertEqual([s.participant for s in standings], ["b", "d", "a", "c", "e"])
+        self.assertEqual(standings[0], PlayerStanding("b", 2, 15, 60, 1, 1.5))
+        self.assertEqual(standings[-1], PlayerStanding("e", 1, 0, 0, None, None))
+
+    def test_select_rounds(self):
+        standings = self.table.select_rounds([1]).standings()
+        self.assertEqual(
+            [(s.participant, s.total_score) for s in standings], [("b", 40), ("d", 35)]
+        )
+
+    def test_extend_from_results_matches_response(self):
+        table = ResultsTable()
+        table.extend_from_results(
+            1,
+            MatchResults.from_dict(
+                results_page(0, [("a", 1, 30), ("b", 2, 20), ("c", 3, 10)])
+            ),
+        )
+        self.assertEqual(list(table.scores), list(self.table.scores[:3]))
+        self.assertEqual(list(table.match_ids), [1, 1, 1])
@@ -0,0 +1,58 @@
+import unittest
+
+from src.nadeo_event_api.objects.inbound.event_players import Team, TeamPlayer
+from src.nadeo_event_api.objects.inbound.match_results import (
+    MatchResults,
+    RankedParticipant,
+)
+from src.nadeo_event_api.objects.inbound.round import Round
+from src.nadeo_event_api.objects.inbound.schema import camel_case
+
+
+class TestSchema(unittest.TestCase):
+    def test_camel_case(self):
+        self.assertEqual(camel_case("club_match_live_id"), "clubMatchLiveId")
+        self.assertEqual(camel_case("id"), "id")
+
+    def test_decode_with_overridden_names(self):
+        round = Round.from_dict(
+            {
+                "id": 53031,
+                "position": 0,
+                "name": "Better Match",
+                "startDate": 1725506356,
+                "endDate": 1725509956,
+                "status": "HAS_MATCHES",
+                "leaderboardComputeType": "BRACKET",
+                "teamLeaderboardComputeType": "TEAM_SCORE",
+                "nbMatches": 3,
+            }
+        )
+        self.assertEqual(round.start_date, 1725506356)
+        self.assertEqual(round.team_leadaerboard_compute_type, "TEAM_SCORE")
+        self.assertEqual(round.num_matches, 3)
+        self.assertIsNone(round.lock_date)
+        self.assertFalse(hasattr(round, "__dict__"))
+
+    def test_decode_nested_lists(self):
+        results = MatchResults.from_dict(
+            {
+                "matchLiveId": "LID-MTCH-1",
+                "roundPosition": 0,
+                "results": [{"participant": "tm_acc_1", "rank": 1, "score": 3}],
+                "teams": None,
+            }
+        )
+        self.assertEqual(
+            results.results, [RankedParticipant("tm_acc_1", 1, 3, None, None)]
+        )
+        self.assertEqual(results.teams, [])
+
+        team = Team.from_dict(
+            {"Id": "1", "Name": "Red", "Players": [{"AccountId": "tm_acc_1"}]}
+        )
+        self.assertEqual(team.players, [TeamPlayer("tm_acc_1")])
+
+    def test_required_fields(self):
+        with self.assertRaisesRegex(ValueError, "missing 'Name'"):
+            Team.from_dict({"Id": "1"})
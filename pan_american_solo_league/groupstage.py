@@ -3,7 +3,7 @@ from datetime import UTC, datetime, timedelta
 import os
 from pathlib import Path
 import sys
-from typing import Dict, List
+from typing import List
 
 # NOTE we do this for now since the api package is still WIP, will separate this into a different
 # repo which consumes that package eventually
@@ -19,7 +19,7 @@ from nadeo_event_api.api.structure.enums import (
     ScriptType,
 )
 from nadeo_event_api.api.structure.maps import Map
-from nadeo_event_api.api.structure.round.match_spot import SeedMatchSpot
+from nadeo_event_api.api.structure.round.generators import round_robin
 from nadeo_event_api.api.structure.round.round import Round, RoundConfig
 from nadeo_event_api.api.structure.settings.script_settings import (
     CupSpecialScriptSettings,
@@ -28,62 +28,17 @@ from nadeo_event_api.api.structure.settings.plugin_settings import ClassicPlugin
 from nadeo_event_api.api.structure.round.match import Match
 
 
-def get_player_combinations(players: List[str]) -> List[List[Dict[int, str]]]:
-    """
-    Gets a list of player combinations as 5 matches where each player
-    plays in exactly one match with every other player once. Returned as
-    [rounds x matches] array of dicts mapping Seed (1-indexed) to player UUIDs.
-    """
-
-    players.insert(0, "spacer")
-    return [
-        [
-            {1: players[1], 8: players[8], 9: players[9], 16: players[16]},
-            {2: players[2], 7: players[7], 10: players[10], 15: players[15]},
-            {3: players[3], 6: players[6], 11: players[11], 14: players[14]},
-            {4: players[4], 5: players[5], 12: players[12], 13: players[13]},
-        ],
-        [
-            {1: players[1], 2: players[2], 6: players[6], 12: players[12]},
-            {8: players[8], 13: players[13], 14: players[14], 15: players[15]},
-            {3: players[3], 4: players[4], 7: players[7], 9: players[9]},
-            {5: players[5], 10: players[10], 11: players[11], 16: players[16]},
-        ],
-        [
-            {1: players[1], 3: players[3], 5: players[5], 15: players[15]},
-            {6: players[6], 9: players[9], 10: players[10], 13: players[13]},
-            {7: players[7], 12: players[12], 14: players[14], 16: players[16]},
-            {2: players[2], 4: players[4], 8: players[8], 11: players[11]},
-        ],
-        [
-            {1: players[1], 4: players[4], 10: players[10], 14: players[14]},
-            {5: players[5], 6: players[6], 7: players[7], 8: players[8]},
-            {9: players[9], 11: players[11], 12: players[12], 15: players[15]},
-            {2: players[2], 3: players[3], 13: players[13], 16: players[16]},
-        ],
-        [
-            {1: players[1], 7: players[7], 11: players[11], 13: players[13]},
-            {3: players[3], 8: players[8], 10: players[10], 12: players[12]},
-            {2: players[2], 5: players[5], 9: players[9], 14: players[14]},
-            {4: players[4], 6: players[6], 15: players[15], 16: players[16]},
-        ],
-    ]
-
-
 def get_round(
     start_date: datetime,
     round_name: str,
-    matches: List[Dict[int, str]],
+    matches: List[Match],
     map_pool: List[Map],
 ) -> Round:
     return Round(
         name=round_name,
         start_date=start_date,
         end_date=start_date + timedelta(hours=1),
-        matches=[
-            Match(spots=[SeedMatchSpot(seed) for seed in match.keys()])
-            for match in matches
-        ],
+        matches=matches,
         config=RoundConfig(
             map_pool=map_pool,
             script=ScriptType.CUP_LONG,
@@ -151,8 +106,8 @@ step_5_start = step_4_start + timedelta(hours=2)  # 2:00pm
 campaign_playlist = Campaign(club_id, campaign_id)._playlist
 map_pool = [Map(campaign_map._uuid) for campaign_map in campaign_playlist]
 
-# Get the rounds (5) and matches (4) of players (16 / 4)
-rounds_and_matches = get_player_combinations(players)
+# Get the rounds (5) and matches (4) of players (16 / 4), each player meeting every other once
+rounds_and_matches = round_robin(len(players), match_size=4)
 
 round_1 = get_round(step_1_start, "Step 1", rounds_and_matches[0], map_pool)
 round_2 = get_round(step_2_start, "Step 2", rounds_and_matches[1], map_pool)
@@ -169,5 +124,8 @@ event = Event(
 event.post()
 
 # Add the players to the event
-for player_idx in range(len(players)):
-    event.add_participant(players[player_idx], player_idx + 1)
+report = event.add_participants(
+    [(players[player_idx], player_idx + 1) for player_idx in range(len(players))]
+)
+for result in report.failed:
+    print(f"Failed to add player {result.item[0]}: {result.error}")
@@ -165,5 +165,8 @@ event = Event(
 event.post()
 
 # Add the players to the event
-for player_idx in range(len(players)):
-    event.add_participant(players[player_idx], player_idx + 1)
+report = event.add_participants(
+    [(players[player_idx], player_idx + 1) for player_idx in range(len(players))]
+)
+for result in report.failed:
+    print(f"Failed to add player {result.item[0]}: {result.error}")
@@ -41,10 +41,10 @@ sys.path.append(str(event_api_pkg))
 # )
 
 # token = login("User", "Pass")
-# url = post_tmwt_2v2(paste, "test_paste", token) 
+# url = post_tmwt_2v2(paste, "test_paste", token)
 # print(url)
 
 # from nadeo_event_api.api.event_api import get_event_teams, get_event_participants
 
 # print(get_event_teams(24706))
-# print(get_event_participants(24706, 4, 0))
\ No newline at end of file
+# print(get_event_participants(24706, 4, 0))
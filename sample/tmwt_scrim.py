@@ -23,8 +23,16 @@ from nadeo_event_api.api.structure.round.match import Match
 from nadeo_event_api.api.structure.round.match_spot import TeamMatchSpot
 from nadeo_event_api.api.structure.round.round import Round, RoundConfig
 from nadeo_event_api.api.structure.settings.plugin_settings import TMWTPluginSettings
-from nadeo_event_api.api.structure.settings.script_settings import TMWT2025ScriptSettings, TMWC2023ScriptSettings, BaseTMWTScriptSettings, BaseScriptSettings
-from nadeo_event_api.objects.outbound.pastebin.tmwt_2v2 import Tmwt2v2Paste, Tmwt2v2PasteTeam
+from nadeo_event_api.api.structure.settings.script_settings import (
+    TMWT2025ScriptSettings,
+    TMWC2023ScriptSettings,
+    BaseTMWTScriptSettings,
+    BaseScriptSettings,
+)
+from nadeo_event_api.objects.outbound.pastebin.tmwt_2v2 import (
+    Tmwt2v2Paste,
+    Tmwt2v2PasteTeam,
+)
 from nadeo_event_api.api.pastefy.pastefy_api import post_tmwt_2v2
 from nadeo_event_api.objects.outbound.settings.pick_ban_style import PickBanStyle
 
@@ -98,7 +106,7 @@ event = Event(
                         ),
                         match_points_limit=2,
                         match_info="2025 THE YEAR",
-                        teams_url=teams_url, #"https://pastebin.com/raw/hSLVPj1c",
+                        teams_url=teams_url,  # "https://pastebin.com/raw/hSLVPj1c",
                     ),
                     map_points_limit=5,
                     loading_screen_image_url="https://download.dashmap.live/6e3bf3f9-7dcb-47d4-bdae-037ab66628f2/AM_Stream_BG_Nologo.png",